@@ -5,8 +5,10 @@ Contains the Agent class that models individual actors using the full
 """
 
 import logging
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from .llm_interface import LlamaInterface
@@ -23,6 +25,36 @@ from .layers.layer7_market_structure import MarketStructureModule
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _build_prompt_parts_cached(
+    prompt_prefix: str,
+    identity_items: tuple[tuple[str, Any], ...] | None,
+    layer_items: tuple[tuple[str, Any], ...],
+    market_topic: str,
+) -> tuple[str, str]:
+    """Build the memory-independent decision prompt parts from hashable inputs.
+    
+    The recent context changes with every observation, so it is left out of
+    the key and spliced between the cached head and tail by the caller.
+    
+    Args:
+        prompt_prefix: The agent's precomputed topic and character profile.
+        identity_items: Prompt identity state as items, or None.
+        layer_items: Layer outputs restricted to ``PromptBuilder.LAYER_OUTPUT_KEYS``.
+        market_topic: The market topic being discussed.
+        
+    Returns:
+        Tuple of (head, tail) surrounding the recent context.
+    """
+    agent_state = {"identity_state": dict(identity_items) if identity_items else None}
+    
+    builder = PromptBuilder(agent_state=agent_state, layer_outputs=dict(layer_items))
+    return builder.build_decision_prompt_parts(
+        market_topic=market_topic,
+        prompt_prefix=prompt_prefix,
+    )
+
+
 @dataclass
 class MarketInfo:
     """Container for market state information."""
@@ -35,11 +67,19 @@ class MarketInfo:
 
 @dataclass
 class SocialMediaInfo:
-    """Container for social media environment information."""
+    """Container for social media environment information.
+    
+    Topic and tweet sequences are stored as tuples, so callers can share
+    one constant sequence across many observations.
+    """
     timestamp: datetime
-    trending_topics: list[str]
-    sample_tweets: list[str]
+    trending_topics: Sequence[str]
+    sample_tweets: Sequence[str]
     sentiment_score: float
+    
+    def __post_init__(self) -> None:
+        self.trending_topics = tuple(self.trending_topics)
+        self.sample_tweets = tuple(self.sample_tweets)
 
 
 @dataclass
@@ -123,8 +163,8 @@ class Agent:
             market_topic: The market topic this agent will discuss.
         """
         self.agent_id = agent_id
-        self.persona = persona
-        self.market_topic = market_topic
+        self._persona = persona
+        self._market_topic = market_topic
         self.memory: list[MemoryEntry] = []
         self._current_timestamp: datetime = datetime.now()
         
@@ -143,16 +183,52 @@ class Agent:
         self._last_layer_outputs: dict[str, Any] = {}
         
         self.state.identity = self._identity_module.assign_identity(persona)
+        self._refresh_prompt_prefix()
+    
+    @property
+    def persona(self) -> dict[str, Any]:
+        """Personality profile; assigning a new one rebuilds the prompt prefix.
+        
+        Mutating the dict in place is not tracked.
+        """
+        return self._persona
+    
+    @persona.setter
+    def persona(self, persona: dict[str, Any]) -> None:
+        self._persona = persona
+        self._refresh_prompt_prefix()
+    
+    @property
+    def market_topic(self) -> str:
+        """Market topic under discussion; assigning rebuilds the prompt prefix."""
+        return self._market_topic
+    
+    @market_topic.setter
+    def market_topic(self, market_topic: str) -> None:
+        self._market_topic = market_topic
+        self._refresh_prompt_prefix()
+    
+    def _refresh_prompt_prefix(self) -> None:
+        """Precompute the persona-derived opening of every decision prompt."""
+        builder = PromptBuilder(agent_state=self._get_agent_state_for_prompt())
+        self._prompt_prefix = builder.build_prompt_prefix(self.market_topic)
     
     def _register_layers(self) -> None:
-        """Register all 7 layers with the behavior engine in order."""
-        self.behavior_engine.register_layer(self._neuro_module)
-        self.behavior_engine.register_layer(self._cognition_module)
-        self.behavior_engine.register_layer(self._emotion_module)
-        self.behavior_engine.register_layer(self._social_module)
-        self.behavior_engine.register_layer(self._identity_module)
-        self.behavior_engine.register_layer(self._network_module)
-        self.behavior_engine.register_layer(self._market_module)
+        """Register all 7 layers with the behavior engine in order.
+        
+        Every layer reads only the agent/market/social inputs, never another
+        layer's outputs, so all are registered without dependencies.
+        """
+        for layer in (
+            self._neuro_module,
+            self._cognition_module,
+            self._emotion_module,
+            self._social_module,
+            self._identity_module,
+            self._network_module,
+            self._market_module,
+        ):
+            self.behavior_engine.register_layer(layer, depends_on=())
     
     @property
     def name(self) -> str:
@@ -226,6 +302,21 @@ class Agent:
         if auto_update_layers:
             self.update_layer_states(market_info, social_media_info)
 
+    def observe_batch(
+        self,
+        ticks: Iterable[tuple[MarketInfo | None, SocialMediaInfo | None]],
+    ) -> None:
+        """Observe a sequence of ticks in order.
+        
+        Equivalent to calling ``observe`` once per ``(market_info,
+        social_media_info)`` pair, with layer updates after each tick.
+        
+        Args:
+            ticks: Market and social observations, oldest first.
+        """
+        for market_info, social_media_info in ticks:
+            self.observe(market_info, social_media_info)
+
     def update_layer_states(
         self,
         market_info: MarketInfo | None,
@@ -375,23 +466,35 @@ class Agent:
     def _build_decision_prompt(self) -> str:
         """Build the prompt with layer-informed context using PromptBuilder.
         
+        The sections around the recent context are memoized on the layer and
+        identity state, so only the memory block is formatted per call.
+        
         Returns:
             Formatted prompt string including psychological state.
         """
         recent_memories = self._get_recent_memories(5)
         memory_context = self._format_memories(recent_memories)
         
-        agent_state = self._get_agent_state_for_prompt()
-        
-        builder = PromptBuilder(
-            agent_state=agent_state,
-            layer_outputs=self._last_layer_outputs,
+        identity_items = None
+        if self.state.identity:
+            identity_items = (
+                ("primary_group", self.state.identity.primary_group.name),
+                ("group_identification", self.state.identity.group_identification),
+            )
+        
+        layer_items = tuple(
+            (key, self._last_layer_outputs[key])
+            for key in PromptBuilder.LAYER_OUTPUT_KEYS
+            if key in self._last_layer_outputs
         )
         
-        return builder.build_decision_prompt(
-            market_topic=self.market_topic,
-            recent_context=memory_context,
+        head, tail = _build_prompt_parts_cached(
+            self._prompt_prefix,
+            identity_items,
+            layer_items,
+            self.market_topic,
         )
+        return head + memory_context + tail
     
     def _get_agent_state_for_prompt(self) -> dict[str, Any]:
         """Get agent state formatted for PromptBuilder.
@@ -545,6 +648,23 @@ class Agent:
         
         self.state = AgentState()
         self.state.identity = self._identity_module.assign_identity(self.persona)
+        self._refresh_prompt_prefix()
+    
+    def reset_state(self) -> None:
+        """Reset the agent to its freshly constructed state.
+        
+        Unlike ``reset_layers``, this resets every registered layer and also
+        clears memory, the last layer outputs and the observed timestamp, so
+        one agent can be reused across independent scenarios.
+        """
+        self.behavior_engine.reset()
+        self.memory.clear()
+        self._last_layer_outputs = {}
+        self._current_timestamp = datetime.now()
+        
+        self.state = AgentState()
+        self.state.identity = self._identity_module.assign_identity(self.persona)
+        self._refresh_prompt_prefix()
     
     def __repr__(self) -> str:
         """String representation of the agent."""
@@ -4,6 +4,8 @@ Coordinates the execution of all 7 layers for agent behavior modeling.
 """
 
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Protocol
 
 logger = logging.getLogger(__name__)
@@ -30,27 +32,69 @@ class LayerModule(Protocol):
 class LayerPipeline:
     """Manages the ordered execution of layer modules.
     
-    Executes layers in sequence, passing state through each layer.
+    Executes layers in sequence, passing state through each layer. Layers
+    registered with explicit dependencies are grouped into waves that all
+    read the same state; with ``max_workers > 1`` a wave runs on a thread
+    pool. Outputs are always merged in registration order.
     
     Attributes:
         layers: List of registered layer modules.
+        max_workers: Thread count for multi-layer waves (1 = sequential).
     """
 
-    def __init__(self) -> None:
-        """Initialize the LayerPipeline."""
+    def __init__(self, max_workers: int = 1) -> None:
+        """Initialize the LayerPipeline.
+        
+        Args:
+            max_workers: Thread count for multi-layer waves (1 = sequential).
+        """
         self.layers: list[LayerModule] = []
+        self.max_workers = max_workers
+        self._dependencies: list[frozenset[str] | None] = []
+        self._waves: list[list[LayerModule]] | None = None
 
-    def add_layer(self, layer: LayerModule) -> None:
+    def add_layer(self, layer: LayerModule, depends_on: Iterable[str] | None = None) -> None:
         """Add a layer to the pipeline.
         
         Args:
             layer: Layer module to add.
+            depends_on: Names of earlier layers whose outputs this layer reads.
+                None (default) means it may read any earlier output.
         """
         self.layers.append(layer)
+        self._dependencies.append(None if depends_on is None else frozenset(depends_on))
+        self._waves = None
         logger.debug(f"Added layer: {layer.name}")
 
+    def compile(self) -> list[list[LayerModule]]:
+        """Group layers into waves that can process the same state.
+        
+        Waves are contiguous runs in registration order. A layer starts a new
+        wave when it has no declared dependencies or depends on a layer in the
+        current wave, so merged results match sequential execution.
+        
+        Returns:
+            List of waves, each a list of layers.
+        """
+        waves: list[list[LayerModule]] = []
+        wave: list[LayerModule] = []
+        wave_names: set[str] = set()
+
+        for layer, depends_on in zip(self.layers, self._dependencies):
+            if wave and (depends_on is None or depends_on & wave_names):
+                waves.append(wave)
+                wave, wave_names = [], set()
+            wave.append(layer)
+            wave_names.add(layer.name)
+
+        if wave:
+            waves.append(wave)
+
+        self._waves = waves
+        return waves
+
     def execute(self, initial_state: dict[str, Any]) -> dict[str, Any]:
-        """Execute all layers in sequence.
+        """Execute all layers wave by wave.
         
         Args:
             initial_state: Starting state dictionary.
@@ -59,18 +103,40 @@ class LayerPipeline:
             Final state after all layers have processed.
         """
         current_state = initial_state.copy()
-
-        for layer in self.layers:
-            try:
-                layer_output = layer.process(current_state)
+        waves = self._waves if self._waves is not None else self.compile()
+
+        for wave in waves:
+            if len(wave) > 1 and self.max_workers > 1:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(wave))) as executor:
+                    outputs = list(
+                        executor.map(lambda layer: self._run_layer(layer, current_state), wave)
+                    )
+            else:
+                outputs = [self._run_layer(layer, current_state) for layer in wave]
+
+            for layer_output in outputs:
                 current_state.update(layer_output)
-                logger.debug(f"Layer {layer.name} processed")
-            except Exception as e:
-                logger.error(f"Layer {layer.name} failed: {e}")
-                raise
 
         return current_state
 
+    def _run_layer(self, layer: LayerModule, state: dict[str, Any]) -> dict[str, Any]:
+        """Run a single layer, logging failures.
+        
+        Args:
+            layer: Layer module to run.
+            state: State visible to the layer.
+            
+        Returns:
+            The layer's output dictionary.
+        """
+        try:
+            layer_output = layer.process(state)
+            logger.debug(f"Layer {layer.name} processed")
+            return layer_output
+        except Exception as e:
+            logger.error(f"Layer {layer.name} failed: {e}")
+            raise
+
 
 class BehaviorEngine:
     """Orchestrates the 7-layer model for agent behavior.
@@ -82,18 +148,24 @@ class BehaviorEngine:
         pipeline: LayerPipeline for executing layers.
     """
 
-    def __init__(self) -> None:
-        """Initialize the BehaviorEngine."""
-        self.pipeline = LayerPipeline()
+    def __init__(self, max_workers: int = 1) -> None:
+        """Initialize the BehaviorEngine.
+        
+        Args:
+            max_workers: Thread count for independent layer waves (1 = sequential).
+        """
+        self.pipeline = LayerPipeline(max_workers=max_workers)
         self._layer_map: dict[str, LayerModule] = {}
 
-    def register_layer(self, layer: LayerModule) -> None:
+    def register_layer(self, layer: LayerModule, depends_on: Iterable[str] | None = None) -> None:
         """Register a layer module with the engine.
         
         Args:
             layer: Layer module to register.
+            depends_on: Names of earlier layers whose outputs this layer reads.
+                None (default) means it may read any earlier output.
         """
-        self.pipeline.add_layer(layer)
+        self.pipeline.add_layer(layer, depends_on=depends_on)
         self._layer_map[layer.name] = layer
 
     def process(
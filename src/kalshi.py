@@ -7,6 +7,7 @@ to identify trending topics for the simulation.
 import logging
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Any, Final
 
 from .interfaces import MarketDataProviderABC
@@ -24,8 +25,17 @@ KALSHI_EXCHANGE_STATUS_URL: Final[str] = (
 class KalshiClient(MarketDataProviderABC):
     """Client for interacting with Kalshi public API."""
     
+    POOL_CONNECTIONS: int = 10
+    POOL_MAXSIZE: int = 20
+    
     def __init__(self):
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self._market_cache: dict[str, tuple[list[dict[str, Any]], float]] = {}
         self._cache_expiry_seconds: int = 30
 
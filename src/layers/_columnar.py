@@ -0,0 +1,82 @@
+"""Columnar storage shared by the per-agent layer state arrays.
+
+Layers subclass ``_DataclassArray`` with their row dataclass to get float32
+population storage whose column properties follow the dataclass fields.
+"""
+
+from dataclasses import astuple, fields
+from typing import Any, ClassVar, Generic, TypeVar, get_args, get_origin
+
+import numpy as np
+
+RowT = TypeVar("RowT")
+
+
+def _column(index: int) -> property:
+    """Build a property exposing one column of ``_data`` as a view."""
+
+    def getter(self: Any) -> np.ndarray:
+        return self._data[:, index]
+
+    def setter(self: Any, values: np.ndarray | float) -> None:
+        self._data[:, index] = values
+
+    return property(getter, setter)
+
+
+class _DataclassArray(Generic[RowT]):
+    """Columnar storage for a population of float-field dataclass rows.
+
+    Subclass as ``FooArray(_DataclassArray[Foo])``: one float32 row per agent
+    with columns in ``Foo`` field order, and one column property per field,
+    so population-wide updates run as NumPy column operations. Rows start at
+    the dataclass defaults; values are stored at float32 precision.
+    """
+
+    ROW_TYPE: ClassVar[type]
+    FIELDS: ClassVar[tuple[str, ...]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for base in getattr(cls, "__orig_bases__", ()):
+            if get_origin(base) is _DataclassArray:
+                (cls.ROW_TYPE,) = get_args(base)
+                break
+        else:
+            return
+
+        cls.FIELDS = tuple(f.name for f in fields(cls.ROW_TYPE))
+        for index, name in enumerate(cls.FIELDS):
+            setattr(cls, name, _column(index))
+
+    def __init__(self, n_agents: int) -> None:
+        """Initialize storage for ``n_agents`` default rows.
+
+        Args:
+            n_agents: Number of agents (rows).
+        """
+        defaults = np.array(astuple(self.ROW_TYPE()), dtype=np.float32)
+        self._data = np.tile(defaults, (n_agents, 1))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def row(self, index: int) -> RowT:
+        """Get one agent's row as the row dataclass.
+
+        Args:
+            index: Agent row index.
+
+        Returns:
+            Row dataclass copy of the stored values.
+        """
+        return self.ROW_TYPE(*(float(v) for v in self._data[index]))
+
+    def set_row(self, index: int, value: RowT) -> None:
+        """Store one agent's row.
+
+        Args:
+            index: Agent row index.
+            value: Row dataclass to store.
+        """
+        self._data[index] = astuple(value)
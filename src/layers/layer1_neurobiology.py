@@ -4,13 +4,39 @@ Models neurobiological responses including FOMO, dopamine, and stress.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+from ._columnar import _DataclassArray
+
 logger = logging.getLogger(__name__)
 
+# Per-trend deltas; trends not listed contribute nothing.
+_TREND_FOMO_BOOST: dict[str, float] = {"surging": 0.3, "rising": 0.15}
+_TREND_STRESS_BOOST: dict[str, float] = {"crashing": 0.4, "falling": 0.2}
+
+
+def _calculate_fomo(price_change_pct: float, trend: str, social_buzz: float) -> float:
+    """Stateless FOMO score from momentum, trend, and buzz.
+
+    Scalar kernel behind ``NeurobiologyModule.calculate_fomo``.
+
+    Returns:
+        FOMO level (0.0-1.0).
+    """
+    fomo = 0.0
+
+    if price_change_pct > 0:
+        fomo += min(price_change_pct / 50, 0.5)
+
+    fomo += _TREND_FOMO_BOOST.get(trend, 0.0)
+
+    fomo += social_buzz * 0.2
+
+    return max(0.0, min(1.0, fomo))
+
 
-@dataclass
+@dataclass(slots=True)
 class NeurobiologicalState:
     """State of neurobiological processes.
     
@@ -28,6 +54,62 @@ class NeurobiologicalState:
     habituation: float = 0.0
 
 
+@dataclass(slots=True)
+class NeuroStimulus:
+    """Typed inputs for NeurobiologyModule.process.
+
+    Callers that already hold typed state can build this directly instead of
+    nesting dicts; ``from_dict`` maps the combined pipeline state.
+
+    Attributes:
+        neuro: Agent's current neurobiological state.
+        unrealized_pnl_pct: Unrealized portfolio P&L percentage.
+        price_change_pct: Market price change percentage.
+        trend: Market trend label.
+        volatility: Market volatility.
+        social_sentiment: Social buzz/sentiment level.
+    """
+    neuro: NeurobiologicalState = field(default_factory=NeurobiologicalState)
+    unrealized_pnl_pct: float = 0.0
+    price_change_pct: float = 0.0
+    trend: str = "stable"
+    volatility: float = 0.0
+    social_sentiment: float = 0.0
+
+    @classmethod
+    def from_dict(cls, state: dict[str, Any]) -> "NeuroStimulus":
+        """Build from the combined ``agent``/``market``/``social`` state dict.
+
+        Args:
+            state: Combined pipeline state.
+
+        Returns:
+            NeuroStimulus with defaults for missing keys.
+        """
+        agent = state.get("agent", {})
+        market = state.get("market", {})
+        neuro_state = agent.get("neuro_state", {})
+
+        return cls(
+            neuro=NeurobiologicalState(
+                fomo_level=neuro_state.get("fomo_level", 0.0),
+                dopamine_response=neuro_state.get("dopamine_response", 0.5),
+                stress_level=neuro_state.get("stress_level", 0.0),
+                reward_sensitivity=neuro_state.get("reward_sensitivity", 0.5),
+                habituation=neuro_state.get("habituation", 0.0),
+            ),
+            unrealized_pnl_pct=agent.get("portfolio", {}).get("unrealized_pnl_pct", 0.0),
+            price_change_pct=market.get("price_change_pct", 0.0),
+            trend=market.get("trend", "stable"),
+            volatility=market.get("volatility", 0.0),
+            social_sentiment=state.get("social", {}).get("sentiment", 0.0),
+        )
+
+
+class NeuroStateArray(_DataclassArray[NeurobiologicalState]):
+    """Columnar NeurobiologicalState storage for a population of agents."""
+
+
 class NeurobiologyModule:
     """Models neurobiological responses to market stimuli.
     
@@ -43,47 +125,39 @@ class NeurobiologyModule:
     def __init__(self) -> None:
         """Initialize the NeurobiologyModule."""
         self.name = "neurobiology"
-        self._current_state = NeurobiologicalState()
+        self.reset()
 
-    def process(self, state: dict[str, Any]) -> dict[str, Any]:
+    def process(self, state: dict[str, Any] | NeuroStimulus) -> dict[str, Any]:
         """Process neurobiological response to stimuli.
         
         Args:
-            state: Combined state including agent and market data.
+            state: Combined state including agent and market data, or a
+                prebuilt NeuroStimulus.
             
         Returns:
             Dictionary with neurobiology outputs.
         """
-        agent = state.get("agent", {})
-        market = state.get("market", {})
-        social = state.get("social", {})
-
-        neuro_state = agent.get("neuro_state", {})
-        current_fomo = neuro_state.get("fomo_level", 0.0)
-        current_stress = neuro_state.get("stress_level", 0.0)
-        current_dopamine = neuro_state.get("dopamine_response", 0.5)
-        reward_sensitivity = neuro_state.get("reward_sensitivity", 0.5)
-        habituation = neuro_state.get("habituation", 0.0)
-
-        price_change = market.get("price_change_pct", 0.0)
-        trend = market.get("trend", "stable")
-        volatility = market.get("volatility", 0.0)
+        if not isinstance(state, NeuroStimulus):
+            state = NeuroStimulus.from_dict(state)
 
-        social_buzz = social.get("sentiment", 0.0)
+        neuro = state.neuro
+        reward_sensitivity = neuro.reward_sensitivity
+        price_change = state.price_change_pct
+        trend = state.trend
 
         new_fomo = self._update_fomo(
-            current_fomo, price_change, trend, social_buzz, reward_sensitivity
+            neuro.fomo_level, price_change, trend, state.social_sentiment, reward_sensitivity
         )
 
         new_stress = self._update_stress(
-            current_stress, price_change, trend, volatility
+            neuro.stress_level, price_change, trend, state.volatility
         )
 
-        portfolio = agent.get("portfolio", {})
-        unrealized_pnl = portfolio.get("unrealized_pnl_pct", 0.0)
-
         new_dopamine, new_habituation = self._update_dopamine(
-            current_dopamine, unrealized_pnl, price_change, habituation
+            neuro.dopamine_response,
+            state.unrealized_pnl_pct,
+            price_change,
+            neuro.habituation,
         )
 
         urgency = new_fomo * 0.7 + (1 - self._current_state.habituation) * 0.3
@@ -132,9 +206,7 @@ class NeurobiologyModule:
         if price_change > 0:
             fomo_delta += (price_change / 100) * 0.5 * (1 + sensitivity)
 
-        if trend in ["surging", "rising"]:
-            trend_boost = 0.3 if trend == "surging" else 0.15
-            fomo_delta += trend_boost
+        fomo_delta += _TREND_FOMO_BOOST.get(trend, 0.0)
 
         if social_buzz > 0:
             fomo_delta += social_buzz * 0.2
@@ -167,9 +239,7 @@ class NeurobiologyModule:
         if price_change < 0:
             stress_delta += abs(price_change / 100) * 0.4
 
-        if trend in ["crashing", "falling"]:
-            trend_stress = 0.4 if trend == "crashing" else 0.2
-            stress_delta += trend_stress
+        stress_delta += _TREND_STRESS_BOOST.get(trend, 0.0)
 
         stress_delta += volatility * 0.3
 
@@ -233,19 +303,7 @@ class NeurobiologyModule:
         Returns:
             FOMO level (0.0-1.0).
         """
-        fomo = 0.0
-
-        if price_change_pct > 0:
-            fomo += min(price_change_pct / 50, 0.5)
-
-        if trend == "surging":
-            fomo += 0.3
-        elif trend == "rising":
-            fomo += 0.15
-
-        fomo += social_buzz * 0.2
-
-        return max(0.0, min(1.0, fomo))
+        return _calculate_fomo(price_change_pct, trend, social_buzz)
 
     def get_state_summary(self) -> str:
         """Get a summary of current neurobiological state.
@@ -7,10 +7,12 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
+from ._columnar import _DataclassArray
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CognitiveBiases:
     """Collection of cognitive bias strengths.
     
@@ -30,6 +32,10 @@ class CognitiveBiases:
     overconfidence: float = 0.5
 
 
+class CognitiveBiasArray(_DataclassArray[CognitiveBiases]):
+    """Columnar CognitiveBiases storage for a population of agents."""
+
+
 class CognitionModule:
     """Models cognitive biases in information processing.
     
@@ -42,8 +48,7 @@ class CognitionModule:
     def __init__(self) -> None:
         """Initialize the CognitionModule."""
         self.name = "cognition"
-        self._current_biases = CognitiveBiases()
-        self._active_biases: list[str] = []
+        self.reset()
 
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         """Process cognitive state and apply biases.
@@ -290,4 +295,4 @@ class CognitionModule:
     def reset(self) -> None:
         """Reset module to initial state."""
         self._current_biases = CognitiveBiases()
-        self._active_biases = []
+        self._active_biases: list[str] = []
@@ -6,9 +6,62 @@ Models emotion contagion, social influence, and herding behavior.
 import logging
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+def _propagate(
+    source_valence: float,
+    source_arousal: float,
+    target_valence: float,
+    target_arousal: float,
+    connection_strength: float,
+    susceptibility: float,
+) -> tuple[float, float]:
+    """Blend target emotion toward the source.
+
+    Scalar kernel behind ``EmotionContagion.propagate``.
+
+    Returns:
+        Tuple of (valence, arousal) clamped to their valid ranges.
+    """
+    influence_factor = susceptibility * connection_strength
+
+    new_valence = (
+        target_valence * (1 - influence_factor) + source_valence * influence_factor
+    )
+    new_arousal = (
+        target_arousal * (1 - influence_factor) + source_arousal * influence_factor
+    )
+
+    return max(-1.0, min(1.0, new_valence)), max(0.0, min(1.0, new_arousal))
+
+
+def _influence(
+    source_influence: float,
+    target_influence: float,
+    source_followers: float,
+    target_followers: float,
+) -> float:
+    """Score how strongly a source sways a target.
+
+    Scalar kernel behind ``SocialInfluence.calculate``.
+
+    Returns:
+        Influence score (0.0-1.0).
+    """
+    if target_followers == 0:
+        follower_ratio = 1.0
+    else:
+        follower_ratio = min(source_followers / max(target_followers, 1), 10.0) / 10.0
+
+    influence_gap = max(0, source_influence - target_influence)
+
+    influence = 0.3 * source_influence + 0.3 * follower_ratio + 0.4 * influence_gap
+    return min(1.0, influence)
+
+
 class EmotionContagion:
     """Models emotional contagion between connected agents.
     
@@ -43,22 +96,15 @@ class EmotionContagion:
         Returns:
             Updated target emotion after contagion.
         """
-        influence_factor = self.susceptibility * connection_strength
-
-        new_valence = (
-            target_emotion["valence"] * (1 - influence_factor)
-            + source_emotion["valence"] * influence_factor
+        new_valence, new_arousal = _propagate(
+            source_emotion["valence"],
+            source_emotion["arousal"],
+            target_emotion["valence"],
+            target_emotion["arousal"],
+            connection_strength,
+            self.susceptibility,
         )
-
-        new_arousal = (
-            target_emotion["arousal"] * (1 - influence_factor)
-            + source_emotion["arousal"] * influence_factor
-        )
-
-        return {
-            "valence": max(-1.0, min(1.0, new_valence)),
-            "arousal": max(0.0, min(1.0, new_arousal)),
-        }
+        return {"valence": new_valence, "arousal": new_arousal}
 
 
 class SocialInfluence:
@@ -86,21 +132,12 @@ class SocialInfluence:
         Returns:
             Influence score (0.0-1.0).
         """
-        source_influence = source.get("influence_score", 0.5)
-        target_influence = target.get("influence_score", 0.5)
-
-        source_followers = source.get("follower_count", 100)
-        target_followers = target.get("follower_count", 100)
-
-        if target_followers == 0:
-            follower_ratio = 1.0
-        else:
-            follower_ratio = min(source_followers / max(target_followers, 1), 10.0) / 10.0
-
-        influence_gap = max(0, source_influence - target_influence)
-
-        influence = 0.3 * source_influence + 0.3 * follower_ratio + 0.4 * influence_gap
-        return min(1.0, influence)
+        return _influence(
+            source.get("influence_score", 0.5),
+            target.get("influence_score", 0.5),
+            source.get("follower_count", 100),
+            target.get("follower_count", 100),
+        )
 
 
 class SocialInteractionModule:
@@ -123,9 +160,8 @@ class SocialInteractionModule:
         self.name = "social_interaction"
         self.contagion = EmotionContagion(susceptibility=susceptibility)
         self.influence = SocialInfluence()
-        self._last_social_pressure = 0.0
-        self._last_emotion_received: dict[str, float] | None = None
         self._herding_threshold = 0.7
+        self.reset()
 
     def process(self, state: dict[str, Any]) -> dict[str, Any]:
         """Process social interaction state.
@@ -179,6 +215,86 @@ class SocialInteractionModule:
             ),
         }
 
+    def process_batch(
+        self,
+        emotion_valence: np.ndarray,
+        emotion_arousal: np.ndarray,
+        neighbor_indptr: np.ndarray,
+        neighbor_indices: np.ndarray,
+        connection_strengths: np.ndarray,
+        consensus_strength: np.ndarray | float = 0.0,
+    ) -> dict[str, np.ndarray]:
+        """Process social interaction for all agents in one vectorized pass.
+
+        The network is given in CSR form: the neighbors of agent ``i`` are
+        ``neighbor_indices[neighbor_indptr[i]:neighbor_indptr[i + 1]]`` with
+        matching weights in ``connection_strengths``. Results match calling
+        ``process`` once per agent, except that herding detection (which needs
+        per-neighbor actions) is not computed and module state is not updated.
+
+        Args:
+            emotion_valence: Valence of each agent.
+            emotion_arousal: Arousal of each agent.
+            neighbor_indptr: CSR row pointer, length ``n_agents + 1``.
+            neighbor_indices: CSR neighbor agent indices.
+            connection_strengths: Weight for each entry of ``neighbor_indices``.
+            consensus_strength: Consensus strength, scalar or per agent.
+
+        Returns:
+            Dictionary of per-agent output arrays.
+        """
+        n_agents = len(emotion_valence)
+        counts = np.diff(neighbor_indptr)
+        has_neighbors = counts > 0
+
+        weight_sum = np.zeros(n_agents)
+        valence_sum = np.zeros(n_agents)
+        arousal_sum = np.zeros(n_agents)
+        if len(neighbor_indices):
+            # reduceat misbehaves on empty segments, so only reduce rows
+            # that have neighbors.
+            starts = neighbor_indptr[:-1][has_neighbors]
+            weight_sum[has_neighbors] = np.add.reduceat(connection_strengths, starts)
+            valence_sum[has_neighbors] = np.add.reduceat(
+                connection_strengths * emotion_valence[neighbor_indices], starts
+            )
+            arousal_sum[has_neighbors] = np.add.reduceat(
+                connection_strengths * emotion_arousal[neighbor_indices], starts
+            )
+
+        total_weight = np.where(weight_sum == 0, 1.0, weight_sum)
+        influence_factor = (
+            self.contagion.susceptibility * weight_sum / np.maximum(counts, 1)
+        )
+
+        mixed_valence = (
+            emotion_valence * (1 - influence_factor)
+            + valence_sum / total_weight * influence_factor
+        )
+        mixed_arousal = (
+            emotion_arousal * (1 - influence_factor)
+            + arousal_sum / total_weight * influence_factor
+        )
+        valence_received = np.where(
+            has_neighbors, np.clip(mixed_valence, -1.0, 1.0), emotion_valence
+        )
+        arousal_received = np.where(
+            has_neighbors, np.clip(mixed_arousal, 0.0, 1.0), emotion_arousal
+        )
+
+        alignment = 1.0 - (
+            np.abs(emotion_valence - valence_received)
+            + np.abs(emotion_arousal - arousal_received)
+        ) / 2
+
+        return {
+            "valence_received": valence_received,
+            "arousal_received": arousal_received,
+            "social_pressure": consensus_strength * np.minimum(counts / 10, 1.0),
+            "neighbor_influence": counts / 10,
+            "emotional_alignment": alignment,
+        }
+
     def aggregate_emotions(
         self,
         neighbors: list[dict[str, Any]],
@@ -188,7 +304,9 @@ class SocialInteractionModule:
         
         Args:
             neighbors: List of neighbor data with emotions.
-            weights: Connection weights for each neighbor.
+            weights: Connection weights for each neighbor; if the lengths
+                differ, only the first ``min(len(neighbors), len(weights))``
+                pairs contribute, but every weight counts toward the total.
             
         Returns:
             Weighted average emotion.
@@ -196,18 +314,45 @@ class SocialInteractionModule:
         if not neighbors:
             return {"valence": 0.0, "arousal": 0.5}
 
-        total_weight = sum(weights) or 1.0
-        normalized_weights = [w / total_weight for w in weights]
+        # Pair neighbors with weights like zip(), but normalise by the full
+        # weight total so unmatched weights still dilute the average.
+        count = min(len(neighbors), len(weights))
+        valences = np.empty(count)
+        arousals = np.empty(count)
+        for i, neighbor in enumerate(neighbors[:count]):
+            emotion = neighbor.get("emotion", {"valence": 0.0, "arousal": 0.5})
+            valences[i] = emotion.get("valence", 0.0)
+            arousals[i] = emotion.get("arousal", 0.5)
 
-        valence_sum = 0.0
-        arousal_sum = 0.0
+        weight_array = np.asarray(weights, dtype=float)
+        paired_weights = weight_array[:count]
+        total_weight = float(np.sum(weight_array)) or 1.0
+        return {
+            "valence": float(paired_weights @ valences) / total_weight,
+            "arousal": float(paired_weights @ arousals) / total_weight,
+        }
 
-        for neighbor, weight in zip(neighbors, normalized_weights):
-            emotion = neighbor.get("emotion", {"valence": 0.0, "arousal": 0.5})
-            valence_sum += emotion.get("valence", 0.0) * weight
-            arousal_sum += emotion.get("arousal", 0.5) * weight
+    def aggregate_emotions_vec(
+        self,
+        valences: np.ndarray,
+        arousals: np.ndarray,
+        weights: np.ndarray,
+    ) -> tuple[float, float]:
+        """Weighted average of neighbor emotions over column arrays.
 
-        return {"valence": valence_sum, "arousal": arousal_sum}
+        Args:
+            valences: Neighbor valences.
+            arousals: Neighbor arousals.
+            weights: Connection weights aligned with the emotion arrays.
+
+        Returns:
+            Tuple of (valence, arousal).
+        """
+        total_weight = float(weights.sum()) or 1.0
+        return (
+            float(weights @ valences) / total_weight,
+            float(weights @ arousals) / total_weight,
+        )
 
     def _detect_herding(self, neighbors: list[dict[str, Any]]) -> bool:
         """Detect herding behavior among neighbors.
@@ -272,4 +417,4 @@ class SocialInteractionModule:
     def reset(self) -> None:
         """Reset module to initial state."""
         self._last_social_pressure = 0.0
-        self._last_emotion_received = None
+        self._last_emotion_received: dict[str, float] | None = None
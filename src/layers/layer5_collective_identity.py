@@ -5,14 +5,19 @@ Models in-group/out-group dynamics and identity-based information filtering.
 
 import logging
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum, auto
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-class IdentityGroup(Enum):
-    """Identity groups for collective identity modeling."""
+class IdentityGroup(IntEnum):
+    """Identity groups for collective identity modeling.
+
+    Backed by ints so group comparisons in trust adjustment are plain integer
+    compares. Values start at 1 to keep every group truthy.
+    """
     WSB_APE = auto()
     RETAIL_INVESTOR = auto()
     INSTITUTIONAL = auto()
@@ -20,7 +25,7 @@ class IdentityGroup(Enum):
     NEUTRAL = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentityState:
     """State of an agent's collective identity.
     
@@ -36,6 +41,45 @@ class IdentityState:
     out_group_trust: float = 0.3
 
 
+_WSB_INDICATORS = frozenset({"wsb", "memes", "reddit", "crypto", "yolo"})
+
+
+@lru_cache(maxsize=1024)
+def _classify_identity(
+    traits: frozenset[str],
+    interests: frozenset[str],
+    risk_tolerance: str,
+    trust_institutions: str,
+) -> tuple[IdentityGroup, float, float, float]:
+    """Classify a persona signature into an identity group.
+
+    Personas are drawn from a small set of archetypes, so results are cached
+    on the normalized signature.
+
+    Args:
+        traits: Lower-cased personality traits.
+        interests: Lower-cased interests.
+        risk_tolerance: Persona risk tolerance belief.
+        trust_institutions: Persona trust in institutions belief.
+
+    Returns:
+        Tuple of (group, identification, in-group trust, out-group trust).
+    """
+    wsb_match = len(interests & _WSB_INDICATORS)
+
+    if wsb_match >= 2 or (wsb_match >= 1 and risk_tolerance == "high"):
+        return IdentityGroup.WSB_APE, min(0.7 + (wsb_match * 0.1), 1.0), 0.85, 0.2
+    if trust_institutions == "high" and "analytical" in traits:
+        if "quantitative" in " ".join(interests):
+            group = IdentityGroup.INSTITUTIONAL
+        else:
+            group = IdentityGroup.RETAIL_INVESTOR
+        return group, 0.5, 0.6, 0.4
+    if "skeptical" in traits or trust_institutions == "low":
+        return IdentityGroup.SKEPTIC, 0.4, 0.5, 0.3
+    return IdentityGroup.NEUTRAL, 0.3, 0.5, 0.5
+
+
 class IdentityModule:
     """Models collective identity and its effects on trust and behavior.
     
@@ -48,7 +92,7 @@ class IdentityModule:
     def __init__(self) -> None:
         """Initialize the IdentityModule."""
         self.name = "collective_identity"
-        self._current_identity: IdentityState | None = None
+        self.reset()
 
     def assign_identity(self, persona: dict[str, Any]) -> IdentityState:
         """Assign an identity group based on persona traits.
@@ -59,43 +103,20 @@ class IdentityModule:
         Returns:
             IdentityState with assigned group.
         """
-        traits = set(t.lower() for t in persona.get("personality_traits", []))
-        interests = set(i.lower() for i in persona.get("interests", []))
+        traits = frozenset(t.lower() for t in persona.get("personality_traits", []))
+        interests = frozenset(i.lower() for i in persona.get("interests", []))
         beliefs = persona.get("beliefs", {})
 
-        risk_tolerance = beliefs.get("risk_tolerance", "moderate")
-        trust_institutions = beliefs.get("trust_in_institutions", "moderate")
-
-        wsb_indicators = {"wsb", "memes", "reddit", "crypto", "yolo"}
-        wsb_match = len(interests & wsb_indicators)
-
-        if wsb_match >= 2 or (wsb_match >= 1 and risk_tolerance == "high"):
-            group = IdentityGroup.WSB_APE
-            identification = 0.7 + (wsb_match * 0.1)
-            in_group_trust = 0.85
-            out_group_trust = 0.2
-        elif trust_institutions == "high" and "analytical" in traits:
-            if "quantitative" in " ".join(interests).lower():
-                group = IdentityGroup.INSTITUTIONAL
-            else:
-                group = IdentityGroup.RETAIL_INVESTOR
-            identification = 0.5
-            in_group_trust = 0.6
-            out_group_trust = 0.4
-        elif "skeptical" in traits or trust_institutions == "low":
-            group = IdentityGroup.SKEPTIC
-            identification = 0.4
-            in_group_trust = 0.5
-            out_group_trust = 0.3
-        else:
-            group = IdentityGroup.NEUTRAL
-            identification = 0.3
-            in_group_trust = 0.5
-            out_group_trust = 0.5
+        group, identification, in_group_trust, out_group_trust = _classify_identity(
+            traits,
+            interests,
+            beliefs.get("risk_tolerance", "moderate"),
+            beliefs.get("trust_in_institutions", "moderate"),
+        )
 
         return IdentityState(
             primary_group=group,
-            group_identification=min(identification, 1.0),
+            group_identification=identification,
             in_group_trust=in_group_trust,
             out_group_trust=out_group_trust,
         )
@@ -231,4 +252,4 @@ class IdentityModule:
 
     def reset(self) -> None:
         """Reset module to initial state."""
-        self._current_identity = None
+        self._current_identity: IdentityState | None = None
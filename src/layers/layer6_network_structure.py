@@ -3,16 +3,32 @@
 Models platform dynamics, virality mechanics, and information cascades.
 """
 
+import heapq
 import logging
 import uuid
-from dataclasses import dataclass, field
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Hacker News-style gravity for time-decayed trending scores.
+_TREND_GRAVITY = 1.8
+
+# Columnar viral-post payload accepted by NetworkStructureModule.process.
+VIRAL_POST_DTYPE = np.dtype([
+    ("id", "U16"),
+    ("upvotes", "i8"),
+    ("sentiment", "f8"),
+    ("content", "U256"),
+])
 
-@dataclass
+
+@dataclass(slots=True)
 class PlatformPost:
     """A post on a social platform.
     
@@ -40,17 +56,37 @@ class PlatformPost:
         """Calculate overall engagement score."""
         return self.upvotes + (self.comments * 2) + (self.awards * 10)
 
+    def trend_score(self, now: datetime) -> float:
+        """Calculate a Hacker News-style time-decayed trending score.
+
+        Args:
+            now: Current (simulation) time.
+
+        Returns:
+            ``(engagement - 1) / (age_hours + 2) ** 1.8``.
+        """
+        age_hours = max((now - self.timestamp).total_seconds() / 3600, 0.0)
+        return (self.engagement_score - 1) / (age_hours + 2) ** _TREND_GRAVITY
+
 
 class RedditPlatform:
     """Models Reddit platform dynamics.
     
     Handles post creation, upvoting, virality detection, and trending.
     
+    Raw trending rankings and viral status are read from ``posts`` on every
+    call, so posts edited or added directly are always reflected. The
+    time-decayed ranking is reused briefly and only dropped by
+    ``create_post``, ``upvote``, ``upvote_bulk`` and ``clear``.
+    
     Attributes:
         posts: Dictionary of post ID to PlatformPost.
         viral_threshold: Upvote count for viral status.
     """
 
+    TREND_CACHE_SECONDS: float = 60.0
+    """How long a time-decayed trending ranking is reused if nothing changed."""
+
     def __init__(self, viral_threshold: int = 1000) -> None:
         """Initialize RedditPlatform.
         
@@ -60,6 +96,8 @@ class RedditPlatform:
         self.posts: dict[str, PlatformPost] = {}
         self.viral_threshold = viral_threshold
         self._upvote_tracking: dict[str, set[int]] = {}
+        # Last time-decayed ranking as (now, limit, posts); dropped on any change.
+        self._decayed_trending: tuple[datetime, int, list[PlatformPost]] | None = None
 
     def create_post(
         self,
@@ -89,6 +127,7 @@ class RedditPlatform:
         )
         self.posts[post_id] = post
         self._upvote_tracking[post_id] = set()
+        self._decayed_trending = None
         return post
 
     def upvote(self, post_id: str, voter_id: int) -> bool:
@@ -104,13 +143,41 @@ class RedditPlatform:
         if post_id not in self.posts:
             return False
 
-        if voter_id in self._upvote_tracking.get(post_id, set()):
+        voters = self._upvote_tracking.setdefault(post_id, set())
+        if voter_id in voters:
             return False
 
-        self._upvote_tracking.setdefault(post_id, set()).add(voter_id)
+        voters.add(voter_id)
         self.posts[post_id].upvotes += 1
+        self._decayed_trending = None
         return True
 
+    def upvote_bulk(self, post_id: str, voter_ids: Iterable[int]) -> int:
+        """Upvote a post from many voters at once.
+        
+        Equivalent to calling ``upvote`` per voter, but resolves the post
+        and updates its counters once.
+        
+        Args:
+            post_id: ID of the post to upvote.
+            voter_ids: IDs of the voters; repeat voters are ignored.
+            
+        Returns:
+            Number of upvotes actually added.
+        """
+        if post_id not in self.posts:
+            return 0
+
+        voters = self._upvote_tracking.setdefault(post_id, set())
+        before = len(voters)
+        voters.update(voter_ids)
+        added = len(voters) - before
+
+        if added:
+            self.posts[post_id].upvotes += added
+            self._decayed_trending = None
+        return added
+
     def get_viral_posts(self) -> list[PlatformPost]:
         """Get all viral posts.
         
@@ -118,10 +185,23 @@ class RedditPlatform:
             List of posts exceeding viral threshold.
         """
         return [
-            p for p in self.posts.values()
-            if p.upvotes >= self.viral_threshold
+            post for post in self.posts.values() if post.upvotes >= self.viral_threshold
         ]
 
+    def snapshot_viral(self) -> np.ndarray:
+        """Get all viral posts as a structured array.
+        
+        Posts carry no sentiment, so that column is zero; content is
+        truncated to 256 characters.
+        
+        Returns:
+            Array with dtype ``VIRAL_POST_DTYPE``, one row per viral post.
+        """
+        return np.array(
+            [(post.id, post.upvotes, 0.0, post.content[:256]) for post in self.get_viral_posts()],
+            dtype=VIRAL_POST_DTYPE,
+        )
+
     def get_viral_spread_factor(self, post_id: str) -> float:
         """Calculate viral spread factor for a post.
         
@@ -143,26 +223,68 @@ class RedditPlatform:
         excess_ratio = post.upvotes / self.viral_threshold
         return min(excess_ratio, 5.0)
 
-    def get_trending_posts(self, limit: int = 10) -> list[PlatformPost]:
+    def get_trending_posts(self, limit: int = 10, now: datetime | None = None) -> list[PlatformPost]:
         """Get trending posts by engagement.
         
+        Without ``now``, posts are ranked by their current raw engagement,
+        ties in insertion order. With ``now``, posts are ranked by
+        ``PlatformPost.trend_score`` so fresh posts can outrank older ones;
+        that ranking is reused for up to ``TREND_CACHE_SECONDS`` while no
+        post is created or upvoted.
+        
         Args:
             limit: Maximum posts to return.
+            now: Current (simulation) time for time-decayed ranking.
             
         Returns:
-            List of trending posts.
+            List of trending posts, highest score first.
         """
-        sorted_posts = sorted(
-            self.posts.values(),
-            key=lambda p: p.engagement_score,
-            reverse=True,
+        if now is not None:
+            return self._get_decayed_trending(limit, now)
+
+        return heapq.nlargest(
+            limit, self.posts.values(), key=lambda post: post.engagement_score
         )
-        return sorted_posts[:limit]
+
+    def _get_decayed_trending(self, limit: int, now: datetime) -> list[PlatformPost]:
+        """Rank posts by time-decayed score, reusing a recent ranking.
+        
+        Args:
+            limit: Maximum posts to return.
+            now: Current (simulation) time.
+            
+        Returns:
+            List of trending posts, highest decayed score first.
+        """
+        if self._decayed_trending is not None:
+            cached_now, cached_limit, cached_posts = self._decayed_trending
+            age = (now - cached_now).total_seconds()
+            if 0 <= age < self.TREND_CACHE_SECONDS and limit <= cached_limit:
+                return cached_posts[:limit]
+
+        trending = heapq.nlargest(
+            limit, self.posts.values(), key=lambda post: post.trend_score(now)
+        )
+        self._decayed_trending = (now, limit, trending)
+        return trending
+
+    def author_concentration(self) -> float:
+        """Share of all posts written by the most active author.
+        
+        Returns:
+            Concentration score (0.0 to 1.0).
+        """
+        if not self.posts:
+            return 0.0
+
+        author_counts = Counter(post.author_id for post in self.posts.values())
+        return max(author_counts.values()) / len(self.posts)
 
     def clear(self) -> None:
         """Clear all posts."""
         self.posts.clear()
         self._upvote_tracking.clear()
+        self._decayed_trending = None
 
 
 class NetworkStructureModule:
@@ -175,6 +297,9 @@ class NetworkStructureModule:
         platform: RedditPlatform instance.
     """
 
+    VIRALITY_SCALE: int = 10000
+    """Total viral upvotes at which virality intensity saturates."""
+
     def __init__(self, viral_threshold: int = 1000) -> None:
         """Initialize the NetworkStructureModule.
         
@@ -192,7 +317,8 @@ class NetworkStructureModule:
         Analyzes viral content exposure and information cascades.
         
         Args:
-            state: Combined state including social data.
+            state: Combined state including social data. ``viral_posts`` may
+                be a list of post dicts or a ``VIRAL_POST_DTYPE`` array.
             
         Returns:
             Dictionary with network structure outputs.
@@ -200,30 +326,37 @@ class NetworkStructureModule:
         social = state.get("social", {})
         viral_posts = social.get("viral_posts", [])
 
-        viral_exposure = len(viral_posts) > 0
+        viral_count = len(viral_posts)
+        viral_exposure = viral_count > 0
         virality_intensity = 0.0
+        viral_sentiment = 0.0
 
         if viral_exposure:
-            total_upvotes = sum(p.get("upvotes", 0) for p in viral_posts)
-            virality_intensity = min(total_upvotes / 10000, 1.0)
+            if isinstance(viral_posts, np.ndarray):
+                upvotes = viral_posts["upvotes"]
+                sentiments = viral_posts["sentiment"]
+            else:
+                upvotes = np.fromiter(
+                    (p.get("upvotes", 0) for p in viral_posts), dtype=np.float64, count=viral_count
+                )
+                sentiments = np.fromiter(
+                    (p.get("sentiment", 0.0) for p in viral_posts), dtype=np.float64, count=viral_count
+                )
+            virality_intensity = min(float(upvotes.sum()) / self.VIRALITY_SCALE, 1.0)
+            viral_sentiment = float(sentiments.mean())
 
         information_cascade = (
-            len(viral_posts) >= self._cascade_threshold
+            viral_count >= self._cascade_threshold
             or social.get("rapid_spread", False)
         )
 
-        viral_sentiment = 0.0
-        if viral_posts:
-            sentiments = [p.get("sentiment", 0.0) for p in viral_posts]
-            viral_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0.0
-
-        self._last_viral_count = len(viral_posts)
+        self._last_viral_count = viral_count
 
         return {
             "viral_exposure": viral_exposure,
             "virality_intensity": virality_intensity,
             "information_cascade": information_cascade,
-            "viral_post_count": len(viral_posts),
+            "viral_post_count": viral_count,
             "viral_sentiment": viral_sentiment,
             "network_activation": virality_intensity * 0.5 + (0.3 if information_cascade else 0.0),
         }
@@ -234,17 +367,7 @@ class NetworkStructureModule:
         Returns:
             Concentration score (0.0 to 1.0).
         """
-        if not self.platform.posts:
-            return 0.0
-
-        author_counts: dict[int, int] = {}
-        for post in self.platform.posts.values():
-            author_counts[post.author_id] = author_counts.get(post.author_id, 0) + 1
-
-        total_posts = len(self.platform.posts)
-        max_by_author = max(author_counts.values()) if author_counts else 0
-
-        return max_by_author / total_posts if total_posts > 0 else 0.0
+        return self.platform.author_concentration()
 
     def get_state_summary(self) -> str:
         """Get a summary of current network structure state.
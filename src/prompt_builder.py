@@ -9,6 +9,36 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_PROMPT_PREFIX_TEMPLATE = """You are simulating a social media user discussing {market_topic}.
+
+TOPIC: {market_topic}
+
+{character_profile}
+
+"""
+
+_DECISION_PROMPT_HEAD_TEMPLATE = """{prompt_prefix}{psychological_state}
+
+RECENT CONTEXT:
+"""
+
+_DECISION_PROMPT_TAIL_TEMPLATE = """
+
+{action_guidance}
+
+Based on your character, psychological state, and the current situation, decide what to do next.
+Choose ONE action and provide your response in this exact format:
+
+ACTION: [TWEET/HOLD/LURK]
+CONTENT: [If TWEET, write a short post (max 280 chars) about "{market_topic}". If HOLD or LURK, briefly explain why.]
+
+Remember to stay in character and let your psychological state influence your decision."""
+
+_CHARACTER_PROFILE_TEMPLATE = """CHARACTER PROFILE:
+- Name: {name}
+- {personality}
+- Identity Group: {identity_group}"""
+
 
 class PromptBuilder:
     """Builds dynamic prompts from agent and layer states.
@@ -29,6 +59,40 @@ class PromptBuilder:
     SOCIAL_PRESSURE_THRESHOLD = 0.5
     GROUP_IDENTIFICATION_THRESHOLD = 0.6
     
+    LAYER_OUTPUT_KEYS: tuple[str, ...] = (
+        "fomo_level",
+        "stress_level",
+        "dominant_emotion",
+        "emotion_intensity",
+        "valence",
+        "arousal",
+        "social_pressure",
+        "herding_detected",
+        "viral_exposure",
+        "social_proof",
+        "confirmation_bias",
+        "loss_aversion",
+    )
+    """Layer output keys that can affect the generated prompt."""
+    
+    EMOTION_DESCRIPTIONS: dict[str, str] = {
+        "excitement": "excited and energized",
+        "fear": "fearful and anxious",
+        "anger": "frustrated and angry",
+        "joy": "happy and optimistic",
+        "sadness": "disappointed and down",
+        "surprise": "surprised by recent events",
+        "disgust": "disgusted by what you're seeing",
+        "anticipation": "full of anticipation",
+    }
+    
+    GROUP_DESCRIPTIONS: dict[str, str] = {
+        "WSB_APE": "the WSB ape community - diamond hands, to the moon!",
+        "INSTITUTIONAL": "institutional investors - analytical and measured",
+        "RETAIL": "retail investors - cautious but hopeful",
+        "CONTRARIAN": "contrarians - going against the crowd",
+    }
+    
     def __init__(
         self,
         agent_state: dict[str, Any],
@@ -47,42 +111,69 @@ class PromptBuilder:
         self,
         market_topic: str = "prediction markets",
         recent_context: str = "No recent activity.",
+        prompt_prefix: str | None = None,
     ) -> str:
         """Build a complete decision prompt for the LLM.
         
         Args:
             market_topic: The topic being discussed.
             recent_context: Formatted recent memory/context string.
+            prompt_prefix: Output of ``build_prompt_prefix`` for this agent and
+                topic, if already built.
             
         Returns:
             Complete prompt string for LLM decision generation.
         """
-        character_profile = self._build_character_profile()
-        psychological_state = self._build_psychological_state()
-        action_guidance = self._build_action_guidance()
+        head, tail = self.build_decision_prompt_parts(market_topic, prompt_prefix)
+        return head + recent_context + tail
+    
+    def build_decision_prompt_parts(
+        self,
+        market_topic: str = "prediction markets",
+        prompt_prefix: str | None = None,
+    ) -> tuple[str, str]:
+        """Build the decision prompt text before and after the recent context.
         
-        prompt = f"""You are simulating a social media user discussing {market_topic}.
-
-TOPIC: {market_topic}
-
-{character_profile}
-
-{psychological_state}
-
-RECENT CONTEXT:
-{recent_context}
-
-{action_guidance}
-
-Based on your character, psychological state, and the current situation, decide what to do next.
-Choose ONE action and provide your response in this exact format:
-
-ACTION: [TWEET/HOLD/LURK]
-CONTENT: [If TWEET, write a short post (max 280 chars) about "{market_topic}". If HOLD or LURK, briefly explain why.]
-
-Remember to stay in character and let your psychological state influence your decision."""
-
-        return prompt
+        Neither part depends on the agent's memory, so callers can reuse
+        them while only the recent context changes.
+        
+        Args:
+            market_topic: The topic being discussed.
+            prompt_prefix: Output of ``build_prompt_prefix`` for this agent and
+                topic, if already built.
+            
+        Returns:
+            Tuple of (head, tail) surrounding the recent context.
+        """
+        if prompt_prefix is None:
+            prompt_prefix = self.build_prompt_prefix(market_topic)
+        
+        head = _DECISION_PROMPT_HEAD_TEMPLATE.format_map({
+            "prompt_prefix": prompt_prefix,
+            "psychological_state": self._build_psychological_state(),
+        })
+        tail = _DECISION_PROMPT_TAIL_TEMPLATE.format_map({
+            "market_topic": market_topic,
+            "action_guidance": self._build_action_guidance(),
+        })
+        return head, tail
+    
+    def build_prompt_prefix(self, market_topic: str = "prediction markets") -> str:
+        """Build the topic and character profile that open every prompt.
+        
+        Depends only on the agent's persona-derived fields and the topic, so
+        callers can build it once and pass it to ``build_decision_prompt``.
+        
+        Args:
+            market_topic: The topic being discussed.
+            
+        Returns:
+            Prompt prefix string.
+        """
+        return _PROMPT_PREFIX_TEMPLATE.format_map({
+            "market_topic": market_topic,
+            "character_profile": self._build_character_profile(),
+        })
     
     def _build_character_profile(self) -> str:
         """Build the character profile section of the prompt.
@@ -90,14 +181,11 @@ Remember to stay in character and let your psychological state influence your de
         Returns:
             Formatted character profile string.
         """
-        name = self.agent_state.get("name", "Anonymous")
-        personality = self.agent_state.get("personality_summary", "Average user")
-        identity_group = self.agent_state.get("identity_group", "NEUTRAL")
-        
-        return f"""CHARACTER PROFILE:
-- Name: {name}
-- {personality}
-- Identity Group: {identity_group}"""
+        return _CHARACTER_PROFILE_TEMPLATE.format_map({
+            "name": self.agent_state.get("name", "Anonymous"),
+            "personality": self.agent_state.get("personality_summary", "Average user"),
+            "identity_group": self.agent_state.get("identity_group", "NEUTRAL"),
+        })
     
     def _build_psychological_state(self) -> str:
         """Build the psychological state section based on layer outputs.
@@ -194,18 +282,7 @@ Remember to stay in character and let your psychological state influence your de
         if emotion == "neutral":
             return None
         
-        emotion_descriptions = {
-            "excitement": "excited and energized",
-            "fear": "fearful and anxious",
-            "anger": "frustrated and angry",
-            "joy": "happy and optimistic",
-            "sadness": "disappointed and down",
-            "surprise": "surprised by recent events",
-            "disgust": "disgusted by what you're seeing",
-            "anticipation": "full of anticipation",
-        }
-        
-        description = emotion_descriptions.get(emotion, emotion)
+        description = self.EMOTION_DESCRIPTIONS.get(emotion, emotion)
         
         context = f"- Dominant emotion: You feel {description}"
         
@@ -266,13 +343,7 @@ Remember to stay in character and let your psychological state influence your de
         identification = identity_state.get("group_identification", 0.0)
         
         if identification > self.GROUP_IDENTIFICATION_THRESHOLD:
-            group_descriptions = {
-                "WSB_APE": "the WSB ape community - diamond hands, to the moon!",
-                "INSTITUTIONAL": "institutional investors - analytical and measured",
-                "RETAIL": "retail investors - cautious but hopeful",
-                "CONTRARIAN": "contrarians - going against the crowd",
-            }
-            description = group_descriptions.get(group, group)
+            description = self.GROUP_DESCRIPTIONS.get(group, group)
             return (
                 f"- You strongly identify with {description} "
                 f"(identification strength: {identification:.1f}). "
@@ -7,7 +7,9 @@ import json
 import logging
 import random
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +33,40 @@ from .interfaces import LLMInterfaceABC, MarketDataProviderABC, UserPoolProvider
 logger = logging.getLogger(__name__)
 
 
+_KALSHI_SEED_TEMPLATES: tuple[str, ...] = (
+    "What do you think about {topic}?",
+    "Just saw the latest on {topic}. Thoughts?",
+    "The odds on {topic} are interesting. Anyone tracking this?",
+    "{topic} - this could be huge!",
+    "Keeping an eye on {topic}. Market sentiment looks strong.",
+    "Does anyone have insight on {topic}?",
+    "The prediction market for {topic} is heating up!",
+    "I'm bullish on {topic}. Here's why...",
+    "Skeptical about {topic}. What am I missing?",
+    "{topic} - make your bets now or regret later!",
+)
+
+
+@lru_cache(maxsize=128)
+def _kalshi_seed_content(topics: tuple[str, ...]) -> tuple[str, ...]:
+    """Expand the seed post templates over up to ten Kalshi topics.
+    
+    Simulations started from the same Kalshi trends share the expanded
+    strings instead of formatting them again.
+    
+    Args:
+        topics: Trending topic strings from Kalshi.
+        
+    Returns:
+        Generated content strings, grouped by topic.
+    """
+    return tuple(
+        template.format(topic=topic)
+        for topic in topics[:10]
+        for template in _KALSHI_SEED_TEMPLATES
+    )
+
+
 class SimulationError(Exception):
     """Base exception for simulation errors."""
     pass
@@ -52,6 +88,10 @@ class Simulation:
     BASE_PRICE: float = 20.0
     START_DATE: datetime = datetime(2021, 1, 11, 9, 0)
     _KALSHI_TICKER_RE = re.compile(r"^[A-Z0-9][A-Z0-9._-]{1,63}$")
+    # Steps a fetched Kalshi market list is reused before fetching it again.
+    # Live prices can therefore trail the exchange by up to this many steps
+    # minus one.
+    MARKET_REFRESH_STEPS: int = 3
     
     def __init__(
         self,
@@ -118,6 +158,9 @@ class Simulation:
         
         self._kalshi_client: MarketDataProviderABC | None = market_provider
         self._kalshi_analysis: dict[str, Any] | None = None
+        self._markets_by_ticker: dict[str, dict[str, Any]] = {}
+        self._markets_by_title: dict[str, dict[str, Any]] = {}
+        self._markets_fetched_step: int | None = None
         self._user_pool_provider: UserPoolProviderABC | None = user_pool_provider
         
         if self.use_kalshi and self._kalshi_client is None:
@@ -137,14 +180,27 @@ class Simulation:
         if self.llm is None:
             self.llm = LlamaInterface(mock_mode=self.mock_llm)
         
-        if self.use_kalshi and self._kalshi_client:
-            self._load_kalshi_trends()
-        if not self.llm.health_check():
+        # Kalshi trends, the SocioVerse user pool, and the LLM health check
+        # are independent network calls, so overlap them.
+        socioverse_future = None
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if self.use_kalshi and self._kalshi_client:
+                trends_future = executor.submit(self._load_kalshi_trends)
+            else:
+                trends_future = None
+            if self.use_kalshi and not self.custom_agents:
+                socioverse_future = executor.submit(self._try_load_socioverse)
+            
+            llm_healthy = self.llm.health_check()
+            if trends_future is not None:
+                trends_future.result()
+        
+        if not llm_healthy:
             logger.warning(
                 "Ollama not responding. Ensure 'ollama serve' is running."
             )
         
-        personas = self.custom_agents or self._load_personas()
+        personas = self.custom_agents or self._load_personas(socioverse_future)
         self._create_agents(personas)
         self.seed_tweets = self._load_seed_tweets()
         
@@ -206,20 +262,24 @@ class Simulation:
             k=min(len(self.agents), max(5, len(self.agents) // 3))
         )
         
+        # Every action this step sees the same market, so build the snapshot
+        # once and give each log entry its own copy.
+        market_snapshot = self._build_market_snapshot(market_info)
+        llm = self.llm
+        log_action = self.simulation_log.append
+        
         for agent in active_agents:
             agent.observe(market_info, social_info)
             
-            decision = agent.decide(self.llm)
+            decision = agent.decide(llm)
             
             action = agent.act(decision)
             step_actions.append(action)
             
             action_dict = action.to_dict()
             action_dict.setdefault("metadata", {})
-            action_dict["metadata"]["market_snapshot"] = self._build_market_snapshot(
-                market_info
-            )
-            self.simulation_log.append(action_dict)
+            action_dict["metadata"]["market_snapshot"] = dict(market_snapshot)
+            log_action(action_dict)
         
         self._update_community_sentiment(step_actions)
     
@@ -230,29 +290,40 @@ class Simulation:
             step: Current step number for price trajectory.
         """
         if self.use_kalshi and self._kalshi_client:
-            live_updated = self._try_live_market_update()
+            live_updated = self._try_live_market_update(step)
             if live_updated:
                 return
         
         self._update_market_state_formula(step)
 
-    def _try_live_market_update(self) -> bool:
+    def _try_live_market_update(self, step: int) -> bool:
         """Attempt to update market state from live Kalshi data.
         
+        The market list is fetched at most once every
+        ``MARKET_REFRESH_STEPS`` steps and indexed for lookups in between, so
+        price changes published mid-window are only seen at the next fetch.
+        
+        Args:
+            step: Current step number.
+        
         Returns:
             True if live update succeeded, False to fall back to formula.
         """
         try:
-            markets = self._kalshi_client.get_public_markets(limit=50)
-            if not markets:
-                logger.debug("No markets returned from Kalshi API, using formula")
-                return False
+            if not self._market_index_is_fresh(step):
+                markets = self._kalshi_client.get_public_markets(limit=50)
+                if not markets:
+                    logger.debug("No markets returned from Kalshi API, using formula")
+                    return False
+                self._index_markets(markets, step)
             
-            target_market = self._find_market_from_list(markets)
+            target_market = self._find_indexed_market()
             
             # Fallback: Try fetching specific market directly
             if not target_market and self.market_topic:
                 target_market = self._try_fetch_market_by_ticker()
+                if target_market:
+                    self._markets_by_ticker[self.market_topic.strip().upper()] = target_market
             
             if not target_market:
                 logger.debug(
@@ -290,35 +361,36 @@ class Simulation:
             logger.warning("Live market update failed: %s", e)
             return False
 
-    def _find_market_from_list(self, markets: list[dict[str, Any]]) -> dict[str, Any] | None:
-        """Find the best matching market from a fetched market list."""
+    def _market_index_is_fresh(self, step: int) -> bool:
+        """Whether the indexed market list can serve ``step`` without a fetch."""
+        fetched = self._markets_fetched_step
+        return fetched is not None and 0 <= step - fetched < self.MARKET_REFRESH_STEPS
+
+    def _index_markets(self, markets: list[dict[str, Any]], step: int) -> None:
+        """Index a fetched market list by normalized ticker and title.
+
+        The first market wins when several share a key, matching a linear scan.
+        """
+        by_ticker: dict[str, dict[str, Any]] = {}
+        by_title: dict[str, dict[str, Any]] = {}
+        for market in markets:
+            by_ticker.setdefault(str(market.get("ticker", "")).strip().upper(), market)
+            by_title.setdefault(str(market.get("title", "")).strip().casefold(), market)
+        self._markets_by_ticker = by_ticker
+        self._markets_by_title = by_title
+        self._markets_fetched_step = step
+
+    def _find_indexed_market(self) -> dict[str, Any] | None:
+        """Find the best matching market in the indexed market list."""
         if not self.market_topic:
             return None
 
         market_topic = self.market_topic.strip()
-        ticker_candidate = market_topic.upper()
-        title_candidate = market_topic.casefold()
-
-        # Prefer exact ticker match first.
-        ticker_match = next(
-            (
-                market
-                for market in markets
-                if str(market.get("ticker", "")).strip().upper() == ticker_candidate
-            ),
-            None,
-        )
-        if ticker_match:
-            return ticker_match
-
-        # If the topic is a human-readable title, match that before API fallback.
-        return next(
-            (
-                market
-                for market in markets
-                if str(market.get("title", "")).strip().casefold() == title_candidate
-            ),
-            None,
+
+        # Prefer exact ticker match first; if the topic is a human-readable
+        # title, match that before API fallback.
+        return self._markets_by_ticker.get(market_topic.upper()) or self._markets_by_title.get(
+            market_topic.casefold()
         )
 
     def _try_fetch_market_by_ticker(self) -> dict[str, Any] | None:
@@ -482,9 +554,16 @@ class Simulation:
             "timestamp": market_info.timestamp.isoformat(),
         }
     
-    def _load_personas(self) -> list[dict[str, Any]]:
+    def _load_personas(
+        self,
+        socioverse_future: Future[list[dict[str, Any]] | None] | None = None,
+    ) -> list[dict[str, Any]]:
         """Load personas with priority chain: custom > SocioVerse > Kalshi > defaults.
         
+        Args:
+            socioverse_future: Already-started ``_try_load_socioverse`` call to
+                use instead of fetching SocioVerse personas again.
+        
         Returns:
             List of persona dictionaries.
         """
@@ -495,7 +574,10 @@ class Simulation:
 
         # Priority 2: Try SocioVerse dataset (real user data)
         if self.use_kalshi:
-            personas = self._try_load_socioverse()
+            if socioverse_future is not None:
+                personas = socioverse_future.result()
+            else:
+                personas = self._try_load_socioverse()
             if personas:
                 return personas
         
@@ -635,7 +717,8 @@ class Simulation:
         # Priority 2: Generate sample content (static file loading deprecated)
         return self._generate_sample_tweets()
 
-    def _generate_kalshi_based_content(self, topics: list[str]) -> list[str]:
+    @staticmethod
+    def _generate_kalshi_based_content(topics: list[str]) -> list[str]:
         """Generate seed content based on Kalshi trending topics.
         
         Args:
@@ -644,26 +727,7 @@ class Simulation:
         Returns:
             List of generated content strings.
         """
-        content = []
-        
-        templates = [
-            "What do you think about {topic}?",
-            "Just saw the latest on {topic}. Thoughts?",
-            "The odds on {topic} are interesting. Anyone tracking this?",
-            "{topic} - this could be huge!",
-            "Keeping an eye on {topic}. Market sentiment looks strong.",
-            "Does anyone have insight on {topic}?",
-            "The prediction market for {topic} is heating up!",
-            "I'm bullish on {topic}. Here's why...",
-            "Skeptical about {topic}. What am I missing?",
-            "{topic} - make your bets now or regret later!",
-        ]
-        
-        for topic in topics[:10]:
-            for template in templates:
-                content.append(template.format(topic=topic))
-        
-        return content
+        return list(_kalshi_seed_content(tuple(topics)))
     
     def _generate_sample_tweets(self) -> list[str]:
         """Generate sample tweets for simulation.
@@ -10,7 +10,7 @@ import os
 import random
 import re
 from ast import literal_eval
-from typing import Any
+from typing import Any, Callable
 
 from .interfaces import UserPoolProviderABC
 
@@ -38,6 +38,7 @@ class SocioVerseConnector(UserPoolProviderABC):
         self,
         hf_token: str | None = None,
         research_mode: bool | None = None,
+        load_dataset: Callable[..., Any] | None = None,
     ) -> None:
         """Initialize the SocioVerseConnector.
         
@@ -46,12 +47,15 @@ class SocioVerseConnector(UserPoolProviderABC):
             research_mode:
                 If provided, explicitly controls research-only access guard.
                 If None, reads from KALSIM_RESEARCH_MODE environment variable.
+            load_dataset: Optional dataset loader (for dependency injection).
+                If None, ``datasets.load_dataset`` is imported on first use.
         """
         self.hf_token = hf_token or os.environ.get("HF_TOKEN")
         self.research_mode = (
             research_mode if research_mode is not None else self._read_research_mode_flag()
         )
         self._dataset = None
+        self._load_dataset = load_dataset
 
     def fetch_user_pool(self, count: int = 100) -> list[dict[str, Any]]:
         """Fetch diverse user personas from SocioVerse.
@@ -75,7 +79,7 @@ class SocioVerseConnector(UserPoolProviderABC):
             return []
 
         try:
-            from datasets import load_dataset
+            load_dataset = self._get_loader()
             
             logger.info(f"Fetching {count} users from SocioVerse dataset...")
             self._audit("socioverse_access_attempt", requested_count=count)
@@ -112,6 +116,17 @@ class SocioVerseConnector(UserPoolProviderABC):
             )
             return []
 
+    def _get_loader(self) -> Callable[..., Any]:
+        """Return the injected dataset loader, importing ``datasets`` if none was given.
+        
+        Raises:
+            ImportError: If no loader was injected and ``datasets`` is not installed.
+        """
+        if self._load_dataset is not None:
+            return self._load_dataset
+        from datasets import load_dataset
+        return load_dataset
+
     def _load_dataset_with_fallback(self, load_dataset: Any, count: int) -> Any:
         """Load SocioVerse with multiple config fallbacks for cache compatibility."""
         split = f"train[:{count}]"
@@ -420,9 +435,7 @@ class SocioVerseConnector(UserPoolProviderABC):
             return False
 
         try:
-            from datasets import load_dataset
-
-            dataset = self._load_dataset_with_fallback(load_dataset, count=1)
+            dataset = self._load_dataset_with_fallback(self._get_loader(), count=1)
             return len(dataset) > 0
         except Exception:
             return False
@@ -1,41 +1,184 @@
 """Shared pytest fixtures for simons_heir_mvp tests."""
 
+import copy
+
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from tests.helpers import build_simulation, copy_simulation, stub_market_provider
+
+
+def pytest_configure(config):
+    """Register the xdist grouping markers so plain runs don't warn about them."""
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing a name on one xdist worker"
+    )
+    config.addinivalue_line(
+        "markers", "serial: touches shared files (e.g. VCR cassettes); keep on one worker"
+    )
+    config.addinivalue_line(
+        "markers", "slow: runs a full simulation loop; deselect with -m 'not slow'"
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """Pin each test module to a single xdist worker.
+
+    Module-scoped fixtures are then built once per file, while separate files
+    still spread across workers under ``pytest -n auto --dist loadgroup``.
+    Tests marked ``serial`` all share one group regardless of module.
+    """
+    for item in items:
+        group = "serial" if item.get_closest_marker("serial") else item.module.__name__
+        item.add_marker(pytest.mark.xdist_group(group))
+
+
+@pytest.fixture(scope="session")
+def layer_classes() -> SimpleNamespace:
+    """Layer module classes, imported once per test session."""
+    from src.layers.layer1_neurobiology import NeurobiologyModule
+    from src.layers.layer2_cognition import CognitionModule
+    from src.layers.layer4_social_interaction import SocialInteractionModule
+    from src.layers.layer5_collective_identity import IdentityModule
+
+    return SimpleNamespace(
+        neurobiology=NeurobiologyModule,
+        cognition=CognitionModule,
+        social_interaction=SocialInteractionModule,
+        identity=IdentityModule,
+    )
+
+
+@pytest.fixture(scope="session")
+def small_analysis_df():
+    """Four-row analysis frame for plot tests, built once per session.
+
+    Tests that mutate the frame should work on ``small_analysis_df.copy()``.
+    """
+    import pandas as pd
+
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2021-01-01", periods=4, freq="6h"),
+            "sentiment_score": [0.1, -0.2, 0.05, 0.3],
+            "sentiment_ma": [0.1, -0.05, -0.02, 0.04],
+            "kw_gme": [2, 1, 0, 3],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def _session_mock_llm():
+    """Single LLM interface mock shared by the whole session."""
+    from src.interfaces import LLMInterfaceABC
+
+    return MagicMock(spec=LLMInterfaceABC)
+
 
 @pytest.fixture
-def mock_llm_interface():
-    """Mock LLM interface that returns predictable responses."""
-    mock = MagicMock()
+def mock_llm_interface(_session_mock_llm):
+    """Mock LLM interface that returns predictable responses.
+
+    The session mock is reset and reconfigured for each test, so calls and
+    any per-test configuration never leak between tests.
+    """
+    mock = _session_mock_llm
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.generate.return_value = "ACTION: HOLD\nCONTENT: Monitoring the situation."
     mock.health_check.return_value = True
     mock.mock_mode = True
     return mock
 
 
+_SAMPLE_PERSONA: dict[str, Any] = {
+    "id": 0,
+    "name": "TestUser",
+    "personality_traits": ["risk-seeking", "impulsive", "optimistic"],
+    "interests": ["stocks", "crypto", "reddit"],
+    "beliefs": {
+        "risk_tolerance": "high",
+        "market_outlook": "bullish",
+        "trust_in_institutions": "low",
+    },
+    "social": {"follower_count": 1000, "influence_score": 0.7},
+}
+
+
 @pytest.fixture
 def sample_persona() -> dict[str, Any]:
     """Sample persona for testing."""
-    return {
-        "id": 0,
-        "name": "TestUser",
-        "personality_traits": ["risk-seeking", "impulsive", "optimistic"],
-        "interests": ["stocks", "crypto", "reddit"],
-        "beliefs": {
-            "risk_tolerance": "high",
-            "market_outlook": "bullish",
-            "trust_in_institutions": "low",
-        },
-        "social": {"follower_count": 1000, "influence_score": 0.7},
-    }
+    return copy.deepcopy(_SAMPLE_PERSONA)
+
+
+@pytest.fixture
+def agent(sample_persona):
+    """Fresh Agent built from the sample persona."""
+    from src.agent import Agent
+
+    return Agent(agent_id=0, persona=sample_persona)
+
+
+@pytest.fixture(scope="session")
+def market_provider_factory():
+    """Factory for market provider mocks; see ``stub_market_provider``."""
+    return stub_market_provider
+
+
+@pytest.fixture(scope="module")
+def offline_kalshi_client():
+    """Patch ``src.simulation.KalshiClient`` for one module to build stub providers.
+
+    Each construction returns a fresh ``stub_market_provider()``, so nothing in
+    the module reaches the Kalshi API; tests needing specific responses inject
+    ``market_provider`` instead. Opt a module in with
+    ``pytestmark = pytest.mark.usefixtures("offline_kalshi_client")``.
+    """
+    with patch("src.simulation.KalshiClient", side_effect=stub_market_provider) as kalshi_class:
+        yield kalshi_class
+
+
+@pytest.fixture(scope="module")
+def _sim_no_kalshi_prototype():
+    """Mock-LLM Simulation without Kalshi, built once per test module."""
+    return build_simulation(use_kalshi=False)
+
+
+@pytest.fixture(scope="module")
+def _sim_kalshi_prototype():
+    """Kalshi-enabled single-agent Simulation on a stub provider, per module."""
+    return build_simulation(use_kalshi=True)
+
+
+@pytest.fixture(scope="module")
+def _sim_kalshi_3agents_prototype():
+    """Kalshi-enabled three-agent Simulation on a stub provider, per module."""
+    return build_simulation(agent_count=3, use_kalshi=True)
+
+
+@pytest.fixture
+def sim_mock_no_kalshi(_sim_no_kalshi_prototype):
+    """Shallow copy of the module's Kalshi-free Simulation; see ``copy_simulation``."""
+    return copy_simulation(_sim_no_kalshi_prototype)
+
+
+@pytest.fixture
+def sim_mock_kalshi(_sim_kalshi_prototype):
+    """Shallow copy of the module's Kalshi-enabled Simulation."""
+    return copy_simulation(_sim_kalshi_prototype)
+
+
+@pytest.fixture
+def sim_mock_kalshi_3agents(_sim_kalshi_3agents_prototype):
+    """Shallow copy of the module's three-agent Kalshi-enabled Simulation."""
+    return copy_simulation(_sim_kalshi_3agents_prototype)
 
 
 @pytest.fixture
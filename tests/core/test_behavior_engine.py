@@ -69,6 +69,51 @@ class TestLayerPipeline:
 
         assert execution_order == ["L7", "L6", "L5", "L4", "L3", "L2", "L1"]
 
+    def test_compile_groups_independent_layers_into_waves(self):
+        """Test that declared dependencies split layers into waves."""
+        pipeline = LayerPipeline()
+        for name, depends_on in [
+            ("a", ()),
+            ("b", ()),
+            ("c", ["a"]),
+            ("d", None),
+            ("e", ()),
+        ]:
+            mock_layer = MagicMock()
+            mock_layer.name = name
+            pipeline.add_layer(mock_layer, depends_on=depends_on)
+
+        waves = pipeline.compile()
+
+        assert [[layer.name for layer in wave] for wave in waves] == [
+            ["a", "b"],
+            ["c"],
+            ["d", "e"],
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_wave_layers_share_input_state(self, max_workers):
+        """Test that layers in one wave see the same state and merge in order."""
+        pipeline = LayerPipeline(max_workers=max_workers)
+        seen = {}
+
+        def make_processor(name):
+            def processor(state):
+                seen[name] = sorted(state)
+                return {name: True, "shared": name}
+            return processor
+
+        for name in ["first", "second"]:
+            mock_layer = MagicMock()
+            mock_layer.name = name
+            mock_layer.process.side_effect = make_processor(name)
+            pipeline.add_layer(mock_layer, depends_on=())
+
+        result = pipeline.execute({"input": 1})
+
+        assert seen == {"first": ["input"], "second": ["input"]}
+        assert result["shared"] == "second"
+
 
 class TestBehaviorEngine:
     """Tests for BehaviorEngine class."""
@@ -0,0 +1,97 @@
+"""Shared helpers for building test inputs."""
+
+import copy
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import Mock
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only equivalents.
+
+    Module-level test states are built once at import and shared across tests,
+    so freezing them guarantees no test can leak mutations into another.
+
+    Args:
+        value: Dict, list, tuple, or scalar to freeze.
+
+    Returns:
+        ``MappingProxyType`` for mappings, ``tuple`` for sequences, or the
+        value itself for scalars.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def stub_market_provider(spec: type | None = None, **return_values: Any) -> Mock:
+    """Build a market data provider mock with empty default responses.
+
+    Args:
+        spec: Class to ``spec_set`` the mock on; defaults to
+            ``MarketDataProviderABC``. Pass a subclass to allow optional
+            methods outside the interface such as ``get_market``.
+        **return_values: Method name to return value overrides, e.g.
+            ``get_public_markets=[{...}]``.
+
+    Returns:
+        ``Mock`` that rejects attributes missing from ``spec``.
+    """
+    from src.interfaces import MarketDataProviderABC
+
+    return_values = {
+        "get_trending_events": [],
+        "analyze_trends": {"topics": [], "summary": ""},
+        "get_public_markets": [],
+        **return_values,
+    }
+    provider = Mock(spec_set=spec or MarketDataProviderABC)
+    provider.configure_mock(
+        **{f"{name}.return_value": value for name, value in return_values.items()}
+    )
+    return provider
+
+
+def build_simulation(**overrides: Any) -> Any:
+    """Build a one-day, single-agent, mock-LLM Simulation without network clients.
+
+    Kalshi-enabled simulations get a ``stub_market_provider()`` instead of a
+    real ``KalshiClient``, so no HTTP session is created. Tests that need the
+    real client construct ``Simulation`` directly.
+
+    Args:
+        **overrides: ``Simulation`` keyword arguments.
+
+    Returns:
+        The constructed ``Simulation``.
+    """
+    from src.simulation import Simulation
+
+    kwargs = {"days": 1, "agent_count": 1, "mock_llm": True, **overrides}
+    uses_kalshi = kwargs.get("use_kalshi") or not kwargs["mock_llm"]
+    if uses_kalshi and kwargs.get("market_provider") is None:
+        kwargs["market_provider"] = stub_market_provider()
+    return Simulation(**kwargs)
+
+
+def copy_simulation(prototype: Any) -> Any:
+    """Shallow-copy a prototype Simulation with its own top-level containers.
+
+    Every list and dict attribute is copied, so tests can reassign or append
+    to attributes freely. Nested objects such as the market provider mock
+    stay shared; tests that configure them should swap in their own.
+
+    Args:
+        prototype: Simulation to copy.
+
+    Returns:
+        The copy.
+    """
+    sim = copy.copy(prototype)
+    for name, value in vars(prototype).items():
+        if isinstance(value, (list, dict)):
+            setattr(sim, name, copy.copy(value))
+    return sim
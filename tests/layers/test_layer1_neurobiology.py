@@ -3,9 +3,40 @@
 import pytest
 
 from src.layers.layer1_neurobiology import (
-    NeurobiologyModule,
     NeurobiologicalState,
+    NeuroStateArray,
+    NeuroStimulus,
 )
+from tests.helpers import freeze
+
+
+_SURGE_STATE = freeze({
+    "agent": {
+        "neuro_state": {"fomo_level": 0.2, "dopamine_response": 0.5},
+    },
+    "market": {
+        "price_change_pct": 50.0,
+        "trend": "surging",
+    },
+})
+
+_CRASH_STATE = freeze({
+    "agent": {
+        "neuro_state": {"stress_level": 0.2},
+    },
+    "market": {
+        "price_change_pct": -30.0,
+        "trend": "crashing",
+    },
+})
+
+_GAINS_STATE = freeze({
+    "agent": {
+        "neuro_state": {"dopamine_response": 0.5},
+        "portfolio": {"unrealized_pnl_pct": 100.0},
+    },
+    "market": {"trend": "rising"},
+})
 
 
 class TestNeurobiologicalState:
@@ -19,80 +50,75 @@ class TestNeurobiologicalState:
             stress_level=0.3,
             reward_sensitivity=0.6,
         )
-        assert state.fomo_level == 0.8
-        assert state.dopamine_response == 0.7
+        assert (state.fomo_level, state.dopamine_response) == (0.8, 0.7)
 
     def test_default_values(self):
         """Test default neurobiological state values."""
         state = NeurobiologicalState()
-        assert state.fomo_level == 0.0
-        assert state.dopamine_response == 0.5
+        assert (state.fomo_level, state.dopamine_response) == (0.0, 0.5)
 
+    def test_state_is_slotted(self):
+        """Test that states carry no per-instance __dict__."""
+        assert not hasattr(NeurobiologicalState(), "__dict__")
 
-class TestNeurobiologyModule:
-    """Tests for NeurobiologyModule class."""
-
-    def test_module_initialization(self):
-        """Test initializing NeurobiologyModule."""
-        module = NeurobiologyModule()
-        assert module.name == "neurobiology"
+    def test_batch_state_matches_scalar(self):
+        """Test columnar storage round-trips a scalar state."""
+        states = NeuroStateArray(2)
+        state = NeurobiologicalState(0.75, 0.25, 0.5, 0.625, 0.125)
 
-    def test_market_surge_increases_fomo(self):
-        """Test that market surge increases FOMO level."""
-        module = NeurobiologyModule()
+        states.set_row(1, state)
 
-        state = {
-            "agent": {
-                "neuro_state": {"fomo_level": 0.2, "dopamine_response": 0.5},
-            },
-            "market": {
-                "price_change_pct": 50.0,
-                "trend": "surging",
-            },
-        }
+        assert states.row(0) == NeurobiologicalState()
+        assert states.row(1) == state
+        assert states.fomo_level.tolist() == [0.0, 0.75]
 
-        result = module.process(state)
 
-        assert result["fomo_level"] > 0.2
+@pytest.fixture(scope="module")
+def module(layer_classes):
+    """Shared NeurobiologyModule instance for this file."""
+    return layer_classes.neurobiology()
 
-    def test_market_crash_increases_stress(self):
-        """Test that market crash increases stress."""
-        module = NeurobiologyModule()
 
-        state = {
-            "agent": {
-                "neuro_state": {"stress_level": 0.2},
-            },
-            "market": {
-                "price_change_pct": -30.0,
-                "trend": "crashing",
-            },
-        }
+class TestNeurobiologyModule:
+    """Tests for NeurobiologyModule class."""
 
-        result = module.process(state)
+    @pytest.fixture(autouse=True)
+    def _reset_module(self, module):
+        """Reset the shared module so tests stay independent."""
+        module.reset()
+        yield
 
-        assert result["stress_level"] > 0.2
+    def test_module_initialization(self, module):
+        """Test initializing NeurobiologyModule."""
+        assert module.name == "neurobiology"
 
-    def test_dopamine_response_to_gains(self):
-        """Test dopamine response to unrealized gains."""
-        module = NeurobiologyModule()
+    @pytest.mark.parametrize(
+        "state,field,threshold",
+        [
+            (_SURGE_STATE, "fomo_level", 0.2),
+            (_CRASH_STATE, "stress_level", 0.2),
+            (_GAINS_STATE, "dopamine_response", 0.5),
+        ],
+        ids=["surge_fomo", "crash_stress", "gains_dopamine"],
+    )
+    def test_process_increases_field(self, module, state, field, threshold):
+        """Test that market stimuli push the matching response up."""
+        result = module.process(state)
 
-        state = {
-            "agent": {
-                "neuro_state": {"dopamine_response": 0.5},
-                "portfolio": {"unrealized_pnl_pct": 100.0},
-            },
-            "market": {"trend": "rising"},
-        }
+        assert result[field] > threshold
 
-        result = module.process(state)
+    @pytest.mark.parametrize(
+        "state", [_SURGE_STATE, _CRASH_STATE, _GAINS_STATE], ids=["surge", "crash", "gains"]
+    )
+    def test_process_accepts_stimulus(self, module, state):
+        """Test typed stimulus input matches the equivalent dict input."""
+        from_dict = module.process(state)
+        module.reset()
 
-        assert result["dopamine_response"] > 0.5
+        assert module.process(NeuroStimulus.from_dict(state)) == from_dict
 
-    def test_dopamine_diminishes_with_repeated_gains(self):
+    def test_dopamine_diminishes_with_repeated_gains(self, module):
         """Test that dopamine response diminishes with repeated exposure."""
-        module = NeurobiologyModule()
-
         initial_state = {
             "agent": {
                 "neuro_state": {"dopamine_response": 0.5, "habituation": 0.0},
@@ -115,12 +141,10 @@ class TestNeurobiologyModule:
 
         result2 = module.process(habituated_state)
 
-        assert result2["dopamine_response"] <= dopamine1 + 0.1
+        assert result2["dopamine_response"] - dopamine1 <= 0.1
 
-    def test_fomo_triggers_urgency(self):
+    def test_fomo_triggers_urgency(self, module):
         """Test that high FOMO triggers urgency."""
-        module = NeurobiologyModule()
-
         state = {
             "agent": {
                 "neuro_state": {"fomo_level": 0.9},
@@ -132,10 +156,8 @@ class TestNeurobiologyModule:
 
         assert result.get("urgency", 0) > 0.5
 
-    def test_stress_triggers_fight_or_flight(self):
+    def test_stress_triggers_fight_or_flight(self, module):
         """Test that high stress triggers fight-or-flight response."""
-        module = NeurobiologyModule()
-
         state = {
             "agent": {
                 "neuro_state": {"stress_level": 0.85},
@@ -147,10 +169,8 @@ class TestNeurobiologyModule:
 
         assert result.get("fight_or_flight", False) is True
 
-    def test_reward_sensitivity_affects_response(self):
+    def test_reward_sensitivity_affects_response(self, module):
         """Test that reward sensitivity affects response magnitude."""
-        module = NeurobiologyModule()
-
         high_sensitivity_state = {
             "agent": {
                 "neuro_state": {"reward_sensitivity": 0.9},
@@ -170,10 +190,8 @@ class TestNeurobiologyModule:
 
         assert result_high["fomo_level"] > result_low["fomo_level"]
 
-    def test_calculate_fomo_from_price_momentum(self):
+    def test_calculate_fomo_from_price_momentum(self, module):
         """Test FOMO calculation from price momentum."""
-        module = NeurobiologyModule()
-
         fomo = module.calculate_fomo(
             price_change_pct=40.0,
             trend="surging",
@@ -182,10 +200,30 @@ class TestNeurobiologyModule:
 
         assert fomo > 0.5
 
-    def test_no_fomo_during_decline(self):
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            ((40.0, "surging", 0.8), 0.96),
+            ((10.0, "rising", 0.0), 0.35),
+            ((-20.0, "falling", 0.3), 0.06),
+            ((60.0, "surging", 1.0), 1.0),
+        ],
+        ids=["capped_momentum", "rising", "decline_buzz_only", "clamped"],
+    )
+    def test_calculate_fomo_values(self, module, args, expected):
+        """Test FOMO sums capped momentum, trend boost and buzz, clamped to 1."""
+        assert module.calculate_fomo(*args) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "trend,expected",
+        [("surging", 0.3), ("rising", 0.15), ("stable", 0.0), ("crashing", 0.0)],
+    )
+    def test_calculate_fomo_trend_boost(self, module, trend, expected):
+        """Test each trend contributes its fixed FOMO boost."""
+        assert module.calculate_fomo(0.0, trend, 0.0) == pytest.approx(expected)
+
+    def test_no_fomo_during_decline(self, module):
         """Test minimal FOMO during price decline."""
-        module = NeurobiologyModule()
-
         fomo = module.calculate_fomo(
             price_change_pct=-20.0,
             trend="falling",
@@ -194,9 +232,8 @@ class TestNeurobiologyModule:
 
         assert fomo < 0.3
 
-    def test_get_state_summary(self):
+    def test_get_state_summary(self, module):
         """Test getting state summary."""
-        module = NeurobiologyModule()
         module._current_state = NeurobiologicalState(
             fomo_level=0.8,
             stress_level=0.3,
@@ -206,9 +243,8 @@ class TestNeurobiologyModule:
 
         assert "FOMO" in summary or "fomo" in summary.lower()
 
-    def test_reset(self):
+    def test_reset(self, module):
         """Test resetting module state."""
-        module = NeurobiologyModule()
         module._current_state = NeurobiologicalState(
             fomo_level=0.9,
             stress_level=0.8,
@@ -216,5 +252,5 @@ class TestNeurobiologyModule:
 
         module.reset()
 
-        assert module._current_state.fomo_level == 0.0
-        assert module._current_state.stress_level == 0.0
+        current = module._current_state
+        assert (current.fomo_level, current.stress_level) == (0.0, 0.0)
@@ -1,8 +1,40 @@
 """Tests for Layer 2: Cognition module."""
 
+from dataclasses import astuple, fields
+
 import pytest
 
-from src.layers.layer2_cognition import CognitionModule, CognitiveBiases
+from src.layers.layer2_cognition import CognitiveBiasArray, CognitiveBiases
+from tests.helpers import freeze
+
+
+_SOCIAL_PROOF_STATE = freeze({
+    "agent": {
+        "beliefs": {"gme_bullish": 0.4},
+    },
+    "social": {
+        "consensus_view": "bullish",
+        "consensus_strength": 0.9,
+        "peer_count": 50,
+    },
+})
+
+_ANCHORING_STATE = freeze({
+    "agent": {
+        "anchor_price": 20.0,
+    },
+    "market": {
+        "current_price": 300.0,
+    },
+})
+
+_BANDWAGON_STATE = freeze({
+    "agent": {"initial_interest": 0.3},
+    "social": {
+        "adoption_rate": 0.8,
+        "trend_velocity": 0.9,
+    },
+})
 
 
 class TestCognitiveBiases:
@@ -16,8 +48,7 @@ class TestCognitiveBiases:
             anchoring=0.5,
             loss_aversion=0.7,
         )
-        assert biases.social_proof == 0.8
-        assert biases.confirmation_bias == 0.6
+        assert (biases.social_proof, biases.confirmation_bias) == (0.8, 0.6)
 
     def test_default_values(self):
         """Test default bias values."""
@@ -25,39 +56,87 @@ class TestCognitiveBiases:
         assert 0 <= biases.social_proof <= 1
         assert 0 <= biases.confirmation_bias <= 1
 
+    def test_biases_are_slotted(self):
+        """Test that bias sets carry no per-instance __dict__."""
+        assert not hasattr(CognitiveBiases(), "__dict__")
+
+    def test_batch_biases_match_scalar(self):
+        """Test columnar storage round-trips a scalar bias set."""
+        biases = CognitiveBiasArray(3)
+
+        biases.social_proof[:] = 0.75
+
+        assert len(biases) == 3
+        assert astuple(biases.row(2)) == pytest.approx(
+            astuple(CognitiveBiases(social_proof=0.75))
+        )
+
+    def test_batch_columns_follow_dataclass_fields(self):
+        """Test each field maps to its own column in field order."""
+        biases = CognitiveBiasArray(1)
+
+        for value, name in enumerate(CognitiveBiasArray.FIELDS):
+            getattr(biases, name)[:] = value
+
+        assert astuple(biases.row(0)) == tuple(
+            float(i) for i in range(len(CognitiveBiasArray.FIELDS))
+        )
+        assert CognitiveBiasArray.FIELDS == tuple(
+            f.name for f in fields(CognitiveBiases)
+        )
+
+
+@pytest.fixture(scope="module")
+def module(layer_classes):
+    """Shared CognitionModule instance for this file."""
+    return layer_classes.cognition()
+
 
 class TestCognitionModule:
     """Tests for CognitionModule class."""
 
-    def test_module_initialization(self):
+    @pytest.fixture(autouse=True)
+    def _reset_module(self, module):
+        """Reset the shared module so tests stay independent."""
+        module.reset()
+        yield
+
+    def test_module_initialization(self, module):
         """Test initializing CognitionModule."""
-        module = CognitionModule()
         assert module.name == "cognition"
 
-    def test_social_proof_bias_increases_agreement(self):
-        """Test that social proof increases agreement with popular views."""
-        module = CognitionModule()
-
-        state = {
-            "agent": {
-                "beliefs": {"gme_bullish": 0.4},
-            },
-            "social": {
-                "consensus_view": "bullish",
-                "consensus_strength": 0.9,
-                "peer_count": 50,
-            },
-        }
+    @pytest.mark.parametrize(
+        "state,field,threshold",
+        [
+            (_SOCIAL_PROOF_STATE, "adjusted_belief", 0.4),
+            (_ANCHORING_STATE, "anchoring_effect", 0),
+            (_ANCHORING_STATE, "perceived_overvaluation", 0),
+            (_BANDWAGON_STATE, "bandwagon_effect", 0),
+        ],
+        ids=["social_proof", "anchoring", "overvaluation", "bandwagon"],
+    )
+    def test_process_increases_field(self, module, state, field, threshold):
+        """Test that each bias raises its output above baseline."""
+        result = module.process(state)
 
+        assert result[field] > threshold
+
+    @pytest.mark.parametrize(
+        "state,bias",
+        [
+            (_SOCIAL_PROOF_STATE, "social_proof"),
+            (_ANCHORING_STATE, "anchoring"),
+            (_BANDWAGON_STATE, "bandwagon"),
+        ],
+    )
+    def test_process_flags_active_bias(self, module, state, bias):
+        """Test that a triggered bias is reported as active."""
         result = module.process(state)
 
-        assert result["adjusted_belief"] > 0.4
-        assert "social_proof" in result.get("active_biases", [])
+        assert bias in result["active_biases"]
 
-    def test_social_proof_weak_with_few_peers(self):
+    def test_social_proof_weak_with_few_peers(self, module):
         """Test that social proof is weak with few peers."""
-        module = CognitionModule()
-
         state_many = {
             "agent": {"beliefs": {"gme_bullish": 0.4}},
             "social": {"consensus_view": "bullish", "consensus_strength": 0.8, "peer_count": 100},
@@ -73,10 +152,8 @@ class TestCognitionModule:
 
         assert result_many["adjusted_belief"] > result_few["adjusted_belief"]
 
-    def test_confirmation_bias_filters_information(self):
+    def test_confirmation_bias_filters_information(self, module):
         """Test that confirmation bias filters contrary information."""
-        module = CognitionModule()
-
         state = {
             "agent": {
                 "beliefs": {"gme_bullish": 0.9},
@@ -92,28 +169,8 @@ class TestCognitionModule:
 
         assert result.get("information_acceptance", 1.0) < 1.0
 
-    def test_anchoring_bias_on_initial_price(self):
-        """Test anchoring bias on initial price."""
-        module = CognitionModule()
-
-        state = {
-            "agent": {
-                "anchor_price": 20.0,
-            },
-            "market": {
-                "current_price": 300.0,
-            },
-        }
-
-        result = module.process(state)
-
-        assert result.get("anchoring_effect", 0) > 0
-        assert result.get("perceived_overvaluation", 0) > 0
-
-    def test_loss_aversion_affects_selling(self):
+    def test_loss_aversion_affects_selling(self, module):
         """Test that loss aversion affects selling decisions."""
-        module = CognitionModule()
-
         state_loss = {
             "agent": {
                 "entry_price": 100.0,
@@ -137,26 +194,8 @@ class TestCognitionModule:
 
         assert result_loss.get("sell_reluctance", 0) > result_gain.get("sell_reluctance", 0)
 
-    def test_bandwagon_effect(self):
-        """Test bandwagon effect with rapid adoption."""
-        module = CognitionModule()
-
-        state = {
-            "agent": {"initial_interest": 0.3},
-            "social": {
-                "adoption_rate": 0.8,
-                "trend_velocity": 0.9,
-            },
-        }
-
-        result = module.process(state)
-
-        assert result.get("bandwagon_effect", 0) > 0
-
-    def test_calculate_bias_strength(self):
+    def test_calculate_bias_strength(self, module):
         """Test calculating overall bias strength."""
-        module = CognitionModule()
-
         biases = CognitiveBiases(
             social_proof=0.8,
             confirmation_bias=0.7,
@@ -168,10 +207,8 @@ class TestCognitionModule:
 
         assert 0 <= strength <= 1
 
-    def test_identify_active_biases(self):
+    def test_identify_active_biases(self, module):
         """Test identifying which biases are active."""
-        module = CognitionModule()
-
         state = {
             "agent": {"beliefs": {"gme_bullish": 0.8}},
             "social": {"consensus_strength": 0.9, "peer_count": 50},
@@ -183,9 +220,8 @@ class TestCognitionModule:
 
         assert len(active) > 0
 
-    def test_get_state_summary(self):
+    def test_get_state_summary(self, module):
         """Test getting state summary."""
-        module = CognitionModule()
         module._current_biases = CognitiveBiases(social_proof=0.8)
         module._active_biases = ["social_proof"]
 
@@ -193,9 +229,8 @@ class TestCognitionModule:
 
         assert "social_proof" in summary.lower() or "bias" in summary.lower()
 
-    def test_reset(self):
+    def test_reset(self, module):
         """Test resetting module state."""
-        module = CognitionModule()
         module._current_biases = CognitiveBiases(social_proof=0.9)
         module._active_biases = ["social_proof", "anchoring"]
 
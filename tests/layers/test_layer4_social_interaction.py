@@ -1,12 +1,40 @@
 """Tests for Layer 4: Social Interaction module."""
 
+import operator
+
+import numpy as np
 import pytest
 
 from src.layers.layer4_social_interaction import (
-    SocialInteractionModule,
     EmotionContagion,
     SocialInfluence,
 )
+from tests.helpers import freeze
+
+
+_CONSENSUS_NEIGHBORS = freeze(
+    [{"id": i, "emotion": {"valence": 0.9, "arousal": 0.8}} for i in range(1, 6)]
+)
+
+_HERDING_NEIGHBORS = freeze([{"id": i, "action": "BUY"} for i in range(1, 11)])
+
+_HERDING_STATE = freeze({
+    "agent": {"id": 0},
+    "social": {"neighbors": _HERDING_NEIGHBORS},
+})
+
+_MIXED_ACTIONS_STATE = freeze({
+    "agent": {"id": 0},
+    "social": {
+        "neighbors": [
+            {"id": 1, "action": "BUY"},
+            {"id": 2, "action": "SELL"},
+            {"id": 3, "action": "HOLD"},
+            {"id": 4, "action": "BUY"},
+            {"id": 5, "action": "SELL"},
+        ],
+    },
+})
 
 
 class TestEmotionContagion:
@@ -18,34 +46,57 @@ class TestEmotionContagion:
         assert contagion is not None
         assert contagion.susceptibility == 0.5
 
-    def test_propagate_emotion_basic(self):
-        """Test basic emotion propagation between agents."""
-        contagion = EmotionContagion(susceptibility=0.5)
-
-        source_emotion = {"valence": 0.8, "arousal": 0.7}
-        target_emotion = {"valence": 0.2, "arousal": 0.3}
-        connection_strength = 0.8
+    @pytest.mark.parametrize(
+        "susceptibility,source_emotion,target_emotion,connection_strength,cmp",
+        [
+            (
+                0.5,
+                {"valence": 0.8, "arousal": 0.7},
+                {"valence": 0.2, "arousal": 0.3},
+                0.8,
+                operator.gt,
+            ),
+            (
+                0.6,
+                {"valence": -0.7, "arousal": 0.9},
+                {"valence": 0.3, "arousal": 0.2},
+                0.7,
+                operator.lt,
+            ),
+        ],
+        ids=["positive", "negative"],
+    )
+    def test_propagate_pulls_valence_toward_source(
+        self, susceptibility, source_emotion, target_emotion, connection_strength, cmp
+    ):
+        """Test that contagion moves target valence toward the source."""
+        contagion = EmotionContagion(susceptibility=susceptibility)
 
         result = contagion.propagate(
             source_emotion, target_emotion, connection_strength
         )
 
-        assert result["valence"] > target_emotion["valence"]
-        assert result["arousal"] > target_emotion["arousal"]
+        assert cmp(result["valence"], target_emotion["valence"])
 
-    def test_propagate_negative_emotion(self):
-        """Test propagation of negative emotion."""
-        contagion = EmotionContagion(susceptibility=0.6)
+    def test_propagate_raises_arousal_from_excited_source(self):
+        """Test that an excited source raises target arousal."""
+        contagion = EmotionContagion(susceptibility=0.5)
 
-        source_emotion = {"valence": -0.7, "arousal": 0.9}
-        target_emotion = {"valence": 0.3, "arousal": 0.2}
-        connection_strength = 0.7
+        result = contagion.propagate(
+            {"valence": 0.8, "arousal": 0.7}, {"valence": 0.2, "arousal": 0.3}, 0.8
+        )
+
+        assert result["arousal"] > 0.3
+
+    def test_propagate_blends_by_influence_factor(self):
+        """Test the target moves toward the source by susceptibility * strength."""
+        contagion = EmotionContagion(susceptibility=0.6)
 
         result = contagion.propagate(
-            source_emotion, target_emotion, connection_strength
+            {"valence": -0.7, "arousal": 0.9}, {"valence": 0.3, "arousal": 0.2}, 0.7
         )
 
-        assert result["valence"] < target_emotion["valence"]
+        assert result == pytest.approx({"valence": -0.12, "arousal": 0.494})
 
     def test_weak_connection_reduces_contagion(self):
         """Test that weak connections reduce contagion."""
@@ -94,19 +145,35 @@ class TestSocialInfluence:
 
         assert result < 0.3
 
+    def test_calculate_weighs_score_followers_and_gap(self):
+        """Test influence combines source score, capped follower ratio and gap."""
+        source = {"influence_score": 0.9, "follower_count": 10000}
+        target = {"influence_score": 0.3, "follower_count": 100}
+
+        assert SocialInfluence().calculate(source, target) == pytest.approx(0.81)
+
+
+@pytest.fixture(scope="module")
+def module(layer_classes):
+    """Shared SocialInteractionModule instance for this file."""
+    return layer_classes.social_interaction()
+
 
 class TestSocialInteractionModule:
     """Tests for SocialInteractionModule class."""
 
-    def test_module_initialization(self):
+    @pytest.fixture(autouse=True)
+    def _reset_module(self, module):
+        """Reset the shared module so tests stay independent."""
+        module.reset()
+        yield
+
+    def test_module_initialization(self, module):
         """Test initializing SocialInteractionModule."""
-        module = SocialInteractionModule()
         assert module.name == "social_interaction"
 
-    def test_process_with_network_neighbors(self):
+    def test_process_with_network_neighbors(self, module):
         """Test processing with network neighbor emotions."""
-        module = SocialInteractionModule()
-
         state = {
             "agent": {
                 "id": 0,
@@ -126,17 +193,12 @@ class TestSocialInteractionModule:
         assert "emotion_received" in result
         assert result["emotion_received"]["valence"] > 0.3
 
-    def test_process_calculates_social_pressure(self):
+    def test_process_calculates_social_pressure(self, module):
         """Test that processing calculates social pressure."""
-        module = SocialInteractionModule()
-
         state = {
             "agent": {"id": 0, "emotion": {"valence": 0.5, "arousal": 0.5}},
             "social": {
-                "neighbors": [
-                    {"id": i, "emotion": {"valence": 0.9, "arousal": 0.8}}
-                    for i in range(1, 6)
-                ],
+                "neighbors": _CONSENSUS_NEIGHBORS,
                 "consensus_action": "BUY",
                 "consensus_strength": 0.9,
             },
@@ -147,10 +209,8 @@ class TestSocialInteractionModule:
         assert "social_pressure" in result
         assert result["social_pressure"] > 0
 
-    def test_aggregate_neighbor_emotions(self):
+    def test_aggregate_neighbor_emotions(self, module):
         """Test aggregating emotions from multiple neighbors."""
-        module = SocialInteractionModule()
-
         neighbors = [
             {"emotion": {"valence": 0.8, "arousal": 0.6}},
             {"emotion": {"valence": 0.6, "arousal": 0.7}},
@@ -163,60 +223,104 @@ class TestSocialInteractionModule:
         assert 0.6 < result["valence"] < 0.9
         assert 0.5 < result["arousal"] < 0.7
 
-    def test_herding_behavior_detection(self):
-        """Test detection of herding behavior."""
-        module = SocialInteractionModule()
+    @pytest.mark.parametrize(
+        "neighbor_count,weights,expected",
+        [
+            (2, [1.0], {"valence": 0.8, "arousal": 0.6}),
+            (1, [1.0, 1.0], {"valence": 0.4, "arousal": 0.3}),
+        ],
+        ids=["fewer_weights", "more_weights"],
+    )
+    def test_aggregate_emotions_pairs_mismatched_lengths(
+        self, module, neighbor_count, weights, expected
+    ):
+        """Test unmatched neighbors drop out while every weight normalises."""
+        neighbors = [
+            {"emotion": {"valence": 0.8, "arousal": 0.6}},
+            {"emotion": {"valence": -0.4, "arousal": 0.2}},
+        ][:neighbor_count]
 
-        state = {
-            "agent": {"id": 0},
-            "social": {
-                "neighbors": [
-                    {"id": i, "action": "BUY"} for i in range(1, 11)
-                ],
-            },
-        }
+        result = module.aggregate_emotions(neighbors, weights)
 
-        result = module.process(state)
+        assert result == pytest.approx(expected)
 
-        assert result.get("herding_detected", False) is True
+    def test_aggregate_neighbor_emotions_vec(self, module):
+        """Test weighted aggregation over emotion arrays."""
+        valence, arousal = module.aggregate_emotions_vec(
+            np.asarray([0.8, 0.6, 0.9]),
+            np.asarray([0.6, 0.7, 0.5]),
+            np.asarray([0.5, 0.3, 0.2]),
+        )
 
-    def test_no_herding_with_mixed_actions(self):
-        """Test no herding with mixed neighbor actions."""
-        module = SocialInteractionModule()
+        assert (valence, arousal) == pytest.approx((0.76, 0.61))
 
-        state = {
-            "agent": {"id": 0},
-            "social": {
-                "neighbors": [
-                    {"id": 1, "action": "BUY"},
-                    {"id": 2, "action": "SELL"},
-                    {"id": 3, "action": "HOLD"},
-                    {"id": 4, "action": "BUY"},
-                    {"id": 5, "action": "SELL"},
-                ],
-            },
-        }
+    def test_process_batch_matches_per_agent(self, module):
+        """Test the CSR batch path agrees with per-agent processing."""
+        valence = np.array([0.3, 0.8, -0.4])
+        arousal = np.array([0.3, 0.7, 0.9])
+        indptr = np.array([0, 2, 3, 3])
+        indices = np.array([1, 2, 0])
+        strengths = np.array([0.8, 0.6, 0.4])
 
+        batch = module.process_batch(
+            valence, arousal, indptr, indices, strengths, consensus_strength=0.9
+        )
+
+        for i in range(len(valence)):
+            row = slice(indptr[i], indptr[i + 1])
+            state = {
+                "agent": {"emotion": {"valence": valence[i], "arousal": arousal[i]}},
+                "social": {
+                    "neighbors": [
+                        {
+                            "id": int(j),
+                            "emotion": {"valence": valence[j], "arousal": arousal[j]},
+                        }
+                        for j in indices[row]
+                    ],
+                    "connection_strengths": dict(
+                        zip(indices[row].tolist(), strengths[row])
+                    ),
+                    "consensus_strength": 0.9,
+                },
+            }
+            expected = module.process(state)
+
+            received = expected["emotion_received"]
+            assert (
+                batch["valence_received"][i],
+                batch["arousal_received"][i],
+            ) == pytest.approx((received["valence"], received["arousal"]))
+            for field in ("social_pressure", "neighbor_influence", "emotional_alignment"):
+                assert batch[field][i] == pytest.approx(expected[field])
+
+    @pytest.mark.parametrize(
+        "state,expected",
+        [(_HERDING_STATE, True), (_MIXED_ACTIONS_STATE, False)],
+        ids=["unanimous", "mixed"],
+    )
+    def test_herding_detection(self, module, state, expected):
+        """Test herding is detected only when neighbor actions converge."""
         result = module.process(state)
 
-        assert result.get("herding_detected", False) is False
+        assert result["herding_detected"] is expected
 
-    def test_get_state_summary(self):
+    def test_get_state_summary(self, module):
         """Test getting state summary."""
-        module = SocialInteractionModule()
         module._last_social_pressure = 0.7
 
         summary = module.get_state_summary()
 
         assert "pressure" in summary.lower() or "0.7" in summary
 
-    def test_reset(self):
+    def test_reset(self, module):
         """Test resetting module state."""
-        module = SocialInteractionModule()
         module._last_social_pressure = 0.8
         module._last_emotion_received = {"valence": 0.9}
 
         module.reset()
 
-        assert module._last_social_pressure == 0.0
-        assert module._last_emotion_received is None
+        assert (module._last_social_pressure, module._last_emotion_received) == (
+            0.0,
+            None,
+        )
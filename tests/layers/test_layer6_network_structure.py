@@ -1,7 +1,8 @@
 """Tests for Layer 6: Network Structure module."""
 
 import pytest
-from datetime import datetime
+from dataclasses import asdict
+from datetime import datetime, timedelta
 
 from src.layers.layer6_network_structure import (
     NetworkStructureModule,
@@ -9,6 +10,8 @@ from src.layers.layer6_network_structure import (
     PlatformPost,
 )
 
+_FIXED_TS = datetime(2024, 1, 1, 10, 0)
+
 
 class TestPlatformPost:
     """Tests for PlatformPost dataclass."""
@@ -19,7 +22,7 @@ class TestPlatformPost:
             id="post_001",
             author_id=0,
             content="Diamond hands!",
-            timestamp=datetime.now(),
+            timestamp=_FIXED_TS,
             subreddit="wallstreetbets",
         )
         assert post.id == "post_001"
@@ -31,7 +34,7 @@ class TestPlatformPost:
             id="post_001",
             author_id=0,
             content="Test",
-            timestamp=datetime.now(),
+            timestamp=_FIXED_TS,
             upvotes=1000,
             comments=200,
             awards=5,
@@ -39,6 +42,30 @@ class TestPlatformPost:
         score = post.engagement_score
         assert score > 0
 
+    def test_engagement_score_follows_direct_edits(self):
+        """Test the engagement score reflects counters assigned directly."""
+        post = PlatformPost(id="p", author_id=0, content="GME", timestamp=_FIXED_TS)
+        assert post.engagement_score == 0
+
+        post.upvotes = 10
+        post.awards = 1
+
+        assert post.engagement_score == 20
+
+    def test_post_is_slotted(self):
+        """Test that posts carry no per-instance __dict__."""
+        post = PlatformPost(id="post_001", author_id=0, content="GME", timestamp=_FIXED_TS)
+        assert not hasattr(post, "__dict__")
+
+    def test_post_fields_are_public_data_only(self):
+        """Test asdict exposes only the post's data, no internal cache."""
+        post = PlatformPost(id="post_001", author_id=0, content="GME", timestamp=_FIXED_TS)
+
+        assert set(asdict(post)) == {
+            "id", "author_id", "content", "timestamp",
+            "subreddit", "upvotes", "comments", "awards",
+        }
+
 
 class TestRedditPlatform:
     """Tests for RedditPlatform class."""
@@ -69,13 +96,48 @@ class TestRedditPlatform:
             subreddit="wallstreetbets",
         )
 
-        for i in range(150):
-            platform.upvote(post.id, voter_id=i + 1)
+        platform.upvote_bulk(post.id, range(1, 151))
 
         viral_posts = platform.get_viral_posts()
         assert len(viral_posts) == 1
         assert viral_posts[0].id == post.id
 
+    def test_upvote_refreshes_engagement_score(self):
+        """Test that engagement score reflects upvotes added through the platform."""
+        platform = RedditPlatform()
+        post = platform.create_post(author_id=0, content="GME")
+
+        assert post.engagement_score == 0
+        platform.upvote(post.id, voter_id=1)
+
+        assert post.engagement_score == 1
+
+    def test_upvote_bulk_ignores_repeat_voters(self):
+        """Test bulk upvoting counts each voter once, across calls too."""
+        platform = RedditPlatform()
+        post = platform.create_post(author_id=0, content="GME")
+        platform.upvote(post.id, voter_id=1)
+
+        added = platform.upvote_bulk(post.id, [1, 2, 2, 3])
+
+        assert added == 2
+        assert post.upvotes == 3
+        assert post.engagement_score == 3
+        assert platform.upvote_bulk("missing", [1]) == 0
+        assert platform.upvote(post.id, voter_id=3) is False
+        assert platform.upvote(post.id, voter_id=0) is True
+
+    @pytest.mark.parametrize("voter_id", [-1, 0, 2**32, 2**64])
+    def test_upvote_accepts_any_int_voter_id(self, voter_id):
+        """Test voter IDs of any size are tracked, single and in bulk."""
+        platform = RedditPlatform()
+        post = platform.create_post(author_id=0, content="GME")
+
+        assert platform.upvote(post.id, voter_id=voter_id) is True
+        assert platform.upvote(post.id, voter_id=voter_id) is False
+        assert platform.upvote_bulk(post.id, [voter_id, voter_id + 1]) == 1
+        assert post.upvotes == 2
+
     def test_viral_spread_factor(self):
         """Test viral spread factor calculation."""
         platform = RedditPlatform(viral_threshold=100)
@@ -85,8 +147,7 @@ class TestRedditPlatform:
             subreddit="wallstreetbets",
         )
 
-        for i in range(200):
-            platform.upvote(post.id, voter_id=i + 1)
+        platform.upvote_bulk(post.id, range(1, 201))
 
         spread_factor = platform.get_viral_spread_factor(post.id)
         assert spread_factor > 1.0
@@ -101,13 +162,104 @@ class TestRedditPlatform:
                 content=f"Post {i}",
                 subreddit="wallstreetbets",
             )
-            for j in range(i * 100):
-                platform.upvote(post.id, voter_id=j + 100)
+            platform.upvote_bulk(post.id, range(100, 100 + i * 100))
 
         trending = platform.get_trending_posts(limit=3)
         assert len(trending) == 3
         assert trending[0].upvotes >= trending[1].upvotes
 
+    def test_trending_posts_follow_later_upvotes(self):
+        """Test trending order updates as posts gain upvotes."""
+        platform = RedditPlatform()
+        first = platform.create_post(author_id=0, content="First")
+        second = platform.create_post(author_id=1, content="Second")
+        platform.upvote_bulk(first.id, range(10))
+
+        assert platform.get_trending_posts(limit=2) == [first, second]
+
+        platform.upvote_bulk(second.id, range(20))
+
+        assert platform.get_trending_posts(limit=2) == [second, first]
+        assert platform.get_trending_posts(limit=5) == [second, first]
+
+    def test_trending_posts_skip_removed_posts(self):
+        """Test a post deleted from ``posts`` drops out of the trending ranking."""
+        platform = RedditPlatform()
+        kept = platform.create_post(author_id=0, content="Kept")
+        removed = platform.create_post(author_id=1, content="Removed")
+        platform.upvote_bulk(removed.id, range(10))
+
+        del platform.posts[removed.id]
+
+        assert platform.get_trending_posts(limit=2) == [kept]
+        assert platform.get_trending_posts(limit=2) == [kept]
+
+    def test_trending_posts_follow_direct_edits(self):
+        """Test counters edited directly on a post re-rank it immediately."""
+        platform = RedditPlatform(viral_threshold=5)
+        first = platform.create_post(author_id=0, content="First")
+        second = platform.create_post(author_id=1, content="Second")
+        platform.upvote_bulk(first.id, range(1))
+
+        second.awards = 1
+
+        assert platform.get_trending_posts(limit=2) == [second, first]
+        assert platform.get_viral_posts() == []
+
+    def test_posts_added_without_create_post_are_ranked(self):
+        """Test posts placed straight into ``posts`` are ranked and can be upvoted."""
+        platform = RedditPlatform()
+        first = platform.create_post(author_id=0, content="First")
+        post = PlatformPost(
+            id="d", author_id=1, content="GME", timestamp=_FIXED_TS, upvotes=3
+        )
+        platform.posts["d"] = post
+
+        assert platform.get_trending_posts(limit=2) == [post, first]
+        assert platform.upvote("d", 5) is True
+        assert post.upvotes == 4
+
+    def test_viral_posts_follow_direct_edits_and_threshold(self):
+        """Test viral status reflects edited upvotes and a lowered threshold."""
+        platform = RedditPlatform(viral_threshold=100)
+        edited = platform.create_post(author_id=0, content="Edited")
+        modest = platform.create_post(author_id=1, content="Modest")
+        platform.upvote_bulk(modest.id, range(10))
+
+        edited.upvotes = 10**6
+        assert platform.get_viral_posts() == [edited]
+
+        platform.viral_threshold = 10
+        assert platform.get_viral_posts() == [edited, modest]
+        assert len(platform.snapshot_viral()) == 2
+
+    def test_decayed_trending_favors_fresh_posts(self):
+        """Test time-decayed trending ranks a fresh post above an older, bigger one."""
+        platform = RedditPlatform()
+        old = platform.create_post(author_id=0, content="Old", timestamp=_FIXED_TS)
+        fresh = platform.create_post(
+            author_id=1, content="Fresh", timestamp=_FIXED_TS + timedelta(hours=10)
+        )
+        platform.upvote_bulk(old.id, range(100))
+        platform.upvote_bulk(fresh.id, range(30))
+        now = _FIXED_TS + timedelta(hours=11)
+
+        assert platform.get_trending_posts(limit=2) == [old, fresh]
+        assert platform.get_trending_posts(limit=2, now=now) == [fresh, old]
+
+    def test_decayed_trending_refreshes_after_upvotes(self):
+        """Test the cached decayed ranking is dropped when a post is upvoted."""
+        platform = RedditPlatform()
+        first = platform.create_post(author_id=0, content="First", timestamp=_FIXED_TS)
+        second = platform.create_post(author_id=1, content="Second", timestamp=_FIXED_TS)
+        platform.upvote_bulk(first.id, range(10))
+
+        assert platform.get_trending_posts(limit=2, now=_FIXED_TS) == [first, second]
+
+        platform.upvote_bulk(second.id, range(20))
+
+        assert platform.get_trending_posts(limit=2, now=_FIXED_TS) == [second, first]
+
 
 class TestNetworkStructureModule:
     """Tests for NetworkStructureModule class."""
@@ -148,6 +300,44 @@ class TestNetworkStructureModule:
 
         assert result["viral_exposure"] is False
 
+    def test_process_aggregates_viral_posts(self):
+        """Test intensity and sentiment aggregate over all viral posts."""
+        module = NetworkStructureModule()
+
+        state = {
+            "social": {
+                "viral_posts": [
+                    {"id": "p1", "upvotes": 3000, "sentiment": 0.9},
+                    {"id": "p2", "upvotes": 2000, "sentiment": 0.1},
+                    {"id": "p3", "upvotes": 7000},
+                ],
+            },
+        }
+
+        result = module.process(state)
+
+        assert result["virality_intensity"] == 1.0
+        assert result["viral_sentiment"] == pytest.approx(1.0 / 3)
+        assert result["viral_post_count"] == 3
+
+    def test_process_accepts_viral_snapshot(self):
+        """Test a structured viral snapshot gives the same outputs as dicts."""
+        module = NetworkStructureModule()
+        platform = RedditPlatform(viral_threshold=10)
+        for author_id, votes in enumerate([30, 5, 20]):
+            post = platform.create_post(author_id=author_id, content="GME")
+            platform.upvote_bulk(post.id, range(votes))
+
+        snapshot = platform.snapshot_viral()
+        as_dicts = [
+            {"id": post.id, "upvotes": post.upvotes} for post in platform.get_viral_posts()
+        ]
+
+        assert snapshot["upvotes"].tolist() == [30, 20]
+        assert module.process({"social": {"viral_posts": snapshot}}) == module.process(
+            {"social": {"viral_posts": as_dicts}}
+        )
+
     def test_information_cascade_detection(self):
         """Test detection of information cascade."""
         module = NetworkStructureModule()
@@ -181,6 +371,34 @@ class TestNetworkStructureModule:
         concentration = module.calculate_platform_concentration()
         assert concentration > 0
 
+    def test_platform_concentration_tracks_new_posts(self):
+        """Test the cached concentration is refreshed after new posts."""
+        module = NetworkStructureModule()
+        assert module.calculate_platform_concentration() == 0.0
+
+        for author_id in (0, 1, 1, 2):
+            module.platform.create_post(author_id=author_id, content="GME")
+        assert module.calculate_platform_concentration() == 0.5
+
+        module.platform.create_post(author_id=1, content="GME")
+        assert module.calculate_platform_concentration() == 0.6
+
+        module.reset()
+        assert module.calculate_platform_concentration() == 0.0
+
+    def test_platform_concentration_tracks_removed_posts(self):
+        """Test concentration follows posts removed straight from ``posts``."""
+        module = NetworkStructureModule()
+        platform = module.platform
+        first = platform.create_post(author_id=0, content="GME")
+        platform.create_post(author_id=0, content="GME")
+        platform.create_post(author_id=1, content="GME")
+        assert module.calculate_platform_concentration() == pytest.approx(2 / 3)
+
+        del platform.posts[first.id]
+
+        assert module.calculate_platform_concentration() == 0.5
+
     def test_get_state_summary(self):
         """Test getting state summary."""
         module = NetworkStructureModule()
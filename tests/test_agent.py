@@ -27,6 +27,21 @@ class TestAgentState:
         assert "social_proof" in state_dict
 
 
+class TestSocialMediaInfo:
+    """Tests for SocialMediaInfo container."""
+
+    def test_sequences_stored_as_tuples(self):
+        """Test that topic and tweet lists are frozen into tuples."""
+        info = SocialMediaInfo(
+            timestamp=datetime(2024, 1, 1, 10, 0),
+            trending_topics=["$GME", "squeeze"],
+            sample_tweets=["Hold!"],
+            sentiment_score=0.5,
+        )
+
+        assert (info.trending_topics, info.sample_tweets) == (("$GME", "squeeze"), ("Hold!",))
+
+
 class TestAgent:
     """Tests for refactored Agent class."""
 
@@ -109,6 +124,18 @@ class TestAgent:
 
         assert "CHARACTER PROFILE" in prompt or "CONTEXT" in prompt
 
+    def test_prompt_follows_reassigned_persona_and_topic(self, sample_persona):
+        """Test that reassigning persona or market_topic rebuilds the prompt."""
+        agent = Agent(agent_id=0, persona=sample_persona)
+        agent._build_decision_prompt()
+
+        agent.market_topic = "Mars landing odds"
+        agent.persona = {**sample_persona, "name": "Renamed Trader"}
+        prompt = agent._build_decision_prompt()
+
+        assert "Mars landing odds" in prompt
+        assert "Renamed Trader" in prompt
+
     def test_decide_uses_llm(self, sample_persona, mock_llm_interface):
         """Test that decide method uses LLM interface."""
         agent = Agent(agent_id=0, persona=sample_persona)
@@ -147,6 +174,55 @@ class TestAgent:
 
         assert agent.state.neurobiological.fomo_level == 0.0
 
+    def test_observe_batch_matches_sequential_observe(self, sample_persona):
+        """Test that observe_batch equals observing each tick in turn."""
+        ticks = [
+            (
+                MarketInfo(
+                    timestamp=datetime(2024, 1, 1, 10, hour),
+                    stock_price=price,
+                    price_change_pct=change,
+                    volume=1000000,
+                    trend=trend,
+                ),
+                None,
+            )
+            for hour, (price, change, trend) in enumerate(
+                [(50.0, 5.0, "rising"), (80.0, 60.0, "surging"), (40.0, -50.0, "crashing")]
+            )
+        ]
+        batched = Agent(agent_id=0, persona=sample_persona)
+        sequential = Agent(agent_id=0, persona=sample_persona)
+
+        batched.observe_batch(ticks)
+        for market_info, social_info in ticks:
+            sequential.observe(market_info, social_info)
+
+        assert batched.state.to_dict() == sequential.state.to_dict()
+        assert len(batched.memory) == len(ticks)
+
+    def test_reset_state_clears_memory_and_outputs(self, sample_persona):
+        """Test that reset_state returns the agent to its initial state."""
+        agent = Agent(agent_id=0, persona=sample_persona)
+        identity_group = agent.identity_group
+
+        market_info = MarketInfo(
+            timestamp=datetime(2024, 1, 1, 10, 0),
+            stock_price=300.0,
+            price_change_pct=100.0,
+            volume=100000000,
+            trend="surging",
+        )
+        agent.observe(market_info, None)
+
+        agent.reset_state()
+
+        assert agent.memory == []
+        assert agent._last_layer_outputs == {}
+        assert agent._current_timestamp > market_info.timestamp
+        assert agent.state.neurobiological.fomo_level == 0.0
+        assert agent.identity_group == identity_group
+
     def test_personality_affects_identity(self, sample_personas):
         """Test that personality traits affect identity assignment."""
         wsb_persona = sample_personas[0]
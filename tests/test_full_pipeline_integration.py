@@ -9,17 +9,19 @@ import pytest
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
-from src.agent import Agent, MarketInfo, SocialMediaInfo
+from src.agent import MarketInfo, SocialMediaInfo, _build_prompt_parts_cached
 from src.prompt_builder import PromptBuilder
 from src.core.behavior_engine import BehaviorEngine
 
+_TRENDING_TOPICS = ("$GME", "squeeze", "moon")
+_VIRAL_TWEETS = ("VIRAL: Everyone is buying!",) * 10
+
 
 class TestFullPipelineFlow:
     """Test the complete observe -> layers -> prompt -> decide pipeline."""
 
-    def test_market_surge_triggers_fomo_increase(self, sample_persona):
+    def test_market_surge_triggers_fomo_increase(self, agent):
         """Test that a market surge increases FOMO via the layer pipeline."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         initial_fomo = agent.state.neurobiological.fomo_level
         
         market_info = MarketInfo(
@@ -32,7 +34,7 @@ class TestFullPipelineFlow:
         
         social_info = SocialMediaInfo(
             timestamp=datetime(2024, 1, 1, 10, 0),
-            trending_topics=["$GME", "squeeze", "moon"],
+            trending_topics=_TRENDING_TOPICS,
             sample_tweets=["To the moon!", "Diamond hands!"],
             sentiment_score=0.9,
         )
@@ -42,9 +44,8 @@ class TestFullPipelineFlow:
         assert agent.state.neurobiological.fomo_level > initial_fomo
         assert agent._last_layer_outputs.get("fomo_level", 0) > initial_fomo
 
-    def test_market_surge_triggers_arousal_or_fomo(self, sample_persona):
+    def test_market_surge_triggers_arousal_or_fomo(self, agent):
         """Test that a market surge leads to increased arousal or FOMO."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         market_info = MarketInfo(
             timestamp=datetime(2024, 1, 1, 10, 0),
@@ -61,10 +62,8 @@ class TestFullPipelineFlow:
             agent.state.neurobiological.fomo_level > 0.5
         )
 
-    def test_high_fomo_reflected_in_prompt(self, sample_persona):
+    def test_high_fomo_reflected_in_prompt(self, agent):
         """Test that high FOMO state is reflected in the generated prompt."""
-        agent = Agent(agent_id=0, persona=sample_persona)
-        
         agent._last_layer_outputs = {
             "fomo_level": 0.85,
             "stress_level": 0.3,
@@ -78,10 +77,8 @@ class TestFullPipelineFlow:
         assert "FOMO" in prompt
         assert "URGENT" in prompt or "intense" in prompt
 
-    def test_high_stress_reflected_in_prompt(self, sample_persona):
+    def test_high_stress_reflected_in_prompt(self, agent):
         """Test that high stress state is reflected in the generated prompt."""
-        agent = Agent(agent_id=0, persona=sample_persona)
-        
         agent._last_layer_outputs = {
             "fomo_level": 0.3,
             "stress_level": 0.85,
@@ -94,9 +91,8 @@ class TestFullPipelineFlow:
         assert "stress" in prompt.lower()
         assert "caution" in prompt.lower()
 
-    def test_full_pipeline_stimulus_to_decision(self, sample_persona, mock_llm_interface):
+    def test_full_pipeline_stimulus_to_decision(self, agent, mock_llm_interface):
         """Test complete flow from market stimulus to agent decision."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         market_info = MarketInfo(
             timestamp=datetime(2024, 1, 1, 10, 0),
@@ -108,7 +104,7 @@ class TestFullPipelineFlow:
         
         social_info = SocialMediaInfo(
             timestamp=datetime(2024, 1, 1, 10, 0),
-            trending_topics=["$GME", "squeeze"],
+            trending_topics=_TRENDING_TOPICS,
             sample_tweets=["Hold!"],
             sentiment_score=0.9,
         )
@@ -134,22 +130,19 @@ class TestFullPipelineFlow:
 class TestBehaviorEngineIntegration:
     """Test BehaviorEngine integration in Agent."""
 
-    def test_agent_has_behavior_engine(self, sample_persona):
+    def test_agent_has_behavior_engine(self, agent):
         """Test that agent has a BehaviorEngine instance."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         assert hasattr(agent, "behavior_engine")
         assert isinstance(agent.behavior_engine, BehaviorEngine)
 
-    def test_behavior_engine_has_all_layers(self, sample_persona):
+    def test_behavior_engine_has_all_layers(self, agent):
         """Test that BehaviorEngine has all 7 layers registered."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         assert len(agent.behavior_engine.pipeline.layers) == 7
 
-    def test_layer_outputs_stored_after_observe(self, sample_persona):
+    def test_layer_outputs_stored_after_observe(self, agent):
         """Test that layer outputs are stored after observation."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         market_info = MarketInfo(
             timestamp=datetime(2024, 1, 1, 10, 0),
@@ -168,9 +161,8 @@ class TestBehaviorEngineIntegration:
 class TestObserveAutoUpdatesLayers:
     """Test that observe() automatically updates layer states."""
 
-    def test_observe_triggers_layer_update(self, sample_persona):
+    def test_observe_triggers_layer_update(self, agent):
         """Test that observe automatically triggers layer state update."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         initial_fomo = agent.state.neurobiological.fomo_level
         
         market_info = MarketInfo(
@@ -185,9 +177,8 @@ class TestObserveAutoUpdatesLayers:
         
         assert agent.state.neurobiological.fomo_level != initial_fomo or agent._last_layer_outputs
 
-    def test_observe_can_skip_layer_update(self, sample_persona):
+    def test_observe_can_skip_layer_update(self, agent):
         """Test that layer update can be skipped if needed."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         market_info = MarketInfo(
             timestamp=datetime(2024, 1, 1, 10, 0),
@@ -207,9 +198,8 @@ class TestObserveAutoUpdatesLayers:
 class TestPromptBuilderIntegration:
     """Test PromptBuilder integration in Agent."""
 
-    def test_decide_uses_prompt_builder(self, sample_persona, mock_llm_interface):
+    def test_decide_uses_prompt_builder(self, agent, mock_llm_interface):
         """Test that decide() uses PromptBuilder for prompt generation."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         agent._last_layer_outputs = {
             "fomo_level": 0.6,
@@ -226,9 +216,8 @@ class TestPromptBuilderIntegration:
         assert "PSYCHOLOGICAL STATE" in prompt
         assert agent.name in prompt
 
-    def test_prompt_reflects_identity_group(self, sample_persona, mock_llm_interface):
+    def test_prompt_reflects_identity_group(self, agent, mock_llm_interface):
         """Test that prompt includes agent's identity group."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         agent.decide(mock_llm_interface)
         
@@ -237,14 +226,27 @@ class TestPromptBuilderIntegration:
         
         assert agent.identity_group in prompt or "Identity Group" in prompt
 
+    def test_prompt_matches_prompt_builder(self, agent):
+        """Test the precomputed prompt prefix yields the full builder prompt."""
+        agent._last_layer_outputs = {"fomo_level": 0.8, "stress_level": 0.5}
+        
+        builder = PromptBuilder(
+            agent_state=agent._get_agent_state_for_prompt(),
+            layer_outputs=agent._last_layer_outputs,
+        )
+        expected = builder.build_decision_prompt(
+            market_topic=agent.market_topic,
+            recent_context=agent._format_memories(agent._get_recent_memories(5)),
+        )
+        
+        assert agent._build_decision_prompt() == expected
+
 
 class TestLayerOutputsAffectPrompt:
     """Test that different layer outputs produce different prompts."""
 
-    def test_different_fomo_produces_different_prompt(self, sample_persona):
+    def test_different_fomo_produces_different_prompt(self, agent):
         """Test that different FOMO levels produce different prompts."""
-        agent = Agent(agent_id=0, persona=sample_persona)
-        
         agent._last_layer_outputs = {"fomo_level": 0.1}
         low_fomo_prompt = agent._build_decision_prompt()
         
@@ -255,10 +257,8 @@ class TestLayerOutputsAffectPrompt:
         assert "FOMO" in high_fomo_prompt
         assert "URGENT" in high_fomo_prompt
 
-    def test_different_emotions_produce_different_prompts(self, sample_persona):
+    def test_different_emotions_produce_different_prompts(self, agent):
         """Test that different emotions produce different prompts."""
-        agent = Agent(agent_id=0, persona=sample_persona)
-        
         agent._last_layer_outputs = {
             "dominant_emotion": "excitement",
             "emotion_intensity": 0.8,
@@ -275,10 +275,8 @@ class TestLayerOutputsAffectPrompt:
         assert "excited" in excitement_prompt.lower()
         assert "fear" in fear_prompt.lower()
 
-    def test_social_pressure_affects_prompt(self, sample_persona):
+    def test_social_pressure_affects_prompt(self, agent):
         """Test that social pressure affects prompt content."""
-        agent = Agent(agent_id=0, persona=sample_persona)
-        
         agent._last_layer_outputs = {"social_pressure": 0.1}
         low_pressure_prompt = agent._build_decision_prompt()
         
@@ -287,36 +285,74 @@ class TestLayerOutputsAffectPrompt:
         
         assert "social pressure" in high_pressure_prompt.lower()
 
-    def test_herding_affects_prompt(self, sample_persona):
+    def test_herding_affects_prompt(self, agent):
         """Test that herding detection affects prompt content."""
-        agent = Agent(agent_id=0, persona=sample_persona)
-        
         agent._last_layer_outputs = {"herding_detected": True}
         prompt = agent._build_decision_prompt()
         
         assert "herd" in prompt.lower()
 
+    def test_prompt_parts_reused_across_memory_changes(self, agent):
+        """Test the memoized prompt parts survive memory and non-prompt changes."""
+        _build_prompt_parts_cached.cache_clear()
+        agent._last_layer_outputs = {"fomo_level": 0.9, "market": {"trend": "surging"}}
+        first = agent._build_decision_prompt()
+        assert _build_prompt_parts_cached.cache_info().hits == 0
+        
+        agent._last_layer_outputs = {"fomo_level": 0.9, "market": {"trend": "crashing"}}
+        assert agent._build_decision_prompt() == first
+        
+        agent.act("ACTION: TWEET\nCONTENT: Still holding.")
+        after_action = agent._build_decision_prompt()
+        assert after_action != first
+        assert "Still holding" in after_action
+        assert _build_prompt_parts_cached.cache_info().hits == 2
+
+    def test_decide_rebuilds_prompt_after_changes(self, agent, mock_llm_interface):
+        """Test repeated decisions see memory and layer changes in their prompts."""
+        agent._last_layer_outputs = {"fomo_level": 0.9}
+        
+        agent.decide(mock_llm_interface)
+        agent.decide(mock_llm_interface)
+        first, second = (c.args[0] for c in mock_llm_interface.generate.call_args_list)
+        # The first decision's memory changes the recent-context block only.
+        assert second != first
+        assert second.partition("RECENT CONTEXT:")[0] == first.partition("RECENT CONTEXT:")[0]
+        assert second.partition("ACTION TENDENCY:")[2] == first.partition("ACTION TENDENCY:")[2]
+        
+        agent.act("ACTION: TWEET\nCONTENT: Diamond hands forever.")
+        agent.decide(mock_llm_interface)
+        after_action = mock_llm_interface.generate.call_args.args[0]
+        assert "Diamond hands forever" in after_action
+        
+        agent._last_layer_outputs = {"fomo_level": 0.1}
+        agent.decide(mock_llm_interface)
+        assert "URGENT" not in mock_llm_interface.generate.call_args.args[0]
+
 
 class TestEndToEndScenarios:
     """End-to-end scenario tests."""
 
-    def test_bull_market_scenario(self, sample_persona, mock_llm_interface):
+    def test_bull_market_scenario(self, agent, mock_llm_interface):
         """Test agent behavior in a bull market scenario."""
-        agent = Agent(agent_id=0, persona=sample_persona)
-        
-        for price, change, trend in [
-            (50.0, 5.0, "rising"),
-            (75.0, 25.0, "rising"),
-            (120.0, 60.0, "surging"),
-        ]:
-            market_info = MarketInfo(
-                timestamp=datetime(2024, 1, 1, 10, 0),
-                stock_price=price,
-                price_change_pct=change,
-                volume=50000000,
-                trend=trend,
+        
+        agent.observe_batch(
+            (
+                MarketInfo(
+                    timestamp=datetime(2024, 1, 1, 10, 0),
+                    stock_price=price,
+                    price_change_pct=change,
+                    volume=50000000,
+                    trend=trend,
+                ),
+                None,
             )
-            agent.observe(market_info, None)
+            for price, change, trend in [
+                (50.0, 5.0, "rising"),
+                (75.0, 25.0, "rising"),
+                (120.0, 60.0, "surging"),
+            ]
+        )
         
         assert agent.state.neurobiological.fomo_level > 0.3
         
@@ -326,9 +362,8 @@ class TestEndToEndScenarios:
         
         assert "PSYCHOLOGICAL STATE" in prompt
 
-    def test_market_crash_scenario(self, sample_persona, mock_llm_interface):
+    def test_market_crash_scenario(self, agent, mock_llm_interface):
         """Test agent behavior in a market crash scenario."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         market_info = MarketInfo(
             timestamp=datetime(2024, 1, 1, 10, 0),
@@ -346,14 +381,13 @@ class TestEndToEndScenarios:
         
         assert "PSYCHOLOGICAL STATE" in prompt
 
-    def test_viral_post_scenario(self, sample_persona, mock_llm_interface):
+    def test_viral_post_scenario(self, agent, mock_llm_interface):
         """Test agent behavior after viral post exposure."""
-        agent = Agent(agent_id=0, persona=sample_persona)
         
         social_info = SocialMediaInfo(
             timestamp=datetime(2024, 1, 1, 10, 0),
             trending_topics=["$GME", "viral", "squeeze"],
-            sample_tweets=["VIRAL: Everyone is buying!"] * 10,
+            sample_tweets=_VIRAL_TWEETS,
             sentiment_score=0.95,
         )
         
@@ -1,7 +1,8 @@
 """Tests for ABC interfaces and dependency injection."""
 
+import threading
+
 import pytest
-from unittest.mock import MagicMock
 
 from src.interfaces import LLMInterfaceABC, MarketDataProviderABC, UserPoolProviderABC
 from src.llm_interface import LlamaInterface
@@ -10,6 +11,60 @@ from src.socioverse_connector import SocioVerseConnector
 from src.simulation import Simulation
 
 
+class FakeLLM(LLMInterfaceABC):
+    """Fake LLM provider that records prompts and returns a fixed reply."""
+
+    def __init__(self, reply: str = "ACTION: HOLD\nCONTENT: Test") -> None:
+        self.reply = reply
+        self.calls: list[str] = []
+
+    def generate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        stream: bool = False,
+    ) -> str:
+        self.calls.append(prompt)
+        return self.reply
+
+    def health_check(self) -> bool:
+        return True
+
+
+class FakeMarket(MarketDataProviderABC):
+    """Fake market data provider serving fixed events and trends."""
+
+    def __init__(
+        self,
+        events: list[dict] | None = None,
+        trends: dict | None = None,
+    ) -> None:
+        self.events = events or []
+        self.trends = trends or {"topics": [], "summary": ""}
+
+    def get_public_markets(self, limit: int = 20, status: str | None = "open") -> list[dict]:
+        return []
+
+    def get_trending_events(self, limit: int = 20, status: str | None = "open") -> list[dict]:
+        return self.events[:limit]
+
+    def analyze_trends(self, events: list[dict]) -> dict:
+        return self.trends
+
+
+class FakeUserPool(UserPoolProviderABC):
+    """Fake user pool provider that records requested counts."""
+
+    def __init__(self, personas: list[dict]) -> None:
+        self.personas = personas
+        self.calls: list[int] = []
+
+    def fetch_user_pool(self, count: int = 100) -> list[dict]:
+        self.calls.append(count)
+        return self.personas[:count]
+
+
 class TestInterfaceImplementations:
     """Test that concrete classes implement ABCs correctly."""
 
@@ -48,92 +103,111 @@ class TestSimulationDependencyInjection:
 
     def test_inject_llm_provider(self):
         """Test injecting custom LLM provider."""
-        mock_llm = MagicMock(spec=LLMInterfaceABC)
-        mock_llm.generate.return_value = "ACTION: HOLD\nCONTENT: Test"
-        mock_llm.health_check.return_value = True
+        fake_llm = FakeLLM()
         
         sim = Simulation(
             days=1,
             agent_count=1,
             mock_llm=True,
-            llm_provider=mock_llm,
+            llm_provider=fake_llm,
         )
         
-        assert sim.llm is mock_llm
+        assert sim.llm is fake_llm
         
         sim.setup()
-        assert sim.llm is mock_llm
+        assert sim.llm is fake_llm
 
     def test_inject_market_provider(self):
         """Test injecting custom market data provider."""
-        mock_market = MagicMock(spec=MarketDataProviderABC)
-        mock_market.get_trending_events.return_value = [
-            {"title": "Test Event", "event_ticker": "TEST"}
-        ]
-        mock_market.analyze_trends.return_value = {
-            "topics": ["Test Topic"],
-            "summary": "Test summary",
-        }
+        fake_market = FakeMarket(
+            events=[{"title": "Test Event", "event_ticker": "TEST"}],
+            trends={"topics": ["Test Topic"], "summary": "Test summary"},
+        )
         
         sim = Simulation(
             days=1,
             agent_count=1,
             mock_llm=True,
             use_kalshi=True,
-            market_provider=mock_market,
+            market_provider=fake_market,
         )
         
-        assert sim._kalshi_client is mock_market
+        assert sim._kalshi_client is fake_market
 
     def test_inject_user_pool_provider(self):
         """Test injecting custom user pool provider."""
-        mock_user_pool = MagicMock(spec=UserPoolProviderABC)
-        mock_user_pool.fetch_user_pool.return_value = [
-            {"id": 0, "name": "MockUser", "personality_traits": ["test"]}
-        ]
+        fake_user_pool = FakeUserPool(
+            [{"id": 0, "name": "MockUser", "personality_traits": ["test"]}]
+        )
         
         sim = Simulation(
             days=1,
             agent_count=1,
             mock_llm=True,
             use_kalshi=True,
-            user_pool_provider=mock_user_pool,
+            user_pool_provider=fake_user_pool,
         )
         
         personas = sim._try_load_socioverse()
         
-        mock_user_pool.fetch_user_pool.assert_called_once_with(count=1)
+        assert fake_user_pool.calls == [1]
         assert personas[0]["name"] == "MockUser"
 
     def test_inject_all_providers(self):
         """Test injecting all providers together."""
-        mock_llm = MagicMock(spec=LLMInterfaceABC)
-        mock_llm.generate.return_value = "ACTION: HOLD\nCONTENT: Test"
-        mock_llm.health_check.return_value = True
+        fake_llm = FakeLLM()
         
-        mock_market = MagicMock(spec=MarketDataProviderABC)
-        mock_market.get_trending_events.return_value = []
-        mock_market.analyze_trends.return_value = {"topics": [], "summary": ""}
+        fake_market = FakeMarket()
         
-        mock_user_pool = MagicMock(spec=UserPoolProviderABC)
-        mock_user_pool.fetch_user_pool.return_value = [
-            {"id": 0, "name": "User1"},
-            {"id": 1, "name": "User2"},
-        ]
+        fake_user_pool = FakeUserPool(
+            [{"id": 0, "name": "User1"}, {"id": 1, "name": "User2"}]
+        )
         
         sim = Simulation(
             days=1,
             agent_count=2,
             mock_llm=True,
             use_kalshi=True,
-            llm_provider=mock_llm,
-            market_provider=mock_market,
-            user_pool_provider=mock_user_pool,
+            llm_provider=fake_llm,
+            market_provider=fake_market,
+            user_pool_provider=fake_user_pool,
         )
         
-        assert sim.llm is mock_llm
-        assert sim._kalshi_client is mock_market
-        assert sim._user_pool_provider is mock_user_pool
+        assert sim.llm is fake_llm
+        assert sim._kalshi_client is fake_market
+        assert sim._user_pool_provider is fake_user_pool
+
+    def test_setup_overlaps_provider_calls(self):
+        """Test setup fetches market trends while the LLM health check runs."""
+        health_checked = threading.Event()
+
+        class SignallingLLM(FakeLLM):
+            def health_check(self) -> bool:
+                health_checked.set()
+                return True
+
+        class WaitingMarket(FakeMarket):
+            def get_trending_events(self, limit: int = 20, status: str | None = "open") -> list[dict]:
+                self.overlapped = health_checked.wait(timeout=5)
+                return super().get_trending_events(limit, status)
+
+        fake_market = WaitingMarket()
+        fake_user_pool = FakeUserPool([{"id": 0, "name": "User1"}])
+        sim = Simulation(
+            days=1,
+            agent_count=1,
+            mock_llm=True,
+            use_kalshi=True,
+            llm_provider=SignallingLLM(),
+            market_provider=fake_market,
+            user_pool_provider=fake_user_pool,
+        )
+
+        sim.setup()
+
+        assert fake_market.overlapped
+        assert fake_user_pool.calls == [1]
+        assert sim.agents[0].name == "User1"
 
     def test_default_providers_created_when_not_injected(self):
         """Test default providers are created when not injected."""
@@ -171,16 +245,14 @@ class TestMockProviderBehavior:
 
     def test_mock_llm_used_in_agent_decision(self, sample_persona):
         """Test mock LLM is used when agent makes decision."""
-        mock_llm = MagicMock(spec=LLMInterfaceABC)
-        mock_llm.generate.return_value = "ACTION: TWEET\nCONTENT: Test tweet!"
-        mock_llm.health_check.return_value = True
+        fake_llm = FakeLLM("ACTION: TWEET\nCONTENT: Test tweet!")
         
         sim = Simulation(
             days=1,
             agent_count=1,
             mock_llm=True,
             use_kalshi=False,
-            llm_provider=mock_llm,
+            llm_provider=fake_llm,
             custom_agents=[sample_persona],
         )
         sim.setup()
@@ -189,13 +261,12 @@ class TestMockProviderBehavior:
         
         decision = sim.agents[0].decide(sim.llm)
         
-        mock_llm.generate.assert_called()
+        assert fake_llm.calls
         assert "TWEET" in decision or "Test tweet" in decision
 
     def test_mock_user_pool_populates_agents(self):
         """Test mock user pool provider populates agents correctly."""
-        mock_user_pool = MagicMock(spec=UserPoolProviderABC)
-        mock_user_pool.fetch_user_pool.return_value = [
+        fake_user_pool = FakeUserPool([
             {
                 "id": 0,
                 "name": "InjectedUser1",
@@ -212,14 +283,14 @@ class TestMockProviderBehavior:
                 "beliefs": {"risk_tolerance": "high"},
                 "social": {"follower_count": 5000, "influence_score": 0.9},
             },
-        ]
+        ])
         
         sim = Simulation(
             days=1,
             agent_count=2,
             mock_llm=True,
             use_kalshi=True,
-            user_pool_provider=mock_user_pool,
+            user_pool_provider=fake_user_pool,
         )
         sim.setup()
         
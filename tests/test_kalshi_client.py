@@ -1,81 +1,91 @@
 """Unit tests for KalshiClient behavior."""
 
-import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.kalshi import KalshiClient
+from tests.helpers import freeze
 
+# Frozen market rows; each test hands the response its own list of them.
+_EXPECTED_MARKETS = freeze(
+    (
+        {"ticker": "MKT1", "volume_24h": 500},
+        {"ticker": "MKT2", "volume_24h": 300},
+    )
+)
 
-class TestKalshiClientCaching:
-    """Tests for KalshiClient caching behavior."""
 
-    def test_successive_calls_use_cache(self):
-        """Test that rapid successive calls return cached data."""
-        client = KalshiClient()
+@pytest.fixture(scope="module")
+def shared_client():
+    """One KalshiClient (and its Session) shared by this module."""
+    client = KalshiClient()
+    yield client
+    client.session.close()
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "markets": [{"ticker": "TEST", "volume_24h": 100}]
-        }
-        mock_response.raise_for_status = MagicMock()
 
-        with patch.object(client.session, "get", return_value=mock_response) as mock_get:
-            result1 = client.get_public_markets(limit=5, check_exchange_status=False)
-            result2 = client.get_public_markets(limit=5, check_exchange_status=False)
+@pytest.fixture
+def client(shared_client):
+    """The shared client with an empty market cache after each test."""
+    yield shared_client
+    shared_client._market_cache.clear()
 
-            assert mock_get.call_count == 1
-            assert result1 == result2
 
-    def test_different_params_bypass_cache(self):
-        """Test that different parameters create separate cache entries."""
-        client = KalshiClient()
+@pytest.fixture
+def markets_response():
+    """Successful /markets response carrying a single market."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {"markets": [{"ticker": "TEST", "volume_24h": 100}]}
+    return response
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "markets": [{"ticker": "TEST", "volume_24h": 100}]
-        }
-        mock_response.raise_for_status = MagicMock()
 
-        with patch.object(client.session, "get", return_value=mock_response) as mock_get:
-            client.get_public_markets(limit=5, check_exchange_status=False)
-            client.get_public_markets(limit=10, check_exchange_status=False)
+@pytest.fixture(autouse=True)
+def mock_get(client, markets_response):
+    """Patch the shared client's ``session.get`` to return markets_response."""
+    with patch.object(client.session, "get", return_value=markets_response) as mocked:
+        yield mocked
 
-            assert mock_get.call_count == 2
 
-    def test_cache_expires_after_ttl(self):
-        """Test that cache expires after the TTL period."""
-        client = KalshiClient()
-        client._cache_expiry_seconds = 0.1
+class TestKalshiClientCaching:
+    """Tests for KalshiClient caching behavior."""
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "markets": [{"ticker": "TEST", "volume_24h": 100}]
-        }
-        mock_response.raise_for_status = MagicMock()
+    def test_successive_calls_use_cache(self, client, mock_get):
+        """Test that rapid successive calls return cached data."""
+        result1 = client.get_public_markets(limit=5, check_exchange_status=False)
+        result2 = client.get_public_markets(limit=5, check_exchange_status=False)
+
+        assert mock_get.call_count == 1
+        assert result1 == result2
 
-        with patch.object(client.session, "get", return_value=mock_response) as mock_get:
-            client.get_public_markets(limit=5, check_exchange_status=False)
-            time.sleep(0.15)
-            client.get_public_markets(limit=5, check_exchange_status=False)
+    def test_different_params_bypass_cache(self, client, mock_get):
+        """Test that different parameters create separate cache entries."""
+        client.get_public_markets(limit=5, check_exchange_status=False)
+        client.get_public_markets(limit=10, check_exchange_status=False)
 
-            assert mock_get.call_count == 2
+        assert mock_get.call_count == 2
 
-    def test_cache_returns_same_data(self):
-        """Test that cached data is identical to original."""
-        client = KalshiClient()
+    def test_cache_expires_after_ttl(self, client, mock_get, monkeypatch):
+        """Test that cache expires after the TTL period."""
+        fake_now = [1000.0]
+        monkeypatch.setattr("src.kalshi.time.time", lambda: fake_now[0])
+
+        client.get_public_markets(limit=5, check_exchange_status=False)
+        fake_now[0] += client._cache_expiry_seconds - 1
+        client.get_public_markets(limit=5, check_exchange_status=False)
+        assert mock_get.call_count == 1
 
-        expected_markets = [
-            {"ticker": "MKT1", "volume_24h": 500},
-            {"ticker": "MKT2", "volume_24h": 300},
-        ]
+        fake_now[0] += 1.0
+        client.get_public_markets(limit=5, check_exchange_status=False)
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"markets": expected_markets}
-        mock_response.raise_for_status = MagicMock()
+        assert mock_get.call_count == 2
+
+    def test_cache_returns_same_data(self, client, markets_response):
+        """Test that cached data is identical to original."""
+        markets_response.json.return_value = {"markets": list(_EXPECTED_MARKETS)}
 
-        with patch.object(client.session, "get", return_value=mock_response):
-            result1 = client.get_public_markets(limit=5, check_exchange_status=False)
-            result2 = client.get_public_markets(limit=5, check_exchange_status=False)
+        result1 = client.get_public_markets(limit=5, check_exchange_status=False)
+        result2 = client.get_public_markets(limit=5, check_exchange_status=False)
 
-            assert result1 == result2
-            assert result1 == expected_markets[:5]
+        assert result1 == result2
+        assert result1 == list(_EXPECTED_MARKETS[:5])
@@ -14,22 +14,45 @@ import pytest
 from pathlib import Path
 
 from src.kalshi import KalshiClient
+from tests.helpers import freeze
 
 CASSETTES_DIR = Path(__file__).parent / "cassettes"
 RECORD_MODE = "new_episodes" if os.environ.get("KALSHI_VCR_RECORD") else "none"
-
-
-@pytest.fixture
+_EXISTING_CASSETTES = (
+    {path.stem for path in CASSETTES_DIR.glob("*.yaml")} if CASSETTES_DIR.exists() else set()
+)
+
+# Event payloads for the mocked trend analysis tests, frozen because shared.
+_MOCK_EVENTS = freeze([
+    {
+        "title": "Will Bitcoin hit $100k?",
+        "event_ticker": "BITCOIN100K",
+        "series_ticker": "CRYPTO",
+        "markets": [{"title": "Yes", "volume_24h": 10000}],
+    },
+    {
+        "title": "Election 2024 Winner",
+        "event_ticker": "ELECTION2024",
+        "series_ticker": "POLITICS",
+        "markets": [{"title": "Candidate A", "volume_24h": 50000}],
+    },
+])
+
+
+@pytest.fixture(scope="session")
 def kalshi_client():
-    """Create a Kalshi client for testing."""
-    return KalshiClient()
+    """One Kalshi client, and its pooled session, shared by the whole session."""
+    client = KalshiClient()
+    yield client
+    client.session.close()
 
 
 def cassette_exists(name: str) -> bool:
-    """Check if a cassette file exists."""
-    return (CASSETTES_DIR / f"{name}.yaml").exists()
+    """Check if a cassette file existed when this module was imported."""
+    return name in _EXISTING_CASSETTES
 
 
+@pytest.mark.serial
 @pytest.mark.vcr(cassette_library_dir=str(CASSETTES_DIR), record_mode=RECORD_MODE)
 class TestKalshiClientVCR:
     """VCR-recorded tests for KalshiClient.
@@ -38,10 +61,13 @@ class TestKalshiClientVCR:
     and KALSHI_VCR_RECORD is not set, tests will be skipped.
     """
 
-    @pytest.mark.skipif(
-        not cassette_exists("TestKalshiClientVCR.test_get_exchange_status") and RECORD_MODE == "none",
-        reason="Cassette not recorded. Set KALSHI_VCR_RECORD=1 to record."
-    )
+    @pytest.fixture(autouse=True)
+    def _require_cassette(self, request):
+        """Skip unless this test's cassette exists or recording is enabled."""
+        name = f"{request.cls.__name__}.{request.node.name}"
+        if RECORD_MODE == "none" and not cassette_exists(name):
+            pytest.skip(f"Cassette {name} not recorded. Set KALSHI_VCR_RECORD=1 to record.")
+
     def test_get_exchange_status(self, kalshi_client):
         """Test fetching exchange status."""
         status = kalshi_client.get_exchange_status()
@@ -50,10 +76,6 @@ class TestKalshiClientVCR:
             assert isinstance(status, dict)
             assert "exchange_active" in status or "trading_active" in status
 
-    @pytest.mark.skipif(
-        not cassette_exists("TestKalshiClientVCR.test_get_trending_events") and RECORD_MODE == "none",
-        reason="Cassette not recorded. Set KALSHI_VCR_RECORD=1 to record."
-    )
     def test_get_trending_events(self, kalshi_client):
         """Test fetching trending events from Kalshi."""
         events = kalshi_client.get_trending_events(limit=5)
@@ -63,10 +85,6 @@ class TestKalshiClientVCR:
             event = events[0]
             assert "title" in event or "event_ticker" in event
 
-    @pytest.mark.skipif(
-        not cassette_exists("TestKalshiClientVCR.test_get_public_markets") and RECORD_MODE == "none",
-        reason="Cassette not recorded. Set KALSHI_VCR_RECORD=1 to record."
-    )
     def test_get_public_markets(self, kalshi_client):
         """Test fetching public markets."""
         markets = kalshi_client.get_public_markets(limit=5)
@@ -76,10 +94,6 @@ class TestKalshiClientVCR:
             market = markets[0]
             assert "ticker" in market or "title" in market
 
-    @pytest.mark.skipif(
-        not cassette_exists("TestKalshiClientVCR.test_analyze_trends") and RECORD_MODE == "none",
-        reason="Cassette not recorded. Set KALSHI_VCR_RECORD=1 to record."
-    )
     def test_analyze_trends(self, kalshi_client):
         """Test trend analysis from events."""
         events = kalshi_client.get_trending_events(limit=5)
@@ -90,10 +104,6 @@ class TestKalshiClientVCR:
         assert "summary" in analysis
         assert isinstance(analysis["topics"], list)
 
-    @pytest.mark.skipif(
-        not cassette_exists("TestKalshiClientVCR.test_summarize_event") and RECORD_MODE == "none",
-        reason="Cassette not recorded. Set KALSHI_VCR_RECORD=1 to record."
-    )
     def test_summarize_event(self, kalshi_client):
         """Test event summarization."""
         events = kalshi_client.get_trending_events(limit=1)
@@ -125,26 +135,7 @@ class TestKalshiClientMocked:
 
     def test_analyze_trends_with_mock_events(self, kalshi_client):
         """Test trend analysis with mock event data."""
-        mock_events = [
-            {
-                "title": "Will Bitcoin hit $100k?",
-                "event_ticker": "BITCOIN100K",
-                "series_ticker": "CRYPTO",
-                "markets": [
-                    {"title": "Yes", "volume_24h": 10000}
-                ],
-            },
-            {
-                "title": "Election 2024 Winner",
-                "event_ticker": "ELECTION2024",
-                "series_ticker": "POLITICS",
-                "markets": [
-                    {"title": "Candidate A", "volume_24h": 50000}
-                ],
-            },
-        ]
-        
-        analysis = kalshi_client.analyze_trends(mock_events)
+        analysis = kalshi_client.analyze_trends(_MOCK_EVENTS)
         
         assert len(analysis["topics"]) >= 2
         assert "summary" in analysis
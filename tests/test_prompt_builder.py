@@ -1,8 +1,19 @@
 """Tests for PromptBuilder module."""
 
 import pytest
+from types import MappingProxyType
+
 from src.prompt_builder import PromptBuilder
 
+# Agent state (a mapping proxy) for tests that only vary layer outputs.
+_BASE_STATE = MappingProxyType({"name": "Test"})
+
+
+@pytest.fixture
+def make_builder():
+    """Factory building a PromptBuilder on the base state from layer outputs."""
+    return lambda **layer_outputs: PromptBuilder(_BASE_STATE, layer_outputs)
+
 
 class TestPromptBuilderInitialization:
     """Tests for PromptBuilder initialization."""
@@ -28,189 +39,106 @@ class TestPromptBuilderInitialization:
 class TestFomoContext:
     """Tests for FOMO context generation."""
 
-    def test_high_fomo_generates_urgent_context(self):
-        """Test high FOMO (>0.7) generates urgent language."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"fomo_level": 0.85}
-        )
-        
-        context = builder._get_fomo_context()
-        
-        assert context is not None
-        assert "URGENT" in context
-        assert "intense FOMO" in context
-        assert "0.8" in context  # Rounded value
-
-    def test_moderate_fomo_generates_moderate_context(self):
-        """Test moderate FOMO (0.4-0.7) generates appropriate language."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"fomo_level": 0.55}
-        )
-        
-        context = builder._get_fomo_context()
-        
-        assert context is not None
-        assert "moderate fear of missing out" in context
-        assert "URGENT" not in context
-
-    def test_low_fomo_returns_none(self):
-        """Test low FOMO (<0.4) returns None."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"fomo_level": 0.2}
-        )
+    @pytest.mark.parametrize(
+        "fomo_level,expected,unexpected",
+        [
+            (0.85, ("URGENT", "intense FOMO", "0.8"), ()),
+            (0.55, ("moderate fear of missing out",), ("URGENT",)),
+            (0.2, None, ()),
+        ],
+        ids=["high_is_urgent", "moderate", "low_returns_none"],
+    )
+    def test_fomo_context(self, make_builder, fomo_level, expected, unexpected):
+        """Test FOMO context wording at each intensity band."""
+        builder = make_builder(fomo_level=fomo_level)
         
         context = builder._get_fomo_context()
         
-        assert context is None
+        if expected is None:
+            assert context is None
+        else:
+            assert all(phrase in context for phrase in expected)
+            assert not any(phrase in context for phrase in unexpected)
 
 
 class TestStressContext:
     """Tests for stress context generation."""
 
-    def test_high_stress_generates_pressure_context(self):
-        """Test high stress (>0.7) generates pressure language."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"stress_level": 0.85}
-        )
-        
-        context = builder._get_stress_context()
-        
-        assert context is not None
-        assert "highly stressed" in context
-        assert "heart is racing" in context
-
-    def test_moderate_stress_generates_tension_context(self):
-        """Test moderate stress generates tension language."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"stress_level": 0.55}
-        )
+    @pytest.mark.parametrize(
+        "stress_level,expected",
+        [
+            (0.85, ("highly stressed", "heart is racing")),
+            (0.55, ("tension",)),
+            (0.2, None),
+        ],
+        ids=["high_is_pressure", "moderate_is_tension", "low_returns_none"],
+    )
+    def test_stress_context(self, make_builder, stress_level, expected):
+        """Test stress context wording at each intensity band."""
+        builder = make_builder(stress_level=stress_level)
         
         context = builder._get_stress_context()
         
-        assert context is not None
-        assert "tension" in context
-
-    def test_low_stress_returns_none(self):
-        """Test low stress returns None."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"stress_level": 0.2}
-        )
-        
-        context = builder._get_stress_context()
-        
-        assert context is None
+        if expected is None:
+            assert context is None
+        else:
+            assert all(phrase in context for phrase in expected)
 
 
 class TestEmotionContext:
     """Tests for emotion context generation."""
 
-    def test_excitement_emotion_context(self):
-        """Test excitement emotion generates appropriate context."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={
-                "dominant_emotion": "excitement",
-                "emotion_intensity": 0.8,
-                "arousal": 0.75,
-            }
-        )
+    @pytest.mark.parametrize(
+        "layer_outputs,expected",
+        [
+            (
+                {"dominant_emotion": "excitement", "emotion_intensity": 0.8, "arousal": 0.75},
+                ("excited and energized", "very intense", "ready to act"),
+            ),
+            (
+                {"dominant_emotion": "fear", "emotion_intensity": 0.6},
+                ("fearful and anxious",),
+            ),
+            ({"dominant_emotion": "neutral"}, None),
+        ],
+        ids=["excitement", "fear", "neutral_returns_none"],
+    )
+    def test_emotion_context(self, make_builder, layer_outputs, expected):
+        """Test emotion context wording for each dominant emotion."""
+        builder = make_builder(**layer_outputs)
         
         context = builder._get_emotion_context()
         
-        assert context is not None
-        assert "excited and energized" in context
-        assert "very intense" in context
-        assert "ready to act" in context
-
-    def test_fear_emotion_context(self):
-        """Test fear emotion generates appropriate context."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={
-                "dominant_emotion": "fear",
-                "emotion_intensity": 0.6,
-            }
-        )
-        
-        context = builder._get_emotion_context()
-        
-        assert context is not None
-        assert "fearful and anxious" in context
-
-    def test_neutral_emotion_returns_none(self):
-        """Test neutral emotion returns None."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"dominant_emotion": "neutral"}
-        )
-        
-        context = builder._get_emotion_context()
-        
-        assert context is None
+        if expected is None:
+            assert context is None
+        else:
+            assert all(phrase in context for phrase in expected)
 
 
 class TestSocialContext:
     """Tests for social context generation."""
 
-    def test_high_social_pressure_context(self):
-        """Test high social pressure generates context."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"social_pressure": 0.7}
-        )
-        
-        context = builder._get_social_context()
-        
-        assert context is not None
-        assert "social pressure" in context
-
-    def test_herding_detected_context(self):
-        """Test herding detection generates context."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"herding_detected": True}
-        )
-        
-        context = builder._get_social_context()
-        
-        assert context is not None
-        assert "herd" in context
-
-    def test_viral_exposure_context(self):
-        """Test viral exposure generates context."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"viral_exposure": True}
-        )
-        
-        context = builder._get_social_context()
-        
-        assert context is not None
-        assert "viral" in context
-
-    def test_combined_social_factors(self):
-        """Test multiple social factors combine in context."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={
-                "social_pressure": 0.7,
-                "herding_detected": True,
-                "viral_exposure": True,
-            }
-        )
+    @pytest.mark.parametrize(
+        "layer_outputs,expected",
+        [
+            ({"social_pressure": 0.7}, ("social pressure",)),
+            ({"herding_detected": True}, ("herd",)),
+            ({"viral_exposure": True}, ("viral",)),
+            (
+                {"social_pressure": 0.7, "herding_detected": True, "viral_exposure": True},
+                ("social pressure", "herd", "viral"),
+            ),
+        ],
+        ids=["social_pressure", "herding", "viral_exposure", "combined"],
+    )
+    def test_social_context(self, make_builder, layer_outputs, expected):
+        """Test each social factor, alone and combined, appears in context."""
+        builder = make_builder(**layer_outputs)
         
         context = builder._get_social_context()
         
         assert context is not None
-        assert "social pressure" in context
-        assert "herd" in context
-        assert "viral" in context
+        assert all(phrase in context for phrase in expected)
 
 
 class TestIdentityContext:
@@ -256,29 +184,22 @@ class TestIdentityContext:
 class TestCognitiveContext:
     """Tests for cognitive bias context generation."""
 
-    def test_high_social_proof_context(self):
-        """Test high social proof generates context."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"social_proof": 0.8}
-        )
+    @pytest.mark.parametrize(
+        "layer_outputs,expected",
+        [
+            ({"social_proof": 0.8}, "social proof"),
+            ({"loss_aversion": 0.85}, "loss-averse"),
+        ],
+        ids=["social_proof", "loss_aversion"],
+    )
+    def test_cognitive_context(self, make_builder, layer_outputs, expected):
+        """Test strong cognitive biases generate context."""
+        builder = make_builder(**layer_outputs)
         
         context = builder._get_cognitive_context()
         
         assert context is not None
-        assert "social proof" in context
-
-    def test_high_loss_aversion_context(self):
-        """Test high loss aversion generates context."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"loss_aversion": 0.85}
-        )
-        
-        context = builder._get_cognitive_context()
-        
-        assert context is not None
-        assert "loss-averse" in context
+        assert expected in context
 
 
 class TestBuildDecisionPrompt:
@@ -312,50 +233,50 @@ class TestBuildDecisionPrompt:
         assert "ACTION:" in prompt
         assert "TWEET/HOLD/LURK" in prompt
 
-    def test_prompt_with_no_significant_state(self):
-        """Test prompt when no significant psychological state."""
-        agent_state = {"name": "CalmTrader"}
-        layer_outputs = {
-            "fomo_level": 0.1,
-            "stress_level": 0.1,
-            "dominant_emotion": "neutral",
-        }
+    def test_prompt_parts_surround_recent_context(self, make_builder):
+        """Test the decision prompt is its parts joined around the context."""
+        builder = make_builder(fomo_level=0.85, arousal=0.8)
         
-        builder = PromptBuilder(agent_state, layer_outputs)
-        prompt = builder.build_decision_prompt()
+        head, tail = builder.build_decision_prompt_parts(market_topic="Bitcoin ETF")
+        prompt = builder.build_decision_prompt(
+            market_topic="Bitcoin ETF",
+            recent_context="Market up 10% today",
+        )
         
-        assert "calm and analytical" in prompt
+        assert prompt == head + "Market up 10% today" + tail
+        assert "Market up" not in head + tail
 
-    def test_prompt_action_guidance_high_fomo(self):
-        """Test action guidance with high FOMO and arousal."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={
-                "fomo_level": 0.85,
-                "arousal": 0.8,
-            }
+    def test_prompt_with_no_significant_state(self, make_builder):
+        """Test prompt when no significant psychological state."""
+        builder = make_builder(
+            fomo_level=0.1,
+            stress_level=0.1,
+            dominant_emotion="neutral",
         )
         
-        guidance = builder._build_action_guidance()
+        prompt = builder.build_decision_prompt()
         
-        assert "strong urge to engage" in guidance
+        assert "calm and analytical" in prompt
 
-    def test_prompt_action_guidance_high_stress(self):
-        """Test action guidance with high stress."""
-        builder = PromptBuilder(
-            agent_state={"name": "Test"},
-            layer_outputs={"stress_level": 0.85}
-        )
-        
-        guidance = builder._build_action_guidance()
+    @pytest.mark.parametrize(
+        "layer_outputs,expected",
+        [
+            ({"fomo_level": 0.85, "arousal": 0.8}, "strong urge to engage"),
+            ({"stress_level": 0.85}, "caution"),
+        ],
+        ids=["high_fomo", "high_stress"],
+    )
+    def test_prompt_action_guidance(self, make_builder, layer_outputs, expected):
+        """Test action guidance for high FOMO/arousal and for high stress."""
+        guidance = make_builder(**layer_outputs)._build_action_guidance()
         
-        assert "caution" in guidance
+        assert expected in guidance
 
 
 class TestGetStateSummary:
     """Tests for state summary utility."""
 
-    def test_get_state_summary(self):
+    def test_get_state_summary(self, make_builder):
         """Test getting state summary."""
         layer_outputs = {
             "fomo_level": 0.7,
@@ -367,16 +288,16 @@ class TestGetStateSummary:
             "viral_exposure": False,
         }
         
-        builder = PromptBuilder(agent_state={}, layer_outputs=layer_outputs)
+        builder = make_builder(**layer_outputs)
         summary = builder.get_state_summary()
         
         assert summary["fomo_level"] == 0.7
         assert summary["dominant_emotion"] == "excitement"
         assert summary["herding_detected"] is True
 
-    def test_get_state_summary_defaults(self):
+    def test_get_state_summary_defaults(self, make_builder):
         """Test state summary with missing values uses defaults."""
-        builder = PromptBuilder(agent_state={}, layer_outputs={})
+        builder = make_builder()
         summary = builder.get_state_summary()
         
         assert summary["fomo_level"] == 0.0
@@ -6,6 +6,18 @@ from pydantic import ValidationError
 from src import server
 from src.config import STEPS_PER_DAY
 
+def _agent(**overrides):
+    """Build a fresh raw agent payload, nested values included, with overrides."""
+    return {
+        "id": 0,
+        "name": "Agent",
+        "personality_traits": ["analytical"],
+        "interests": ["markets"],
+        "beliefs": {"risk_tolerance": "moderate"},
+        "social": {"follower_count": 100, "influence_score": 0.1},
+        **overrides,
+    }
+
 
 class DummySimulation:
     """Minimal simulation-like object for server state tests."""
@@ -25,13 +37,18 @@ class DummySimulation:
         ]
 
 
-def test_get_state_uses_steps_per_day_constant(monkeypatch):
-    """State endpoint should compute totals and day using STEPS_PER_DAY."""
+@pytest.fixture
+def patched_state(monkeypatch):
+    """Fresh SimulationState installed as ``server.state`` for one test."""
     local_state = server.SimulationState()
-    local_state.simulation = DummySimulation(days=2, current_step=STEPS_PER_DAY + 3)
-    local_state.is_running = True
-
     monkeypatch.setattr(server, "state", local_state)
+    return local_state
+
+
+def test_get_state_uses_steps_per_day_constant(patched_state):
+    """State endpoint should compute totals and day using STEPS_PER_DAY."""
+    patched_state.simulation = DummySimulation(days=2, current_step=STEPS_PER_DAY + 3)
+    patched_state.is_running = True
 
     status = server.get_state()
 
@@ -40,12 +57,9 @@ def test_get_state_uses_steps_per_day_constant(monkeypatch):
     assert status.current_step == STEPS_PER_DAY + 3
 
 
-def test_get_state_without_simulation_returns_defaults(monkeypatch):
+def test_get_state_without_simulation_returns_defaults(patched_state):
     """State endpoint should return safe defaults when simulation is absent."""
-    local_state = server.SimulationState()
-    local_state.error = "boom"
-
-    monkeypatch.setattr(server, "state", local_state)
+    patched_state.error = "boom"
 
     status = server.get_state()
 
@@ -58,16 +72,7 @@ def test_get_state_without_simulation_returns_defaults(monkeypatch):
 
 def test_validate_agent_personas_coerces_numeric_name():
     """Agent payloads with numeric names should not fail validation."""
-    raw_agents = [
-        {
-            "id": 0,
-            "name": 237236420,
-            "personality_traits": ["analytical"],
-            "interests": ["markets"],
-            "beliefs": {"risk_tolerance": "moderate"},
-            "social": {"follower_count": 100, "influence_score": 0.1},
-        }
-    ]
+    raw_agents = [_agent(name=237236420)]
 
     personas = server._validate_agent_personas(raw_agents)
 
@@ -87,13 +92,7 @@ def test_validate_agent_personas_fills_blank_name():
 def test_validate_agent_personas_drops_restricted_content_fields():
     """Agent payloads should not include raw social text fields."""
     raw_agents = [
-        {
-            "id": 1,
-            "name": "AgentX",
-            "tweet_text": "raw content",
-            "posts": ["x", "y"],
-            "personality_traits": ["calm"],
-        }
+        _agent(id=1, name="AgentX", tweet_text="raw content", posts=["x", "y"])
     ]
 
     personas = server._validate_agent_personas(raw_agents)
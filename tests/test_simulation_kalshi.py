@@ -1,23 +1,26 @@
 """Tests for Simulation Kalshi integration."""
 
 import pytest
-from unittest.mock import MagicMock, patch
 
 from src.simulation import Simulation
+from tests.helpers import build_simulation, stub_market_provider
+
+pytestmark = pytest.mark.usefixtures("offline_kalshi_client")
 
 
 class TestSimulationKalshi:
     """Tests for Kalshi integration in Simulation."""
 
-    def test_init_without_kalshi(self):
+    def test_init_without_kalshi(self, sim_mock_no_kalshi):
         """Test initialization without Kalshi."""
-        sim = Simulation(days=1, agent_count=3, mock_llm=True, use_kalshi=False)
-        assert sim._kalshi_client is None
-        assert sim.use_kalshi is False
+        assert sim_mock_no_kalshi._kalshi_client is None
+        assert sim_mock_no_kalshi.use_kalshi is False
 
-    def test_init_with_kalshi(self):
-        """Test initialization with Kalshi enabled."""
+    def test_init_with_kalshi(self, offline_kalshi_client):
+        """Test initialization with Kalshi enabled builds a client."""
+        offline_kalshi_client.reset_mock()
         sim = Simulation(days=1, agent_count=3, mock_llm=True, use_kalshi=True)
+        offline_kalshi_client.assert_called_once_with()
         assert sim._kalshi_client is not None
         assert sim.use_kalshi is True
 
@@ -31,29 +34,22 @@ class TestSimulationKalshi:
         sim = Simulation(days=1, agent_count=3, mock_llm=True)
         assert sim.use_kalshi is False
 
-    @patch("src.simulation.KalshiClient")
-    def test_setup_loads_kalshi_trends(self, mock_kalshi_class):
+    def test_setup_loads_kalshi_trends(self):
         """Test that setup loads Kalshi trends when enabled."""
-        mock_client = MagicMock()
-        mock_client.get_trending_events.return_value = [
-            {"title": "Test Event", "event_ticker": "TEST"}
-        ]
-        mock_client.analyze_trends.return_value = {
-            "topics": ["Test Topic"],
-            "summary": "Test summary",
-        }
-        mock_kalshi_class.return_value = mock_client
+        mock_client = stub_market_provider(
+            get_trending_events=[{"title": "Test Event", "event_ticker": "TEST"}],
+            analyze_trends={"topics": ["Test Topic"], "summary": "Test summary"},
+        )
         
-        sim = Simulation(days=1, agent_count=3, mock_llm=True, use_kalshi=True)
-        sim._kalshi_client = mock_client
+        sim = build_simulation(agent_count=3, use_kalshi=True, market_provider=mock_client)
         sim.setup()
         
         mock_client.get_trending_events.assert_called_once()
         mock_client.analyze_trends.assert_called_once()
 
-    def test_get_social_info_uses_kalshi_topics(self):
+    def test_get_social_info_uses_kalshi_topics(self, sim_mock_kalshi_3agents):
         """Test that _get_social_info uses Kalshi topics when available."""
-        sim = Simulation(days=1, agent_count=3, mock_llm=True, use_kalshi=True)
+        sim = sim_mock_kalshi_3agents
         sim._kalshi_analysis = {
             "topics": ["Kalshi Topic 1", "Kalshi Topic 2", "Kalshi Topic 3"],
             "summary": "Real market data",
@@ -64,41 +60,63 @@ class TestSimulationKalshi:
         assert "Kalshi Topic 1" in social_info.trending_topics
         assert "Kalshi Topic 2" in social_info.trending_topics
 
-    def test_get_social_info_falls_back_to_gme(self):
+    def test_get_social_info_falls_back_to_gme(self, sim_mock_no_kalshi):
         """Test that _get_social_info falls back to GME when no Kalshi data."""
-        sim = Simulation(days=1, agent_count=3, mock_llm=True, use_kalshi=False)
-        
-        social_info = sim._get_social_info()
+        social_info = sim_mock_no_kalshi._get_social_info()
         
         assert "$GME" in social_info.trending_topics
         assert "GameStop" in social_info.trending_topics
 
-    def test_get_social_info_empty_kalshi_falls_back(self):
+    def test_get_social_info_empty_kalshi_falls_back(self, sim_mock_kalshi_3agents):
         """Test fallback when Kalshi analysis is empty."""
-        sim = Simulation(days=1, agent_count=3, mock_llm=True, use_kalshi=True)
+        sim = sim_mock_kalshi_3agents
         sim._kalshi_analysis = {"topics": [], "summary": ""}
         
         social_info = sim._get_social_info()
         
         assert "$GME" in social_info.trending_topics
 
-    @patch("src.simulation.KalshiClient")
-    def test_load_kalshi_trends_handles_errors(self, mock_kalshi_class):
+    def test_load_kalshi_trends_handles_errors(self, sim_mock_kalshi_3agents):
         """Test that _load_kalshi_trends handles API errors."""
-        mock_client = MagicMock()
+        mock_client = stub_market_provider()
         mock_client.get_trending_events.side_effect = Exception("API Error")
-        mock_kalshi_class.return_value = mock_client
         
-        sim = Simulation(days=1, agent_count=3, mock_llm=True, use_kalshi=True)
+        sim = sim_mock_kalshi_3agents
         sim._kalshi_client = mock_client
+        sim._kalshi_analysis = {"topics": ["stale"]}
         
         sim._load_kalshi_trends()
         
         assert sim._kalshi_analysis is None
 
-    def test_full_simulation_with_kalshi_mock(self):
+    def test_single_step_with_kalshi_mock(self):
+        """Test one simulation step runs on mocked Kalshi data."""
+        topics = ["Bitcoin Price", "Election Odds", "Fed Rate"]
+        provider = stub_market_provider(
+            analyze_trends={"topics": topics, "summary": "Test market summary"}
+        )
+        sim = build_simulation(agent_count=3, use_kalshi=True, market_provider=provider)
+        
+        sim.setup()
+        sim._execute_step(0)
+        
+        assert len(sim.simulation_log) > 0
+        snapshots = [entry["metadata"]["market_snapshot"] for entry in sim.simulation_log]
+        assert all(snapshot == snapshots[0] for snapshot in snapshots)
+        assert len({id(snapshot) for snapshot in snapshots}) == len(snapshots)
+        assert sim._get_social_info().trending_topics[:3] == tuple(topics)
+        assert "Bitcoin Price" in "\n".join(sim.seed_tweets)
+
+    @pytest.mark.slow
+    def test_full_simulation_with_kalshi_mock(self, tmp_path):
         """Test running a full simulation with mocked Kalshi data."""
-        sim = Simulation(days=1, agent_count=3, mock_llm=True, use_kalshi=True)
+        sim = Simulation(
+            days=1,
+            agent_count=3,
+            mock_llm=True,
+            use_kalshi=True,
+            output_log_file=tmp_path / "simulation_log.json",
+        )
         
         sim._kalshi_analysis = {
             "topics": ["Bitcoin Price", "Election Odds", "Fed Rate"],
@@ -3,105 +3,91 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
-from src.simulation import Simulation
 from src.interfaces import MarketDataProviderABC
+from src.simulation import Simulation
+from tests.helpers import build_simulation
 
 
-class TestSimulationPersonaLoading:
-    """Tests for persona loading priority chain."""
+class _TickerLookupProvider(MarketDataProviderABC):
+    """Mock spec: a provider with the optional ``get_market`` Simulation probes for."""
 
-    def test_priority_1_custom_agents(self):
-        """Test that custom_agents has highest priority."""
-        custom = [
-            {"id": 0, "name": "CustomAgent1"},
-            {"id": 1, "name": "CustomAgent2"},
-        ]
-        
-        sim = Simulation(
-            days=1,
-            agent_count=2,
-            mock_llm=True,
-            use_kalshi=True,
-            custom_agents=custom,
-        )
-        
-        personas = sim._load_personas()
-        
-        assert len(personas) == 2
-        assert personas[0]["name"] == "CustomAgent1"
+    def get_market(self, ticker: str) -> dict | None:
+        ...
 
-    @patch("src.simulation.Simulation._try_load_socioverse")
-    def test_priority_2_socioverse(self, mock_socioverse):
-        """Test that SocioVerse is tried when use_kalshi is True."""
-        mock_personas = [{"id": 0, "name": "SV_User_0"}]
-        mock_socioverse.return_value = mock_personas
-        
-        sim = Simulation(
-            days=1,
-            agent_count=1,
-            mock_llm=True,
-            use_kalshi=True,
-        )
-        
-        personas = sim._load_personas()
-        
-        mock_socioverse.assert_called_once()
-        assert personas[0]["name"] == "SV_User_0"
 
-    @patch("src.simulation.Simulation._try_load_socioverse")
-    @patch("src.simulation.Simulation._try_generate_from_kalshi")
-    def test_priority_3_kalshi_generation(self, mock_kalshi_gen, mock_socioverse):
-        """Test Kalshi generation when SocioVerse fails."""
-        mock_socioverse.return_value = None
-        mock_kalshi_gen.return_value = [{"id": 0, "name": "KalshiAgent"}]
-        
-        sim = Simulation(
-            days=1,
-            agent_count=1,
-            mock_llm=True,
-            use_kalshi=True,
-        )
-        sim._kalshi_analysis = {"summary": "Test trends"}
-        
-        personas = sim._load_personas()
-        
-        mock_kalshi_gen.assert_called_once()
-        assert personas[0]["name"] == "KalshiAgent"
+class TestSimulationPersonaLoading:
+    """Tests for persona loading priority chain."""
 
-    @patch("src.simulation.Simulation._try_load_socioverse")
-    def test_priority_4_default_generation(self, mock_socioverse):
-        """Test default persona generation when live sources fail.
+    @pytest.mark.parametrize(
+        "custom,socioverse,kalshi_generated,kalshi_analysis,expected_name,expected_count",
+        [
+            (
+                [{"id": 0, "name": "CustomAgent1"}, {"id": 1, "name": "CustomAgent2"}],
+                None,
+                None,
+                None,
+                "CustomAgent1",
+                2,
+            ),
+            (None, [{"id": 0, "name": "SV_User_0"}], None, None, "SV_User_0", 1),
+            (
+                None,
+                None,
+                [{"id": 0, "name": "KalshiAgent"}],
+                {"summary": "Test trends"},
+                "KalshiAgent",
+                1,
+            ),
+            (None, None, None, None, "User_", 1),
+        ],
+        ids=[
+            "priority_1_custom_agents",
+            "priority_2_socioverse",
+            "priority_3_kalshi_generation",
+            "priority_4_default_generation",
+        ],
+    )
+    def test_persona_priority(
+        self,
+        sim_mock_kalshi,
+        mocker,
+        custom,
+        socioverse,
+        kalshi_generated,
+        kalshi_analysis,
+        expected_name,
+        expected_count,
+    ):
+        """Test custom > SocioVerse > Kalshi generation > defaults.
         
         Note: Static file loading has been deprecated. The simulation now
         falls back to generated defaults when live sources are unavailable.
         """
-        mock_socioverse.return_value = None
-        
-        sim = Simulation(
-            days=1,
-            agent_count=1,
-            mock_llm=True,
-            use_kalshi=True,
+        sim = sim_mock_kalshi
+        sim.custom_agents = custom or []
+        sim._kalshi_analysis = kalshi_analysis
+        load_socioverse = mocker.patch.object(
+            sim, "_try_load_socioverse", return_value=socioverse
+        )
+        generate = mocker.patch.object(
+            sim, "_try_generate_from_kalshi", return_value=kalshi_generated
         )
-        sim._kalshi_analysis = None
         
         personas = sim._load_personas()
         
-        assert len(personas) == 1
-        assert "name" in personas[0]
-        assert personas[0]["name"].startswith("User_")
+        assert len(personas) == expected_count
+        assert personas[0]["name"].startswith(expected_name)
+        assert load_socioverse.call_count == (0 if custom else 1)
+        assert generate.call_count == (1 if kalshi_analysis else 0)
 
     @patch("src.simulation.Simulation._try_load_socioverse")
-    def test_default_generation_respects_agent_count(self, mock_socioverse):
+    def test_default_generation_respects_agent_count(
+        self, mock_socioverse, sim_mock_kalshi_3agents
+    ):
         """Test default persona generation as last resort."""
         mock_socioverse.return_value = None
         
-        sim = Simulation(
-            days=1,
-            agent_count=3,
-            mock_llm=True,
-            use_kalshi=True,
-        )
+        sim = sim_mock_kalshi_3agents
         sim._kalshi_analysis = None
         sim.persona_file = MagicMock()
         sim.persona_file.exists.return_value = False
@@ -111,14 +97,9 @@ class TestSimulationPersonaLoading:
         assert len(personas) == 3
         assert all("name" in p for p in personas)
 
-    def test_socioverse_not_tried_when_use_kalshi_false(self):
+    def test_socioverse_not_tried_when_use_kalshi_false(self, sim_mock_no_kalshi):
         """Test SocioVerse is skipped when use_kalshi is False."""
-        sim = Simulation(
-            days=1,
-            agent_count=1,
-            mock_llm=True,
-            use_kalshi=False,
-        )
+        sim = sim_mock_no_kalshi
         sim.persona_file = MagicMock()
         sim.persona_file.exists.return_value = False
         
@@ -130,14 +111,9 @@ class TestSimulationPersonaLoading:
 class TestSimulationSeedTweets:
     """Tests for dynamic seed tweet generation."""
 
-    def test_dynamic_content_from_kalshi(self):
+    def test_dynamic_content_from_kalshi(self, sim_mock_kalshi):
         """Test dynamic content is generated from Kalshi topics."""
-        sim = Simulation(
-            days=1,
-            agent_count=1,
-            mock_llm=True,
-            use_kalshi=True,
-        )
+        sim = sim_mock_kalshi
         sim._kalshi_analysis = {
             "topics": ["Bitcoin Price", "Election Odds"],
             "summary": "Test",
@@ -148,61 +124,60 @@ class TestSimulationSeedTweets:
         tweets = sim._load_seed_tweets()
         
         assert len(tweets) > 0
-        assert any("Bitcoin Price" in t for t in tweets)
-        assert any("Election Odds" in t for t in tweets)
+        blob = "\n".join(tweets)
+        assert "Bitcoin Price" in blob
+        assert "Election Odds" in blob
 
-    def test_kalshi_content_uses_templates(self):
+    def test_kalshi_content_uses_templates(self, sim_mock_no_kalshi):
         """Test Kalshi content uses various templates."""
-        sim = Simulation(days=1, agent_count=1, mock_llm=True)
-        
         topics = ["Test Topic"]
-        content = sim._generate_kalshi_based_content(topics)
+        content = sim_mock_no_kalshi._generate_kalshi_based_content(topics)
         
         assert len(content) == 10
-        assert any("What do you think" in c for c in content)
-        assert any("bullish" in c for c in content)
+        blob = "\n".join(content)
+        assert "What do you think" in blob
+        assert "bullish" in blob
+
+    def test_kalshi_content_is_cached_per_topics(self, sim_mock_no_kalshi):
+        """Test repeated topics reuse the expanded strings but not the list."""
+        topics = ["Cached Topic", "Other Topic"]
+        
+        first = sim_mock_no_kalshi._generate_kalshi_based_content(topics)
+        second = sim_mock_no_kalshi._generate_kalshi_based_content(list(topics))
+        
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
 
-    def test_fallback_to_generated_when_no_kalshi(self):
+    def test_fallback_to_generated_when_no_kalshi(self, sim_mock_no_kalshi):
         """Test falls back to generated content when Kalshi unavailable.
         
         Note: Static file loading has been deprecated. The simulation now
         generates sample content when live sources are unavailable.
         """
-        sim = Simulation(
-            days=1,
-            agent_count=1,
-            mock_llm=True,
-            use_kalshi=False,
-        )
-        
-        tweets = sim._load_seed_tweets()
+        tweets = sim_mock_no_kalshi._load_seed_tweets()
         
         assert len(tweets) > 0
-        assert any("GME" in t for t in tweets)
+        assert "GME" in "\n".join(tweets)
 
-    def test_fallback_to_generated_when_no_file(self):
+    def test_fallback_to_generated_when_no_file(self, sim_mock_no_kalshi):
         """Test falls back to generated when no file."""
-        sim = Simulation(
-            days=1,
-            agent_count=1,
-            mock_llm=True,
-            use_kalshi=False,
-        )
+        sim = sim_mock_no_kalshi
         sim.tweets_file = MagicMock()
         sim.tweets_file.exists.return_value = False
         
         tweets = sim._load_seed_tweets()
         
         assert len(tweets) > 0
-        assert any("GME" in t for t in tweets)
+        assert "GME" in "\n".join(tweets)
 
 
 class TestTryLoadSocioverse:
     """Tests for _try_load_socioverse method."""
 
-    def test_returns_personas_on_success(self):
+    def test_returns_personas_on_success(self, sim_mock_no_kalshi):
         """Test returns personas when SocioVerse fetch succeeds."""
-        sim = Simulation(days=1, agent_count=1, mock_llm=True)
+        sim = sim_mock_no_kalshi
         
         with patch("src.socioverse_connector.SocioVerseConnector") as mock_class:
             mock_connector = MagicMock()
@@ -213,9 +188,9 @@ class TestTryLoadSocioverse:
         
         assert result == [{"name": "SV_User"}]
 
-    def test_returns_none_on_empty(self):
+    def test_returns_none_on_empty(self, sim_mock_no_kalshi):
         """Test returns None when SocioVerse returns empty."""
-        sim = Simulation(days=1, agent_count=1, mock_llm=True)
+        sim = sim_mock_no_kalshi
         
         with patch("src.socioverse_connector.SocioVerseConnector") as mock_class:
             mock_connector = MagicMock()
@@ -226,9 +201,9 @@ class TestTryLoadSocioverse:
         
         assert result is None
 
-    def test_returns_none_on_exception(self):
+    def test_returns_none_on_exception(self, sim_mock_no_kalshi):
         """Test returns None when exception occurs."""
-        sim = Simulation(days=1, agent_count=1, mock_llm=True)
+        sim = sim_mock_no_kalshi
         
         with patch("src.socioverse_connector.SocioVerseConnector") as mock_class:
             mock_class.side_effect = Exception("Connection failed")
@@ -241,22 +216,14 @@ class TestTryLoadSocioverse:
 class TestUpdateMarketStateLive:
     """Tests for live market state updates via Kalshi API."""
 
-    def test_update_market_state_calls_kalshi_when_live(self):
+    def test_update_market_state_calls_kalshi_when_live(self, market_provider_factory):
         """Test that _update_market_state calls Kalshi API when use_kalshi is True."""
-        mock_client = MagicMock(spec=MarketDataProviderABC)
-        mock_client.get_public_markets.return_value = [
-            {"ticker": "TEST-MKT", "yes_price": 0.55, "volume_24h": 12345}
-        ]
-        mock_client.get_trending_events.return_value = []
-        mock_client.analyze_trends.return_value = {"topics": [], "summary": ""}
+        mock_client = market_provider_factory(
+            get_public_markets=[{"ticker": "TEST-MKT", "yes_price": 0.55, "volume_24h": 12345}]
+        )
         
-        sim = Simulation(
-            agent_count=1,
-            days=1,
-            mock_llm=True,
-            use_kalshi=True,
-            market_provider=mock_client,
-            market_topic="TEST-MKT",
+        sim = build_simulation(
+            use_kalshi=True, market_provider=mock_client, market_topic="TEST-MKT"
         )
         sim.setup()
         
@@ -265,22 +232,14 @@ class TestUpdateMarketStateLive:
         mock_client.get_public_markets.assert_called()
         assert sim._current_price == pytest.approx(55.0)
 
-    def test_update_market_state_updates_price_history(self):
+    def test_update_market_state_updates_price_history(self, market_provider_factory):
         """Test that live updates append to price history."""
-        mock_client = MagicMock(spec=MarketDataProviderABC)
-        mock_client.get_public_markets.return_value = [
-            {"ticker": "TEST-MKT", "yes_price": 0.65, "volume_24h": 5000}
-        ]
-        mock_client.get_trending_events.return_value = []
-        mock_client.analyze_trends.return_value = {"topics": [], "summary": ""}
+        mock_client = market_provider_factory(
+            get_public_markets=[{"ticker": "TEST-MKT", "yes_price": 0.65, "volume_24h": 5000}]
+        )
         
-        sim = Simulation(
-            agent_count=1,
-            days=1,
-            mock_llm=True,
-            use_kalshi=True,
-            market_provider=mock_client,
-            market_topic="TEST-MKT",
+        sim = build_simulation(
+            use_kalshi=True, market_provider=mock_client, market_topic="TEST-MKT"
         )
         sim.setup()
         initial_history_len = len(sim._price_history)
@@ -290,22 +249,14 @@ class TestUpdateMarketStateLive:
         assert len(sim._price_history) == initial_history_len + 1
         assert sim._price_history[-1] == pytest.approx(65.0)
 
-    def test_update_market_state_falls_back_when_market_not_found(self):
+    def test_update_market_state_falls_back_when_market_not_found(self, market_provider_factory):
         """Test fallback to formula when target market not in response."""
-        mock_client = MagicMock(spec=MarketDataProviderABC)
-        mock_client.get_public_markets.return_value = [
-            {"ticker": "OTHER-MKT", "yes_price": 0.80, "volume_24h": 1000}
-        ]
-        mock_client.get_trending_events.return_value = []
-        mock_client.analyze_trends.return_value = {"topics": [], "summary": ""}
+        mock_client = market_provider_factory(
+            get_public_markets=[{"ticker": "OTHER-MKT", "yes_price": 0.80, "volume_24h": 1000}]
+        )
         
-        sim = Simulation(
-            agent_count=1,
-            days=1,
-            mock_llm=True,
-            use_kalshi=True,
-            market_provider=mock_client,
-            market_topic="TEST-MKT",
+        sim = build_simulation(
+            use_kalshi=True, market_provider=mock_client, market_topic="TEST-MKT"
         )
         sim.setup()
         initial_price = sim._current_price
@@ -315,25 +266,22 @@ class TestUpdateMarketStateLive:
         assert sim._current_price != 80.0
         assert sim._current_price != initial_price
 
-    def test_update_market_state_matches_market_title(self):
+    def test_update_market_state_matches_market_title(self, market_provider_factory):
         """Test human-readable topic can match market title from list."""
-        mock_client = MagicMock()
-        mock_client.get_public_markets.return_value = [
-            {
-                "ticker": "TV-PRISONBREAK",
-                "title": "When will Prison Break return?",
-                "yes_price": 0.42,
-                "volume_24h": 1000,
-            }
-        ]
-        mock_client.get_trending_events.return_value = []
-        mock_client.analyze_trends.return_value = {"topics": [], "summary": ""}
-        mock_client.get_market.return_value = None
-
-        sim = Simulation(
-            agent_count=1,
-            days=1,
-            mock_llm=True,
+        mock_client = market_provider_factory(
+            spec=_TickerLookupProvider,
+            get_public_markets=[
+                {
+                    "ticker": "TV-PRISONBREAK",
+                    "title": "When will Prison Break return?",
+                    "yes_price": 0.42,
+                    "volume_24h": 1000,
+                }
+            ],
+            get_market=None,
+        )
+
+        sim = build_simulation(
             use_kalshi=True,
             market_provider=mock_client,
             market_topic="When will Prison Break return?",
@@ -345,20 +293,17 @@ class TestUpdateMarketStateLive:
         assert sim._current_price == pytest.approx(42.0)
         mock_client.get_market.assert_not_called()
 
-    def test_update_market_state_skips_direct_fetch_for_non_ticker_topic(self):
+    def test_update_market_state_skips_direct_fetch_for_non_ticker_topic(
+        self, market_provider_factory
+    ):
         """Test non-ticker topics do not trigger direct get_market API calls."""
-        mock_client = MagicMock()
-        mock_client.get_public_markets.return_value = [
-            {"ticker": "OTHER-MKT", "yes_price": 0.80, "volume_24h": 1000}
-        ]
-        mock_client.get_trending_events.return_value = []
-        mock_client.analyze_trends.return_value = {"topics": [], "summary": ""}
-        mock_client.get_market.return_value = None
-
-        sim = Simulation(
-            agent_count=1,
-            days=1,
-            mock_llm=True,
+        mock_client = market_provider_factory(
+            spec=_TickerLookupProvider,
+            get_public_markets=[{"ticker": "OTHER-MKT", "yes_price": 0.80, "volume_24h": 1000}],
+            get_market=None,
+        )
+
+        sim = build_simulation(
             use_kalshi=True,
             market_provider=mock_client,
             market_topic="When will Prison Break return?",
@@ -369,20 +314,12 @@ class TestUpdateMarketStateLive:
 
         mock_client.get_market.assert_not_called()
 
-    def test_update_market_state_falls_back_on_empty_response(self):
+    def test_update_market_state_falls_back_on_empty_response(self, market_provider_factory):
         """Test fallback to formula when API returns empty list."""
-        mock_client = MagicMock(spec=MarketDataProviderABC)
-        mock_client.get_public_markets.return_value = []
-        mock_client.get_trending_events.return_value = []
-        mock_client.analyze_trends.return_value = {"topics": [], "summary": ""}
-        
-        sim = Simulation(
-            agent_count=1,
-            days=1,
-            mock_llm=True,
-            use_kalshi=True,
-            market_provider=mock_client,
-            market_topic="TEST-MKT",
+        mock_client = market_provider_factory()
+        
+        sim = build_simulation(
+            use_kalshi=True, market_provider=mock_client, market_topic="TEST-MKT"
         )
         sim.setup()
         initial_price = sim._current_price
@@ -391,14 +328,62 @@ class TestUpdateMarketStateLive:
         
         assert sim._current_price != initial_price
 
+    def test_update_market_state_reuses_markets_within_refresh_window(
+        self, market_provider_factory
+    ):
+        """Test the market list is fetched once per refresh window."""
+        mock_client = market_provider_factory(
+            get_public_markets=[{"ticker": "TEST-MKT", "yes_price": 0.55, "volume_24h": 12345}]
+        )
+        
+        sim = build_simulation(
+            use_kalshi=True, market_provider=mock_client, market_topic="TEST-MKT"
+        )
+        window = Simulation.MARKET_REFRESH_STEPS
+        
+        for step in range(window):
+            sim._update_market_state(step=step)
+        
+        assert mock_client.get_public_markets.call_count == 1
+        assert sim._price_history[-window:] == [pytest.approx(55.0)] * window
+        
+        mock_client.get_public_markets.return_value = [
+            {"ticker": "TEST-MKT", "yes_price": 0.60, "volume_24h": 12345}
+        ]
+        sim._update_market_state(step=window)
+        
+        assert mock_client.get_public_markets.call_count == 2
+        assert sim._current_price == pytest.approx(60.0)
+
+    def test_update_market_state_lags_provider_within_refresh_window(
+        self, market_provider_factory
+    ):
+        """Test prices published mid-window are only picked up at the next fetch."""
+        mock_client = market_provider_factory(
+            get_public_markets=[{"ticker": "TEST-MKT", "yes_price": 0.55, "volume_24h": 12345}]
+        )
+        
+        sim = build_simulation(
+            use_kalshi=True, market_provider=mock_client, market_topic="TEST-MKT"
+        )
+        window = Simulation.MARKET_REFRESH_STEPS
+        
+        sim._update_market_state(step=0)
+        mock_client.get_public_markets.return_value = [
+            {"ticker": "TEST-MKT", "yes_price": 0.70, "volume_24h": 12345}
+        ]
+        
+        for step in range(1, window):
+            sim._update_market_state(step=step)
+            assert sim._current_price == pytest.approx(55.0)
+        
+        sim._update_market_state(step=window)
+        
+        assert sim._current_price == pytest.approx(70.0)
+
     def test_update_market_state_uses_formula_when_kalshi_disabled(self):
         """Test that formula is used when use_kalshi is False."""
-        sim = Simulation(
-            agent_count=1,
-            days=1,
-            mock_llm=True,
-            use_kalshi=False,
-        )
+        sim = build_simulation(use_kalshi=False)
         sim.setup()
         initial_price = sim._current_price
         
@@ -411,9 +396,9 @@ class TestUpdateMarketStateLive:
 class TestTryGenerateFromKalshi:
     """Tests for _try_generate_from_kalshi method."""
 
-    def test_generates_personas_from_trends(self):
+    def test_generates_personas_from_trends(self, sim_mock_no_kalshi):
         """Test generates personas from Kalshi trends."""
-        sim = Simulation(days=1, agent_count=1, mock_llm=True)
+        sim = sim_mock_no_kalshi
         sim._kalshi_analysis = {"summary": "Bitcoin trends"}
         sim.llm = MagicMock()
         
@@ -426,18 +411,18 @@ class TestTryGenerateFromKalshi:
         
         assert result == [{"name": "GeneratedAgent"}]
 
-    def test_returns_none_when_no_summary(self):
+    def test_returns_none_when_no_summary(self, sim_mock_no_kalshi):
         """Test returns None when no trend summary."""
-        sim = Simulation(days=1, agent_count=1, mock_llm=True)
+        sim = sim_mock_no_kalshi
         sim._kalshi_analysis = {"topics": ["test"]}
         
         result = sim._try_generate_from_kalshi()
         
         assert result is None
 
-    def test_returns_none_when_no_kalshi_analysis(self):
+    def test_returns_none_when_no_kalshi_analysis(self, sim_mock_no_kalshi):
         """Test returns None when kalshi_analysis is None."""
-        sim = Simulation(days=1, agent_count=1, mock_llm=True)
+        sim = sim_mock_no_kalshi
         sim._kalshi_analysis = None
         
         result = sim._try_generate_from_kalshi()